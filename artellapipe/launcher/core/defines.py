@@ -31,6 +31,20 @@ ARTELLA_CONFIG_LAUNCHER_VERSION = 'version'
 # Defines the name of the attribute that defines the Artella Plugins section
 ARTELLA_CONFIG_LAUNCHER_PLUGINS = 'plugins'
 
+# Defines the name of the attribute that defines whether or not a module map is used to import modules located in
+# the paths registered by Artella launcher
+ARTELLA_CONFIG_LAUNCHER_MODULE_MAP = 'module_map'
+
+# Defines the name of the file used to store the modules imported from the paths registered by Artella launcher
+ARTELLA_LAUNCHER_IMPORT_PROFILE_FILE_NAME = 'import_profile.json'
+
+# Defines environment variable that stores the path of the import profile file that DCCs launched by Artella launcher
+# should update when they are closed
+ARTELLA_LAUNCHER_IMPORT_PROFILE_ENV = 'ARTELLA_LAUNCHER_IMPORT_PROFILE'
+
+# Defines environment variable that stores the paths registered by Artella launcher (separated by os.pathsep)
+ARTELLA_LAUNCHER_IMPORT_PROFILE_PATHS_ENV = 'ARTELLA_LAUNCHER_IMPORT_PROFILE_PATHS'
+
 # Defines the name of the attribute that defines the Artella updater version
 ARTELLA_CONFIG_UPDATER_VERSION = 'UPDATER_VERSION'
 
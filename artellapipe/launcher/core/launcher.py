@@ -27,6 +27,7 @@ from tpDcc.libs.qt.widgets import tabs, stack
 from artellapipe.widgets import window
 from artellapipe.utils import exceptions
 from artellapipe.launcher.core import defines, plugin as core_plugin
+from artellapipe.launcher.utils import importpath
 from artellapipe.launcher.widgets import waitconnection, pluginspanel
 from artellapipe.libs.artella.core import artellalib
 
@@ -182,6 +183,8 @@ class ArtellaLauncher(window.ArtellaWindow, object):
         Function that initializes Artella launcher
         """
 
+        self._setup_paths_to_register()
+
         plugin_paths = self._get_plugin_paths()
         self._plugin_manager = core_plugin.PluginManager(plugin_paths=plugin_paths)
         loaded_plugins = self._plugin_manager.get_plugins()
@@ -258,6 +261,14 @@ class ArtellaLauncher(window.ArtellaWindow, object):
         self._version = self._config.data.get(defines.ARTELLA_CONFIG_LAUNCHER_VERSION, defines.DEFAULT_VERSION)
         self._plugins = self._config.data.get(defines.ARTELLA_CONFIG_LAUNCHER_PLUGINS, list())
 
+    def get_import_profile_path(self):
+        """
+        Returns path where import profile of the paths registered by Artella launcher is stored
+        :return: str
+        """
+
+        return os.path.join(self.get_data_path(), defines.ARTELLA_LAUNCHER_IMPORT_PROFILE_FILE_NAME)
+
     def get_clean_name(self):
         """
         Returns a cleaned version of the launcher name (without spaces and in lowercase)
@@ -362,6 +373,20 @@ class ArtellaLauncher(window.ArtellaWindow, object):
 
         self._console.hide() if self._console.isVisible() else self._console.show()
 
+    def _setup_paths_to_register(self):
+        """
+        Internal function that removes duplicated and non existent paths to register and sorts them taking into
+        account the modules that DCCs imported from them in previous sessions
+        """
+
+        profile = importpath.load_import_profile(self.get_import_profile_path())
+        self._paths_to_register = importpath.compact_paths(self._paths_to_register, profile=profile)
+        if self._paths_to_register:
+            importpath.set_import_profile_environment(self._paths_to_register, self.get_import_profile_path())
+
+        if self._config.data.get(defines.ARTELLA_CONFIG_LAUNCHER_MODULE_MAP, False):
+            importpath.install_module_map(self._paths_to_register)
+
     def _on_close(self):
         """
         Internal callback function that is called when launcher window is closed
@@ -423,4 +448,7 @@ def run(project, install_path, paths_to_register=None, tag=None, dev=False):
                               paths_to_register=paths_to_register, tag=tag, dev=dev)
         win.show()
 
+        from artellapipe.launcher import loader
+        loader.start_sentry()
+
         return win
@@ -27,6 +27,21 @@ from tpDcc.libs.qt.core import base
 
 LOGGER = logging.getLogger('artellapipe-launcher')
 
+try:
+    execfile
+except NameError:
+    def execfile(file_path, globals_dict=None, locals_dict=None):
+        """
+        Python 3 implementation of Python 2 execfile built-in function
+        :param file_path: str
+        :param globals_dict: dict
+        :param locals_dict: dict
+        """
+
+        with open(file_path, 'rb') as source_file:
+            code = compile(source_file.read(), file_path, 'exec')
+        exec(code, globals_dict, locals_dict)
+
 
 class ArtellaLauncherPlugin(base.BaseWidget, object):
 
@@ -13,24 +13,37 @@ __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
 import os
+import sys
+import atexit
 import logging.config
+import threading
+import importlib
 
 import tpDcc as tp
 
 # =================================================================================
 
 PACKAGE = 'artellapipe.launcher'
+SENTRY_DSN = 'https://c329025c8d5a4e978dd7a4117ab6281d@sentry.io/1770788'
 
 # =================================================================================
 
+_SENTRY_PENDING = False
+_LOGGING_CONFIGURED = False
+_LOG_LISTENER = None
+_LOG_QUEUE_HANDLER = None
 
-def init(dev=False):
+
+def init(dev=False, lazy=False):
     """
     Initializes module
     :param dev: bool, Whether artellapipe-launcher is initialized in dev mode or not
+    :param lazy: bool, Whether artellapipe-launcher submodules are imported on first access and Sentry initialization
+        is deferred until start_sentry is called. Lazy import is only supported in Python 3.7 or higher
     """
 
-    from tpDcc.libs.python import importer
+    global _SENTRY_PENDING
+
     from artellapipe.launcher import register
 
     if dev:
@@ -41,39 +54,178 @@ def init(dev=False):
     register.register_class('logger', logger)
 
     if not dev:
-        import sentry_sdk
-        try:
-            sentry_sdk.init("https://c329025c8d5a4e978dd7a4117ab6281d@sentry.io/1770788")
-        except RuntimeError:
-            sentry_sdk.init("https://c329025c8d5a4e978dd7a4117ab6281d@sentry.io/1770788", default_integrations=False)
-
-    skip_modules = ['{}.{}'.format(PACKAGE, name) for name in ['loader']]
-    importer.init_importer(package=PACKAGE, skip_modules=skip_modules)
+        if lazy:
+            _SENTRY_PENDING = True
+        else:
+            init_sentry()
+
+    if lazy and sys.version_info[:2] >= (3, 7):
+        enable_lazy_import(PACKAGE)
+    else:
+        from tpDcc.libs.python import importer
+        skip_modules = ['{}.{}'.format(PACKAGE, name) for name in ['loader']]
+        importer.init_importer(package=PACKAGE, skip_modules=skip_modules)
 
     register_resources()
 
 
+def init_sentry():
+    """
+    Initializes Sentry error reporting
+    """
+
+    import sentry_sdk
+    try:
+        sentry_sdk.init(SENTRY_DSN)
+    except RuntimeError:
+        sentry_sdk.init(SENTRY_DSN, default_integrations=False)
+
+
+def start_sentry():
+    """
+    Initializes Sentry in a background thread if its initialization was deferred by a lazy init
+    :return: threading.Thread or None
+    """
+
+    global _SENTRY_PENDING
+
+    if not _SENTRY_PENDING:
+        return None
+    _SENTRY_PENDING = False
+
+    sentry_thread = threading.Thread(target=init_sentry, name='ArtellaSentryInit')
+    sentry_thread.daemon = True
+    sentry_thread.start()
+
+    return sentry_thread
+
+
+def enable_lazy_import(package_name):
+    """
+    Makes submodules of given package to be imported the first time they are accessed as package attributes.
+    Accessed subpackages are also loaded lazily. Uses module level __getattr__ (PEP 562)
+    :param package_name: str
+    :return: module
+    """
+
+    package = importlib.import_module(package_name)
+    if '__getattr__' in package.__dict__:
+        return package
+
+    def __getattr__(name):
+        from importlib import util
+
+        module_name = '{}.{}'.format(package_name, name)
+        if name.startswith('__') or util.find_spec(module_name) is None:
+            raise AttributeError('module "{}" has no attribute "{}"'.format(package_name, name))
+        module = importlib.import_module(module_name)
+        if hasattr(module, '__path__'):
+            enable_lazy_import(module_name)
+
+        return module
+
+    package.__getattr__ = __getattr__
+
+    return package
+
+
 def create_logger(dev=False):
     """
     Returns logger of current module
+    Logging configuration is only parsed the first time this function is called. File handlers are moved to a
+    background thread, so logging calls never block on disk writes
     """
 
-    logger_directory = os.path.normpath(os.path.join(os.path.expanduser('~'), 'artellapipe', 'logs'))
-    if not os.path.isdir(logger_directory):
-        os.makedirs(logger_directory)
+    global _LOGGING_CONFIGURED, _LOG_LISTENER
 
-    logging_config = os.path.normpath(os.path.join(os.path.dirname(__file__), '__logging__.ini'))
-
-    logging.config.fileConfig(logging_config, disable_existing_loggers=False)
     logger = logging.getLogger('artellapipe-launcher')
+
+    if not _LOGGING_CONFIGURED:
+        logger_directory = os.path.normpath(os.path.join(os.path.expanduser('~'), 'artellapipe', 'logs'))
+        if not os.path.isdir(logger_directory):
+            os.makedirs(logger_directory)
+
+        logging_config = os.path.normpath(os.path.join(os.path.dirname(__file__), '__logging__.ini'))
+
+        logging.config.fileConfig(logging_config, disable_existing_loggers=False)
+        _LOG_LISTENER = _setup_log_queue(logger)
+        _LOGGING_CONFIGURED = True
+
     if dev:
         logger.setLevel(logging.DEBUG)
-        for handler in logger.handlers:
+        handlers = list(logger.handlers)
+        if _LOG_LISTENER:
+            handlers.extend(_LOG_LISTENER.handlers)
+        for handler in handlers:
             handler.setLevel(logging.DEBUG)
 
     return logger
 
 
+def _setup_log_queue(logger):
+    """
+    Internal function that replaces file handlers of the given logger with a queue handler whose records are written
+    by a listener running in a background thread. Only supported in Python 3
+    :param logger: logging.Logger
+    :return: logging.handlers.QueueListener or None
+    """
+
+    global _LOG_QUEUE_HANDLER
+
+    try:
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+    except ImportError:
+        return None
+
+    class _ThreadQueueHandler(QueueHandler):
+        def prepare(self, record):
+            # Records never leave the process, so they are queued untouched and file handlers formatters (JSON
+            # formatter) receive the original message arguments and exception info
+            return record
+
+    file_handlers = [handler for handler in logger.handlers if isinstance(handler, logging.FileHandler)]
+    if not file_handlers:
+        return None
+
+    log_queue = queue.Queue(-1)
+    queue_handler = _ThreadQueueHandler(log_queue)
+    queue_handler.setLevel(min(handler.level for handler in file_handlers))
+    for handler in file_handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+    listener.start()
+    _LOG_QUEUE_HANDLER = queue_handler
+
+    # Pending records are flushed when the application exits
+    atexit.register(stop_logger)
+
+    return listener
+
+
+def stop_logger():
+    """
+    Stops background logging thread, writing all pending log records. File handlers are attached to the logger
+    again, so records logged after this function is called are written directly
+    """
+
+    global _LOG_LISTENER, _LOG_QUEUE_HANDLER
+
+    if not _LOG_LISTENER:
+        return
+
+    logger = logging.getLogger('artellapipe-launcher')
+    if _LOG_QUEUE_HANDLER:
+        logger.removeHandler(_LOG_QUEUE_HANDLER)
+    for handler in _LOG_LISTENER.handlers:
+        logger.addHandler(handler)
+    _LOG_LISTENER.stop()
+    _LOG_LISTENER = None
+    _LOG_QUEUE_HANDLER = None
+
+
 def register_resources():
     """
     Registers artellapipe-launcher resources
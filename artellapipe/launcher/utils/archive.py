@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the archive extraction engine shared by Artella Launcher and Artella Updater.
+It only depends on the standard library, so it can be bundled next to the updater app.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import time
+import stat
+import shutil
+import zipfile
+import tarfile
+import tempfile
+import contextlib
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+
+def get_safe_archive_path(member_name, destination):
+    """
+    Returns the path where given archive member should be extracted, making sure it is located inside destination
+    :param member_name: str
+    :param destination: str
+    :return: str
+    :raises ValueError: if the member is absolute or points outside destination (path traversal)
+    """
+
+    destination = os.path.realpath(destination)
+    member_path = os.path.realpath(os.path.join(destination, member_name))
+    if os.path.isabs(member_name) or os.path.splitdrive(member_name)[0] or (
+            member_path != destination and not member_path.startswith(destination + os.sep)):
+        raise ValueError('Unsafe path found in archive: "{}"'.format(member_name))
+
+    return member_path
+
+
+def replace_file(source, target):
+    """
+    Atomically moves source file into target path, overriding it if it already exists
+    :param source: str
+    :param target: str
+    """
+
+    if hasattr(os, 'replace'):
+        os.replace(source, target)
+    else:
+        if os.path.isfile(target):
+            os.remove(target)
+        os.rename(source, target)
+
+
+def write_archive_member(source, target_path, chunk_size=1024 * 1024):
+    """
+    Writes the contents of given file object into a temporary file and moves it to its final location once the
+    contents are fully written
+    :param source: file
+    :param target_path: str
+    :return: str
+    """
+
+    target_dir = os.path.dirname(target_path)
+    if not os.path.isdir(target_dir):
+        try:
+            os.makedirs(target_dir)
+        except OSError:
+            if not os.path.isdir(target_dir):
+                raise
+
+    fd, temp_path = tempfile.mkstemp(dir=target_dir, prefix='.', suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as target_file:
+            shutil.copyfileobj(source, target_file, chunk_size)
+        replace_file(temp_path, target_path)
+    except Exception:
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return target_path
+
+
+def extract_tar_members(tar_ref, destination, keep_metadata=False):
+    """
+    Extracts the members of a tar file one by one, so it also works with streamed tar files.
+    Links and special files are skipped
+    :param tar_ref: tarfile.TarFile
+    :param destination: str
+    :param keep_metadata: bool, whether symbolic links are created and file permissions are restored
+    :return: generator(str), extracted member names
+    """
+
+    for member in tar_ref:
+        target_path = get_safe_archive_path(member.name, destination)
+        if member.isdir():
+            if not os.path.isdir(target_path):
+                os.makedirs(target_path)
+        elif member.isfile():
+            member_file = tar_ref.extractfile(member)
+            try:
+                write_archive_member(member_file, target_path)
+            finally:
+                member_file.close()
+            if keep_metadata:
+                os.chmod(target_path, member.mode & 0o755 | stat.S_IRUSR | stat.S_IWUSR)
+        elif member.issym() and keep_metadata and hasattr(os, 'symlink'):
+            # Link targets are not checked, members are never written through links (see get_safe_archive_path)
+            os.symlink(member.linkname, os.path.join(os.path.dirname(target_path), os.path.basename(member.name)))
+        else:
+            continue
+        yield member.name
+
+
+def extract_archive(
+        filename, destination, workers=None, progress_hook=None, progress_interval=0.2, keep_metadata=False):
+    """
+    Extracts given zip or tar archive into given folder.
+    Zip members are independent, so they are decompressed concurrently. Tar members are extracted sequentially.
+    Every file is written to a temporary file first and moved into place once it is complete, and members that would
+    be extracted outside destination are rejected. Zip CRCs are validated while members are read.
+    :param filename: str
+    :param destination: str
+    :param workers: int, number of threads used to extract zip members. By default, the number of CPUs.
+    :param progress_hook: fn(member_name, members_done, total_members), called from the calling thread
+    :param progress_interval: float, minimum number of seconds between progress_hook calls
+    :param keep_metadata: bool, whether tar symbolic links and file permissions are kept
+    :return: int, number of extracted members
+    """
+
+    last_report = [0.0]
+
+    def _report(member_name, members_done, total_members, force=False):
+        if not progress_hook:
+            return
+        now = time.time()
+        if force or now - last_report[0] >= progress_interval:
+            last_report[0] = now
+            progress_hook(member_name=member_name, members_done=members_done, total_members=total_members)
+
+    def _extract_zip_member(member_name):
+        # Each call opens its own handle to the zip file, so members can be extracted concurrently
+        target_path = get_safe_archive_path(member_name, destination)
+        with zipfile.ZipFile(filename, 'r') as zip_ref:
+            with zip_ref.open(member_name, 'r') as member_file:
+                write_archive_member(member_file, target_path)
+        return member_name
+
+    if not os.path.isdir(destination):
+        os.makedirs(destination)
+
+    members_done = 0
+    member_name = None
+    if zipfile.is_zipfile(filename):
+        with zipfile.ZipFile(filename, 'r') as zip_ref:
+            members = zip_ref.infolist()
+        file_names = list()
+        for member in members:
+            target_path = get_safe_archive_path(member.filename, destination)
+            if member.filename.endswith('/'):
+                if not os.path.isdir(target_path):
+                    os.makedirs(target_path)
+            else:
+                file_names.append(member.filename)
+        total_members = len(file_names)
+        workers = max(1, min(workers or multiprocessing.cpu_count(), total_members or 1))
+        pool = ThreadPool(workers)
+        try:
+            for member_name in pool.imap_unordered(_extract_zip_member, file_names):
+                members_done += 1
+                _report(member_name, members_done, total_members)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        with contextlib.closing(tarfile.open(filename, 'r:*')) as tar_ref:
+            for member_name in extract_tar_members(tar_ref, destination, keep_metadata=keep_metadata):
+                members_done += 1
+                _report(member_name, members_done, 0)
+        total_members = members_done
+
+    _report(member_name, members_done, total_members, force=True)
+
+    return members_done
@@ -14,8 +14,6 @@ __email__ = "tpovedatd@gmail.com"
 
 import os
 import shutil
-import zipfile
-import tarfile
 import traceback
 
 try:
@@ -25,6 +23,8 @@ except ImportError:
 
 from Qt.QtWidgets import *
 
+from artellapipe.launcher.utils.archive import extract_archive
+
 
 def chunk_report(bytes_so_far, total_size, console, updater=None):
     """
@@ -126,6 +126,10 @@ def unzip_file(filename, destination, console, remove_first=True, remove_sub_fol
     :param remove_sub_folders: bool
     """
 
+    def _extract_report(member_name, members_done, total_members):
+        console.write('Extracted {} of {} files: {}\r'.format(members_done, total_members, member_name))
+        QApplication.instance().processEvents()
+
     console.write('Unzipping file {} to --> {}'.format(filename, destination))
     try:
         if remove_first and remove_sub_folders:
@@ -140,13 +144,6 @@ def unzip_file(filename, destination, console, remove_first=True, remove_sub_fol
             QApplication.instance().processEvents()
             os.makedirs(destination)
 
-        if filename.endswith('.tar.gz'):
-            zip_ref = tarfile.open(filename, 'r:gz')
-        elif filename.endswith('.tar'):
-            zip_ref = tarfile.open(filename, 'r:')
-        else:
-            zip_ref = zipfile.ZipFile(filename, 'r')
-        zip_ref.extractall(destination)
-        zip_ref.close()
+        extract_archive(filename, destination, progress_hook=_extract_report)
     except Exception as e:
         raise RuntimeError('{} | {}'.format(e, traceback.format_exc()))
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains implementation to optimize import paths registered by Artella Launcher
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import sys
+import json
+import atexit
+import logging
+import sysconfig
+
+from artellapipe.launcher.core import defines
+from artellapipe.launcher.utils.lock import FileLock
+
+LOGGER = logging.getLogger('artellapipe-launcher')
+
+# Extensions of the files that can be imported as top level modules
+MODULE_EXTENSIONS = ('.py', '.pyc', '.pyd', '.so')
+
+
+def _path_key(path):
+    """
+    Internal function that returns the key used to compare paths
+    :param path: str
+    :return: str
+    """
+
+    return os.path.normcase(os.path.normpath(os.path.abspath(path)))
+
+
+def compact_paths(paths, profile=None):
+    """
+    Returns given import paths without duplicated or non existent entries.
+    If an import profile is given, paths are sorted by the number of modules imported from them
+    :param paths: list(str)
+    :param profile: dict(str, int), number of imported modules per path, as returned by load_import_profile
+    :return: list(str)
+    """
+
+    compacted_paths = list()
+    found_keys = set()
+    for path in paths or list():
+        if not path:
+            continue
+        path_key = _path_key(path)
+        if path_key in found_keys or not os.path.isdir(path):
+            continue
+        found_keys.add(path_key)
+        compacted_paths.append(os.path.normpath(path))
+
+    if profile:
+        hits = dict((_path_key(path), count) for path, count in profile.items())
+        compacted_paths.sort(key=lambda p: hits.get(_path_key(p), 0), reverse=True)
+
+    return compacted_paths
+
+
+def load_import_profile(profile_path):
+    """
+    Returns import profile stored in given file
+    :param profile_path: str
+    :return: dict(str, int)
+    """
+
+    if not profile_path or not os.path.isfile(profile_path):
+        return dict()
+
+    try:
+        with open(profile_path, 'r') as profile_file:
+            profile = json.load(profile_file)
+    except Exception as exc:
+        LOGGER.warning('Impossible to load import profile "{}": {}'.format(profile_path, exc))
+        return dict()
+
+    return profile if isinstance(profile, dict) else dict()
+
+
+def record_import_profile(paths, profile_path, modules=None):
+    """
+    Adds to the counts stored in given file the number of loaded modules that were imported from each one of the
+    given paths, so the profile accumulates the imports of all sessions.
+    Profile is merged and written while holding an inter-process lock, so concurrent DCC sessions do not lose each
+    other counts
+    :param paths: list(str)
+    :param profile_path: str
+    :param modules: dict(str, module), modules to check. By default, sys.modules
+    :return: dict(str, int), updated profile or an empty dict if profile cannot be stored
+    """
+
+    modules = modules if modules is not None else sys.modules
+    path_keys = [(_path_key(path), path) for path in paths or list()]
+    counts = dict((path, 0) for path in paths or list())
+    for module in list(modules.values()):
+        module_file = getattr(module, '__file__', None)
+        if not module_file:
+            continue
+        module_key = _path_key(module_file)
+        for path_key, path in path_keys:
+            if module_key.startswith(path_key + os.sep):
+                counts[path] += 1
+                break
+
+    temp_path = '{}.{}.tmp'.format(profile_path, os.getpid())
+    try:
+        with FileLock('{}.lock'.format(profile_path)):
+            profile = load_import_profile(profile_path)
+            for path, count in counts.items():
+                profile[path] = profile.get(path, 0) + count
+            with open(temp_path, 'w') as profile_file:
+                json.dump(profile, profile_file)
+            if hasattr(os, 'replace'):
+                os.replace(temp_path, profile_path)
+            else:
+                if os.path.isfile(profile_path):
+                    os.remove(profile_path)
+                os.rename(temp_path, profile_path)
+    except Exception as exc:
+        LOGGER.warning('Impossible to store import profile "{}": {}'.format(profile_path, exc))
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+        return dict()
+
+    return profile
+
+
+def set_import_profile_environment(paths, profile_path, environ=None):
+    """
+    Stores in the environment the paths and the import profile file that processes launched from current one (DCCs)
+    should use to record the modules they import. See start_import_profile
+    :param paths: list(str)
+    :param profile_path: str
+    :param environ: dict, environment to update. By default, os.environ
+    """
+
+    environ = environ if environ is not None else os.environ
+    environ[defines.ARTELLA_LAUNCHER_IMPORT_PROFILE_ENV] = profile_path
+    environ[defines.ARTELLA_LAUNCHER_IMPORT_PROFILE_PATHS_ENV] = os.pathsep.join(paths or list())
+
+
+def start_import_profile():
+    """
+    Records the modules imported by current process when it exits, using the paths and the import profile file
+    defined in the environment by the launcher. Must be called during DCC startup
+    :return: bool, True if the import profile will be recorded; False otherwise
+    """
+
+    profile_path = os.environ.get(defines.ARTELLA_LAUNCHER_IMPORT_PROFILE_ENV, None)
+    paths = [path for path in os.environ.get(
+        defines.ARTELLA_LAUNCHER_IMPORT_PROFILE_PATHS_ENV, '').split(os.pathsep) if path]
+    if not profile_path or not paths:
+        return False
+
+    atexit.register(record_import_profile, paths, profile_path)
+
+    return True
+
+
+def get_standard_module_names():
+    """
+    Returns the names of the top level modules of the Python standard library
+    :return: set(str)
+    """
+
+    module_names = set(sys.builtin_module_names)
+    module_names.update(getattr(sys, 'stdlib_module_names', list()))
+    stdlib_paths = set()
+    for path_name in ('stdlib', 'platstdlib'):
+        stdlib_path = sysconfig.get_paths().get(path_name, None)
+        if stdlib_path:
+            stdlib_paths.update([stdlib_path, os.path.join(stdlib_path, 'lib-dynload')])
+    module_names.update(build_module_map(sorted(stdlib_paths)))
+
+    return module_names
+
+
+def build_module_map(paths):
+    """
+    Returns a dictionary that maps each top level module or package found in given paths with the path it should be
+    imported from. If a module is found in multiple paths, the first one is used, as Python does.
+    Folders without __init__ file are skipped, because namespace packages can be split across multiple paths
+    :param paths: list(str)
+    :return: dict(str, str)
+    """
+
+    module_map = dict()
+    for path in paths or list():
+        try:
+            names = os.listdir(path)
+        except OSError:
+            continue
+        for name in names:
+            full_path = os.path.join(path, name)
+            if os.path.isdir(full_path):
+                if not any(os.path.isfile(os.path.join(full_path, '__init__{}'.format(ext)))
+                           for ext in MODULE_EXTENSIONS):
+                    continue
+                module_name = name
+            else:
+                module_name, ext = os.path.splitext(name)
+                if ext not in MODULE_EXTENSIONS:
+                    continue
+                # Extension modules can be named as module.cpython-37m-x86_64-linux-gnu.so
+                module_name = module_name.split('.')[0]
+            if not module_name or module_name in module_map:
+                continue
+            module_map[module_name] = path
+
+    return module_map
+
+
+class ModuleMapFinder(object):
+    """
+    Meta path finder that resolves top level modules using a precomputed module map, so imports of modules located in
+    mapped paths only look into the path the module is located in instead of scanning all sys.path entries.
+    Modules that are not in the map are resolved by the rest of finders
+    """
+
+    def __init__(self, module_map):
+        self._module_map = module_map
+
+    def find_spec(self, fullname, path=None, target=None):
+        if path is not None or '.' in fullname:
+            return None
+
+        module_path = self._module_map.get(fullname, None)
+        if not module_path:
+            return None
+
+        from importlib.machinery import PathFinder
+        return PathFinder.find_spec(fullname, [module_path], target)
+
+
+def install_module_map(paths):
+    """
+    Installs a finder that resolves modules located in given paths using a precomputed module map.
+    Given paths are kept in sys.path, so pkgutil style namespace packages can still find all their portions.
+    Standard library modules are never mapped and the finder is placed after the builtin and frozen importers, so
+    mapped paths cannot shadow them. Only available in Python 3
+    :param paths: list(str)
+    :return: ModuleMapFinder or None
+    """
+
+    if sys.version_info[0] < 3:
+        LOGGER.warning('Module map finder is only supported in Python 3')
+        return None
+
+    from importlib.machinery import BuiltinImporter, FrozenImporter
+
+    module_map = build_module_map(paths)
+    for module_name in get_standard_module_names():
+        module_map.pop(module_name, None)
+
+    finder = ModuleMapFinder(module_map)
+    index = 0
+    for i, meta_finder in enumerate(sys.meta_path):
+        if meta_finder in (BuiltinImporter, FrozenImporter):
+            index = i + 1
+    sys.meta_path.insert(index, finder)
+
+    return finder
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the inter-process file lock shared by Artella Launcher and Artella Updater.
+It only depends on the standard library, so it can be bundled next to the updater app.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class FileLock(object):
+    """
+    Inter-process lock based on a lock file
+    """
+
+    def __init__(self, lock_path, timeout=10.0, poll_interval=0.05):
+        self._lock_path = lock_path
+        self._timeout = timeout
+        self._poll_interval = poll_interval
+        self._lock_file = None
+
+    def __enter__(self):
+        if not self.acquire():
+            raise RuntimeError(
+                'Impossible to acquire lock "{}" after {} seconds'.format(self._lock_path, self._timeout))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    @property
+    def locked(self):
+        return self._lock_file is not None
+
+    def acquire(self):
+        """
+        Acquires the lock, waiting until it is released by other processes or timeout is reached
+        :return: bool
+        """
+
+        lock_file = open(self._lock_path, 'a+')
+        start_time = time.time()
+        while True:
+            try:
+                if fcntl is None:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self._lock_file = lock_file
+                return True
+            except (IOError, OSError):
+                if time.time() - start_time >= self._timeout:
+                    lock_file.close()
+                    return False
+                time.sleep(self._poll_interval)
+
+    def release(self):
+        """
+        Releases the lock
+        """
+
+        if not self._lock_file:
+            return
+
+        try:
+            if fcntl is None:
+                self._lock_file.seek(0)
+                msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._lock_file.close()
+            self._lock_file = None
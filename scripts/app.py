@@ -2,41 +2,80 @@ import os
 import re
 import sys
 import json
+import math
+import errno
+import bisect
+import sqlite3
+import hashlib
 import time
 import psutil
+import datetime
+import getpass
+import stat
+import shlex
 import shutil
+import functools
 import appdirs
+import posixpath
 import zipfile
 import tarfile
 import argparse
 import platform
 import requests
+import threading
 import traceback
 import contextlib
 import subprocess
+import collections
 import webbrowser
+import multiprocessing
 import logging.config
+from tempfile import mkstemp
 from pathlib2 import Path
 from bs4 import BeautifulSoup
 from backports import tempfile
+from requests.adapters import HTTPAdapter
 from packaging.version import Version, InvalidVersion
+from multiprocessing.pool import ThreadPool
 try:
     from urlparse import urlparse
 except Exception:
     from urllib.parse import urlparse
 try:
-    from urllib2 import Request, urlopen
+    import queue
 except ImportError:
-    from urllib.request import Request, urlopen
+    import Queue as queue
+try:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+try:
+    from urllib3.util.retry import Retry
+except ImportError:
+    from requests.packages.urllib3.util.retry import Retry
+try:
+    from artellapipe.launcher.utils.archive import (
+        get_safe_archive_path, replace_file, write_archive_member, extract_tar_members, extract_archive)
+    from artellapipe.launcher.utils.lock import FileLock
+except ImportError:
+    # Running from sources without artellapipe-launcher installed: use the package located next to scripts folder
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from artellapipe.launcher.utils.archive import (
+        get_safe_archive_path, replace_file, write_archive_member, extract_tar_members, extract_archive)
+    from artellapipe.launcher.utils.lock import FileLock
 
 try:
     import PySide
     from PySide.QtCore import *
     from PySide.QtGui import *
+    from PySide.QtNetwork import QLocalServer, QLocalSocket
 except ImportError:
     from PySide2.QtCore import *
     from PySide2.QtWidgets import *
     from PySide2.QtGui import *
+    from PySide2.QtNetwork import QLocalServer, QLocalSocket
 
 
 logging_name = '__logging__.ini'
@@ -52,6 +91,110 @@ LOGGER = logging.getLogger('artellapipe-updater')
 
 ARTELLA_NEXT_VERSION_FILE_NAME = 'version_to_run_next'
 
+# HTTP session defaults. Timeout is a (connect, read) tuple in seconds
+HTTP_TIMEOUT = (10, 60)
+HTTP_RETRIES = 5
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUS = (429, 500, 502, 503, 504)
+HTTP_POOL_SIZE = 10
+# Name of the folder where folders are moved before being removed in background
+TRASH_FOLDER_NAME = '.artella_trash'
+
+# Version of the layout of virtual environment templates. Increase it to invalidate already created templates
+VENV_TEMPLATE_VERSION = 2
+VENV_TEMPLATE_FILE_NAME = 'artella_template.json'
+# Folder (inside app data folder) where the deployment of newer tags is staged while current one is in use
+PREFETCH_FOLDER_NAME = 'prefetch'
+PREFETCH_MANIFEST_FILE_NAME = 'prefetch.json'
+PREFETCH_WHEELS_FOLDER_NAME = 'wheels'
+# Temporary folders of prefetches are named <tag>.<pid>.tmp. They are only removed once their process is not running
+# and they are older than given seconds
+PREFETCH_TEMP_FOLDER_REGEX = re.compile(r'^.+\.(\d+)\.tmp$')
+PREFETCH_TEMP_MAX_AGE = 24 * 60 * 60
+
+# Version of the layout of virtual environment snapshots shared between computers
+VENV_SNAPSHOT_VERSION = 1
+VENV_SNAPSHOT_EXTENSION = '.tar.gz'
+VENV_SNAPSHOT_COMPRESS_LEVEL = 6
+
+# Script executed by virtual environment Python to compile bytecode of the given folders using all available cores.
+# Files with up to date caches are skipped and default invalidation mode (which takes into account
+# SOURCE_DATE_EPOCH) is used, so generated caches are the ones Python will validate on import
+BYTECODE_WARMUP_SCRIPT = (
+    'import sys, compileall\n'
+    'kwargs = {"quiet": 1}\n'
+    'if sys.version_info >= (3, 5):\n'
+    '    kwargs["workers"] = 0\n'
+    'results = [compileall.compile_dir(path, **kwargs) for path in sys.argv[1:]]\n'
+    'sys.exit(0 if all(results) else 1)\n'
+)
+# Maximum time (in seconds) headless installs and snapshot exports wait for bytecode warm-up to finish
+BYTECODE_WARMUP_TIMEOUT = 120
+# Maximum time (in seconds) launch waits for bytecode warm-up. Warm-up keeps running in background after that
+BYTECODE_LAUNCH_TIMEOUT = 3
+
+# Maximum number of events stored by the tracer, to keep memory bounded in long sessions
+TRACE_MAX_EVENTS = 100000
+
+# Upper bounds of the buckets of telemetry histograms for each one of the supported units. Each bucket is ~19% wider
+# than the previous one: from 1 ms to ~1 hour and from 1 KB/s to ~1 GB/s
+TELEMETRY_BUCKETS = {
+    'seconds': [0.001 * 2 ** (i / 4.0) for i in range(88)],
+    'bytes_per_second': [1024 * 2 ** (i / 4.0) for i in range(80)]
+}
+# Number of weeks stored in telemetry file. Older weeks are removed, so file size is bounded
+TELEMETRY_MAX_PERIODS = 26
+
+# Default answers used by updater when it runs without user interaction (headless mode):
+#   accept_latest: install newest tag if it is newer than the stored one
+#   install_path: installation folder. If not defined, stored one is used
+#   clean: recreate virtual environment from scratch
+#   remove_installation: remove old or broken installations (the contents of the installation folder are deleted)
+HEADLESS_POLICY = {'accept_latest': False, 'install_path': None, 'clean': False, 'remove_installation': False}
+
+# Maximum time (in seconds) subprocesses are allowed to run before being killed
+SETUP_PROBE_TIMEOUT = 60
+VENV_CREATE_TIMEOUT = 600
+PIP_INSTALL_TIMEOUT = 1800
+# Time (in seconds) to wait for the output of a killed process to be closed
+PROCESS_KILL_GRACE_TIME = 5
+# Windows creation flag used to launch processes without console window
+CREATE_NO_WINDOW = 0x08000000
+# Commands used to check that the tools needed to setup the environment are available
+SETUP_PROBES = collections.OrderedDict([
+    ('python', ['python', '-c', 'quit()']),
+    ('pip', ['pip', '-V']),
+    ('virtualenv', ['virtualenv', '--version'])
+])
+
+# Size (in characters) of the chunks of pip output written to the log
+PIP_LOG_CHUNK_SIZE = 8192
+# Maximum number of pip error lines kept to be shown to the user
+PIP_MAX_ERROR_LINES = 500
+# Lines of pip stderr output starting with these prefixes are not considered errors
+PIP_IGNORED_ERROR_PREFIXES = ('DEPRECATION:', 'WARNING:', 'You should consider upgrading via')
+PIP_PACKAGE_REGEX = re.compile(
+    r'^\s*(?:Collecting|Requirement already (?:satisfied|up-to-date):)\s+([A-Za-z0-9][A-Za-z0-9._-]*)')
+
+# Base URL of the server deployment releases and archives are downloaded from. Mirrors use the same layout:
+#   <base>/<repository>/releases and <base>/<repository>/archive/<tag>.tar.gz
+DEFAULT_MIRROR_URL = 'https://github.com'
+MIRROR_PORT = 8780
+# Time (in seconds) a releases page is served from mirror cache before asking for it again
+MIRROR_RELEASES_TTL = 300
+MIRROR_PATH_REGEX = re.compile(
+    r'^/([A-Za-z0-9][\w.-]*)/([A-Za-z0-9][\w.-]*)/(?:(releases)|archive/([A-Za-z0-9][\w.+-]*)\.tar\.gz)/?$')
+MIRROR_RANGE_REGEX = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+# Archives smaller than this size (in bytes) are always downloaded using a single connection
+SEGMENTED_DOWNLOAD_MIN_SIZE = 8 * 1024 * 1024
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.11 (KHTML, like Gecko) '
+                  'Chrome/23.0.1271.64 Safari/537.11',
+    'Accept-Language': 'en-US,en;q=0.8',
+    'Connection': 'keep-alive'
+}
+
 
 def is_windows():
     return sys.platform.startswith('win')
@@ -65,6 +208,161 @@ def is_linux():
     return 'linux' in sys.platform
 
 
+def read_app_config():
+    """
+    Returns config data stored in executable
+    :return: dict
+    """
+
+    data = {}
+    config_file_name = 'config.json'
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), config_file_name)
+    if not os.path.isfile(config_path):
+        config_path = os.path.join(os.path.dirname(sys.executable), 'resources', config_file_name)
+        if not os.path.isfile(config_path):
+            if hasattr(sys, '_MEIPASS'):
+                config_path = os.path.join(sys._MEIPASS, 'resources', config_file_name)
+
+    if not os.path.isfile(config_path):
+        return data
+
+    try:
+        with open(config_path) as config_file:
+            data = json.load(config_file)
+    except RuntimeError as exc:
+        raise Exception(exc)
+
+    return data
+
+
+def get_file_hash(file_path, chunk_size=1024 * 1024):
+    """
+    Returns SHA256 hash of the contents of given file
+    :param file_path: str
+    :param chunk_size: int
+    :return: str
+    """
+
+    file_hash = hashlib.sha256()
+    with open(file_path, 'rb') as hashed_file:
+        for chunk in iter(lambda: hashed_file.read(chunk_size), b''):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+def get_platform_name():
+    """
+    Returns name that identifies current operating system and architecture
+    :return: str
+    """
+
+    return '{}-{}'.format(platform.system(), platform.machine()).lower()
+
+
+def create_http_session():
+    """
+    Returns a new keep-alive HTTP session with connection pooling and a retry/backoff policy
+    :return: requests.Session
+    """
+
+    retry = Retry(
+        total=HTTP_RETRIES, connect=HTTP_RETRIES, read=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUS, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update(HTTP_HEADERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    return session
+
+
+def _on_remove_error(func, path, exc_info):
+    """
+    Internal function used as rmtree error handler that removes read-only flag of files before retrying
+    """
+
+    try:
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+    except Exception:
+        pass
+
+
+def _remove_path(path):
+    """
+    Internal function that removes given file or folder
+    :param path: str
+    """
+
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path, onerror=_on_remove_error)
+    else:
+        try:
+            os.remove(path)
+        except OSError:
+            _on_remove_error(os.remove, path, None)
+
+
+def remove_folder_tree(folder, workers=None, max_depth=2):
+    """
+    Removes given folder. First levels of the folder are split in independent tasks that are removed concurrently
+    :param folder: str
+    :param workers: int, number of threads used to remove the folder. By default, the number of CPUs.
+    :param max_depth: int, number of folder levels that are split in independent tasks
+    """
+
+    if not os.path.isdir(folder):
+        return
+
+    tasks = list()
+    folders_to_split = [(folder, 0)]
+    while folders_to_split:
+        current_folder, depth = folders_to_split.pop()
+        try:
+            names = os.listdir(current_folder)
+        except OSError:
+            continue
+        for name in names:
+            path = os.path.join(current_folder, name)
+            if depth < max_depth and os.path.isdir(path) and not os.path.islink(path):
+                folders_to_split.append((path, depth + 1))
+            else:
+                tasks.append(path)
+
+    if tasks:
+        pool = ThreadPool(max(1, min(workers or multiprocessing.cpu_count() * 2, len(tasks))))
+        try:
+            pool.map(_remove_path, tasks)
+        finally:
+            pool.close()
+            pool.join()
+    shutil.rmtree(folder, onerror=_on_remove_error)
+
+
+def remove_folders_in_background(folders):
+    """
+    Removes given folders in a background thread
+    :param folders: list(str)
+    :return: threading.Thread
+    """
+
+    def _remove_folders():
+        for folder in folders:
+            try:
+                remove_folder_tree(folder)
+            except Exception as exc:
+                LOGGER.warning('Error while removing folder "{}": {}'.format(folder, exc))
+
+    remove_thread = threading.Thread(target=_remove_folders, name='ArtellaFolderRemover')
+    remove_thread.daemon = True
+    remove_thread.start()
+
+    return remove_thread
+
+
 class ArtellaSplash(QSplashScreen, object):
     def __init__(self, pixmap):
 
@@ -93,14 +391,1033 @@ class ArtellaSplash(QSplashScreen, object):
         self.move(x - x_w, y - y_w)
 
 
+class ArtellaTracer(object):
+    """
+    Thread-safe tracer that records spans and events in Chrome trace event format, so traces can be opened with
+    chrome://tracing or Perfetto UI
+    """
+
+    def __init__(self, enabled=True, process_name=None, max_events=TRACE_MAX_EVENTS):
+        self._enabled = enabled
+        self._process_name = process_name
+        self._max_events = max_events
+        self._events = list()
+        self._thread_names = dict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._clock = getattr(time, 'perf_counter', time.time)
+        self._start_time = self._clock()
+        self._start_timestamp = time.time()
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    def _now(self):
+        return int((self._clock() - self._start_time) * 1000000)
+
+    def _add_event(self, event):
+        thread = threading.current_thread()
+        event['pid'] = self._pid
+        event['tid'] = thread.ident
+        with self._lock:
+            if len(self._events) >= self._max_events:
+                return
+            self._thread_names.setdefault(thread.ident, thread.name)
+            self._events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name, category='updater', **args):
+        """
+        Context manager that records a span with the given name. It yields a dictionary that can be used to add
+        arguments to the span while it is running (for example, number of downloaded bytes)
+        :param name: str
+        :param category: str
+        :return: dict
+        """
+
+        if not self._enabled:
+            yield args
+            return
+
+        start = self._now()
+        try:
+            yield args
+        except BaseException as exc:
+            args['error'] = str(exc) or type(exc).__name__
+            raise
+        finally:
+            self._add_event(
+                {'name': name, 'cat': category, 'ph': 'X', 'ts': start, 'dur': self._now() - start, 'args': args})
+
+    def get_events(self, start=0):
+        """
+        Returns recorded events
+        :param start: int, index of the first event to return
+        :return: list(dict)
+        """
+
+        with self._lock:
+            return self._events[start:]
+
+    def instant(self, name, category='updater', **args):
+        """
+        Records an event without duration
+        :param name: str
+        :param category: str
+        """
+
+        if self._enabled:
+            self._add_event({'name': name, 'cat': category, 'ph': 'i', 's': 't', 'ts': self._now(), 'args': args})
+
+    def export(self, trace_path, **metadata):
+        """
+        Writes recorded events into given file
+        :param trace_path: str
+        :param metadata: dict, extra data stored in the trace
+        :return: bool
+        """
+
+        if not self._enabled:
+            return False
+
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        if self._process_name:
+            events.append({
+                'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'tid': 0, 'args': {'name': self._process_name}})
+        for thread_id, thread_name in thread_names.items():
+            events.append(
+                {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': thread_id, 'args': {'name': thread_name}})
+        metadata['start_time'] = self._start_timestamp
+        trace_data = {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': metadata}
+
+        try:
+            handle, temp_path = mkstemp(dir=os.path.dirname(trace_path), prefix='.trace.')
+            with os.fdopen(handle, 'w') as trace_file:
+                json.dump(trace_data, trace_file)
+            replace_file(temp_path, trace_path)
+        except Exception as exc:
+            LOGGER.warning('Impossible to export trace "{}": {}'.format(trace_path, exc))
+            return False
+
+        return True
+
+
+NULL_TRACER = ArtellaTracer(enabled=False)
+
+
+class ArtellaTelemetry(object):
+    """
+    Local store of fixed bucket histograms saved in a SQLite file. Samples are aggregated per week and only last
+    weeks are kept, so file size is bounded no matter how many times the app is executed
+    """
+
+    def __init__(self, db_path, max_periods=TELEMETRY_MAX_PERIODS):
+        self._db_path = db_path
+        self._max_periods = max_periods
+
+    @property
+    def db_path(self):
+        return self._db_path
+
+    @staticmethod
+    def get_period(timestamp=None):
+        """
+        Returns the period (ISO week) the given timestamp belongs to
+        :param timestamp: float
+        :return: str
+        """
+
+        year, week, _ = datetime.date.fromtimestamp(timestamp or time.time()).isocalendar()
+
+        return '{:04d}-W{:02d}'.format(year, week)
+
+    @staticmethod
+    def get_bucket(value, unit):
+        """
+        Returns index of the histogram bucket given value belongs to
+        :param value: float
+        :param unit: str
+        :return: int
+        """
+
+        return bisect.bisect_left(TELEMETRY_BUCKETS[unit], value)
+
+    def _connect(self):
+        connection = sqlite3.connect(self._db_path, timeout=10)
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS histograms ('
+            'period TEXT NOT NULL, metric TEXT NOT NULL, unit TEXT NOT NULL, bucket INTEGER NOT NULL, '
+            'count INTEGER NOT NULL DEFAULT 0, total REAL NOT NULL DEFAULT 0, '
+            'PRIMARY KEY (period, metric, bucket))')
+        return connection
+
+    def record(self, samples, timestamp=None):
+        """
+        Adds given samples to histograms of current period
+        :param samples: list(tuple(str, float, str)), list of (metric, value, unit) samples
+        :param timestamp: float, time samples belong to. Current time by default
+        :return: bool
+        """
+
+        samples = [sample for sample in samples if sample[2] in TELEMETRY_BUCKETS and sample[1] >= 0]
+        if not samples:
+            return False
+
+        period = self.get_period(timestamp)
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    for metric, value, unit in samples:
+                        bucket = self.get_bucket(value, unit)
+                        connection.execute(
+                            'INSERT OR IGNORE INTO histograms (period, metric, unit, bucket) VALUES (?, ?, ?, ?)',
+                            (period, metric, unit, bucket))
+                        connection.execute(
+                            'UPDATE histograms SET count = count + 1, total = total + ? '
+                            'WHERE period = ? AND metric = ? AND bucket = ?', (value, period, metric, bucket))
+                    connection.execute(
+                        'DELETE FROM histograms WHERE period NOT IN '
+                        '(SELECT DISTINCT period FROM histograms ORDER BY period DESC LIMIT ?)', (self._max_periods,))
+            finally:
+                connection.close()
+        except Exception as exc:
+            LOGGER.warning('Impossible to store telemetry in "{}": {}'.format(self._db_path, exc))
+            return False
+
+        return True
+
+    def report(self, periods=None, percentiles=(50, 95)):
+        """
+        Returns aggregated statistics of each one of the stored metrics
+        :param periods: int, number of last periods to take into account. All stored periods by default
+        :param percentiles: tuple(int)
+        :return: list(dict)
+        """
+
+        if not os.path.isfile(self._db_path):
+            return list()
+
+        connection = self._connect()
+        try:
+            stored_periods = [row[0] for row in connection.execute(
+                'SELECT DISTINCT period FROM histograms ORDER BY period DESC')]
+            if periods:
+                stored_periods = stored_periods[:periods]
+            if not stored_periods:
+                return list()
+            rows = connection.execute(
+                'SELECT metric, unit, bucket, SUM(count), SUM(total) FROM histograms WHERE period IN ({}) '
+                'GROUP BY metric, unit, bucket ORDER BY metric, bucket'.format(
+                    ', '.join('?' * len(stored_periods))), stored_periods).fetchall()
+        finally:
+            connection.close()
+
+        histograms = dict()
+        for metric, unit, bucket, count, total in rows:
+            histograms.setdefault((metric, unit), list()).append((bucket, count, total))
+
+        report = list()
+        for (metric, unit), buckets in sorted(histograms.items()):
+            count = sum(bucket[1] for bucket in buckets)
+            metric_data = {
+                'metric': metric, 'unit': unit, 'count': count,
+                'mean': sum(bucket[2] for bucket in buckets) / count if count else 0.0,
+                'periods': [stored_periods[-1], stored_periods[0]]}
+            for percentile in percentiles:
+                metric_data['p{}'.format(percentile)] = self._get_percentile(buckets, count, unit, percentile)
+            report.append(metric_data)
+
+        return report
+
+    def format_report(self, periods=None):
+        """
+        Returns a printable version of telemetry report
+        :param periods: int
+        :return: str
+        """
+
+        report = self.report(periods=periods)
+        if not report:
+            return 'No telemetry data stored in "{}"'.format(self._db_path)
+
+        lines = ['Telemetry: "{}" ({} - {})'.format(self._db_path, *report[0]['periods'])]
+        lines.append('{:<45} {:>8} {:>12} {:>12} {:>12}  {}'.format('metric', 'count', 'mean', 'p50', 'p95', 'unit'))
+        for metric_data in report:
+            lines.append('{:<45} {:>8} {:>12.3f} {:>12.3f} {:>12.3f}  {}'.format(
+                metric_data['metric'], metric_data['count'], metric_data['mean'], metric_data['p50'],
+                metric_data['p95'], metric_data['unit']))
+
+        return '\n'.join(lines)
+
+    def _get_percentile(self, buckets, count, unit, percentile):
+        """
+        Internal function that returns the estimated percentile of an histogram, interpolating inside the bucket
+        :param buckets: list(tuple(int, int, float)), list of (bucket, count, total) sorted by bucket
+        :param count: int
+        :param unit: str
+        :param percentile: int
+        :return: float
+        """
+
+        bounds = TELEMETRY_BUCKETS[unit]
+        rank = count * percentile / 100.0
+        accumulated = 0
+        for bucket, bucket_count, _ in buckets:
+            if accumulated + bucket_count >= rank:
+                if bucket >= len(bounds):
+                    return bounds[-1]
+                lower = bounds[bucket - 1] if bucket > 0 else 0.0
+                return lower + (bounds[bucket] - lower) * (rank - accumulated) / bucket_count
+            accumulated += bucket_count
+
+        return bounds[-1]
+
+
+def traced(name, category='updater'):
+    """
+    Decorator that records a span every time the decorated ArtellaUpdater method is called
+    :param name: str
+    :param category: str
+    """
+
+    def _decorator(fn):
+        @functools.wraps(fn)
+        def _wrapper(self, *args, **kwargs):
+            with self._trace_span(name, category):
+                return fn(self, *args, **kwargs)
+        return _wrapper
+
+    return _decorator
+
+
+def get_popen_kwargs(detached=False, hide_console=True, stdout=None, stderr=None):
+    """
+    Returns keyword arguments used to create subprocesses. They are the same in all platforms: standard input is not
+    inherited and stdout and stderr are piped, unless the process is detached
+    :param detached: bool, whether the process is not attached to the updater (it keeps running after updater exits)
+    :param hide_console: bool, whether to hide console window in Windows
+    :param stdout: file or int, overrides default stdout
+    :param stderr: file or int, overrides default stderr
+    :return: dict
+    """
+
+    popen_kwargs = {'close_fds': detached}
+    if not detached:
+        popen_kwargs['stdin'] = open(os.devnull, 'wb') if sys.version_info[0] == 2 else subprocess.DEVNULL
+        popen_kwargs['stdout'] = stdout or subprocess.PIPE
+        popen_kwargs['stderr'] = stderr or subprocess.PIPE
+    if is_windows() and hide_console:
+        popen_kwargs['creationflags'] = CREATE_NO_WINDOW
+
+    return popen_kwargs
+
+
+class ArtellaProcess(object):
+    """
+    Wraps a running subprocess. Its output is read by background threads, so the process never blocks because a pipe
+    is full and several processes can run at the same time. Process can be waited with a timeout and cancelled from
+    any thread. Output lines are dispatched from the thread that waits for the process
+    """
+
+    def __init__(self, process, timeout=None, line_hook=None, keep_output=False):
+        """
+        :param process: subprocess.Popen
+        :param timeout: float, maximum time (in seconds) the process can run before being killed
+        :param line_hook: fn(stream_name, line), called for each output line
+        :param keep_output: bool, whether output lines are stored
+        """
+
+        self._process = process
+        self._timeout = timeout
+        self._line_hook = line_hook
+        self._keep_output = keep_output
+        self._start_time = time.time()
+        self._kill_time = None
+        self._output_queue = queue.Queue()
+        self._output = {'stdout': list(), 'stderr': list()}
+        self._cancel_event = threading.Event()
+        self._cancelled = False
+        self._timed_out = False
+        self._readers = 0
+
+        for stream, stream_name in ((process.stdout, 'stdout'), (process.stderr, 'stderr')):
+            if stream is None:
+                continue
+            reader = threading.Thread(
+                target=self._read_stream, args=(stream, stream_name), name='ArtellaProcessReader')
+            reader.daemon = True
+            reader.start()
+            self._readers += 1
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    @property
+    def returncode(self):
+        return self._process.returncode
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    @property
+    def timed_out(self):
+        return self._timed_out
+
+    @property
+    def output(self):
+        return '\n'.join(self._output['stdout'])
+
+    @property
+    def error(self):
+        return '\n'.join(self._output['stderr'])
+
+    def is_running(self):
+        """
+        Returns whether process is still running
+        :return: bool
+        """
+
+        return self._process.poll() is None
+
+    def cancel(self):
+        """
+        Kills the process. It can be called from any thread, process is killed by the thread that waits for it
+        """
+
+        self._cancel_event.set()
+
+    def wait(self, idle_hook=None, idle_interval=0.1):
+        """
+        Waits until process finishes, dispatching its output lines. Process is killed if it is cancelled or if it
+        runs for more time than its timeout
+        :param idle_hook: fn(), called periodically while waiting (for example, to process UI events)
+        :param idle_interval: float
+        :return: int, process return code
+        """
+
+        last_idle = time.time()
+        while self._readers or self._process.poll() is None:
+            if self._kill_time is None:
+                if self._cancel_event.is_set():
+                    self._cancelled = True
+                    self._kill()
+                elif self._timeout and time.time() - self._start_time > self._timeout:
+                    LOGGER.warning('Process {} killed after {} seconds: {}'.format(
+                        self.pid, self._timeout, self._process.args if hasattr(self._process, 'args') else ''))
+                    self._timed_out = True
+                    self._kill()
+            elif time.time() - self._kill_time > PROCESS_KILL_GRACE_TIME:
+                # Pipes can be kept open by children of the killed process
+                break
+
+            self._dispatch_output(idle_interval)
+            if idle_hook and time.time() - last_idle >= idle_interval:
+                idle_hook()
+                last_idle = time.time()
+
+        return self._process.wait()
+
+    def _read_stream(self, stream, stream_name):
+        try:
+            for line in iter(stream.readline, b''):
+                self._output_queue.put((stream_name, line))
+        except (IOError, ValueError):
+            pass
+        finally:
+            self._output_queue.put((stream_name, None))
+
+    def _dispatch_output(self, timeout):
+        try:
+            stream_name, line = self._output_queue.get(timeout=timeout)
+            while True:
+                if line is None:
+                    self._readers -= 1
+                else:
+                    if isinstance(line, bytes):
+                        line = line.decode('utf-8', 'replace')
+                    line = line.rstrip('\r\n')
+                    if self._keep_output:
+                        self._output[stream_name].append(line)
+                    if self._line_hook:
+                        self._line_hook(stream_name, line)
+                stream_name, line = self._output_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _kill(self):
+        self._kill_time = time.time()
+        if self._process.poll() is not None:
+            return
+        try:
+            if is_windows():
+                # Children processes (pip build processes for example) are killed too. Its output is discarded
+                # because nobody reads it, so taskkill never blocks writing into a full pipe
+                devnull = open(os.devnull, 'wb') if sys.version_info[0] == 2 else subprocess.DEVNULL
+                subprocess.call(
+                    ['taskkill', '/F', '/T', '/PID', str(self._process.pid)],
+                    **get_popen_kwargs(stdout=devnull, stderr=devnull))
+            else:
+                self._process.kill()
+        except OSError as exc:
+            LOGGER.warning('Impossible to kill process {}: {}'.format(self._process.pid, exc))
+
+
+def get_requirements_count(requirements_path):
+    """
+    Returns the number of requirements listed in the given requirements file
+    :param requirements_path: str
+    :return: int
+    """
+
+    with open(requirements_path, 'r') as requirements_file:
+        return len([line for line in (line.strip() for line in requirements_file) if line and line[0] not in '#-'])
+
+
+class PipOutputParser(object):
+    """
+    Parses pip install output line by line. It reports the package being processed, writes output to the log in
+    bounded chunks and keeps the last error lines
+    """
+
+    def __init__(self, total_packages=0, progress_hook=None, log_chunk_size=PIP_LOG_CHUNK_SIZE,
+                 max_error_lines=PIP_MAX_ERROR_LINES):
+        self._total_packages = total_packages
+        self._progress_hook = progress_hook
+        self._log_chunk_size = log_chunk_size
+        self._packages = set()
+        self._log_lines = list()
+        self._log_size = 0
+        self._errors = collections.deque(maxlen=max_error_lines)
+
+    @property
+    def packages(self):
+        return len(self._packages)
+
+    @property
+    def errors(self):
+        return list(self._errors)
+
+    def feed(self, stream_name, line):
+        """
+        Processes a line of pip output
+        :param stream_name: str, stdout or stderr
+        :param line: str
+        """
+
+        self._log_lines.append(line)
+        self._log_size += len(line) + 1
+        if self._log_size >= self._log_chunk_size:
+            self.flush()
+
+        if stream_name == 'stderr':
+            if line and not line.startswith(PIP_IGNORED_ERROR_PREFIXES):
+                self._errors.append(line)
+            return
+
+        package_match = PIP_PACKAGE_REGEX.match(line)
+        if package_match:
+            package_name = package_match.group(1).lower().replace('_', '-')
+            if package_name not in self._packages:
+                self._packages.add(package_name)
+                self._report('Processing requirements: package {} of {} ({})'.format(
+                    len(self._packages), max(self._total_packages, len(self._packages)), package_match.group(1)))
+        elif line.startswith('Installing collected packages:'):
+            self._report('Installing {} packages ...'.format(len(line.split(':', 1)[-1].split(','))))
+
+    def flush(self):
+        """
+        Writes buffered output into the log
+        """
+
+        if self._log_lines:
+            LOGGER.info('\n'.join(self._log_lines))
+        self._log_lines = list()
+        self._log_size = 0
+
+    def _report(self, msg):
+        if self._progress_hook:
+            self._progress_hook(msg)
+
+
+class ArtellaMirror(object):
+    """
+    Local cache of deployment release pages and archives of an upstream server (GitHub by default).
+    Archives of a tag never change, so they are downloaded only once. Release pages are cached for a short time and
+    the cached page is served if upstream server is not available.
+    Only the given repositories are mirrored, so the mirror cannot be used to download anything else
+    """
+
+    def __init__(
+            self, cache_folder, repositories, upstream_url=DEFAULT_MIRROR_URL, releases_ttl=MIRROR_RELEASES_TTL):
+        self._cache_folder = cache_folder
+        self._repositories = set(repository.strip('/').lower() for repository in repositories or list())
+        self._upstream_url = upstream_url.rstrip('/')
+        self._releases_ttl = releases_ttl
+        self._session = create_http_session()
+        self._locks = dict()
+        self._locks_lock = threading.Lock()
+        self.upstream_requests = 0
+
+    @property
+    def cache_folder(self):
+        return self._cache_folder
+
+    @property
+    def repositories(self):
+        return sorted(self._repositories)
+
+    def get_file(self, path):
+        """
+        Returns cached file of given mirror path, downloading it from upstream server if necessary
+        :param path: str, <repository>/releases or <repository>/archive/<tag>.tar.gz
+        :return: tuple(str, str), path of the cached file and its content type. Path is None if path is not valid
+            or if its repository is not mirrored
+        :raises requests.RequestException: if file is not cached and it cannot be downloaded
+        """
+
+        path_match = MIRROR_PATH_REGEX.match(path.split('?', 1)[0])
+        if not path_match:
+            return None, None
+        owner, repository, releases, tag = path_match.groups()
+        if '{}/{}'.format(owner, repository).lower() not in self._repositories:
+            return None, None
+        # Repository names are case insensitive, so all spellings share the same cache
+        owner, repository = owner.lower(), repository.lower()
+        if releases:
+            cache_path = os.path.join(self._cache_folder, owner, repository, 'releases.html')
+            content_type = 'text/html; charset=utf-8'
+        else:
+            cache_path = os.path.join(self._cache_folder, owner, repository, 'archive', '{}.tar.gz'.format(tag))
+            content_type = 'application/x-gzip'
+
+        with self._get_lock(cache_path):
+            if os.path.isfile(cache_path):
+                if not releases or time.time() - os.path.getmtime(cache_path) < self._releases_ttl:
+                    return cache_path, content_type
+            url = '{}/{}/{}/{}'.format(
+                self._upstream_url, owner, repository, 'releases' if releases else 'archive/{}.tar.gz'.format(tag))
+            try:
+                self._download(url, cache_path)
+            except Exception as exc:
+                if not os.path.isfile(cache_path):
+                    raise
+                LOGGER.warning('Impossible to update mirror cache of "{}". Serving cached file: {}'.format(url, exc))
+
+        return cache_path, content_type
+
+    def _get_lock(self, cache_path):
+        # Concurrent requests of the same file wait for the first one, so each file is downloaded only once
+        with self._locks_lock:
+            return self._locks.setdefault(cache_path, threading.Lock())
+
+    def _download(self, url, cache_path):
+        LOGGER.info('Mirror downloading: {}'.format(url))
+        self.upstream_requests += 1
+        response = self._session.get(url, stream=True, timeout=HTTP_TIMEOUT)
+        try:
+            response.raise_for_status()
+            cache_dir = os.path.dirname(cache_path)
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            fd, temp_path = mkstemp(dir=cache_dir, prefix='.', suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as cache_file:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        cache_file.write(chunk)
+                replace_file(temp_path, cache_path)
+            except Exception:
+                if os.path.isfile(temp_path):
+                    os.remove(temp_path)
+                raise
+        finally:
+            response.close()
+
+
+class ArtellaMirrorRequestHandler(BaseHTTPRequestHandler, object):
+    """
+    Serves files of the mirror of the server. Single byte ranges are supported, so archives can be downloaded using
+    several connections
+    """
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def log_message(self, format, *args):
+        LOGGER.debug('Mirror {}: {}'.format(self.address_string(), format % args))
+
+    def _serve(self, send_body):
+        try:
+            file_path, content_type = self.server.mirror.get_file(self.path)
+        except requests.HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else 502
+            self.send_error(404 if status == 404 else 502)
+            return
+        except Exception as exc:
+            LOGGER.warning('Mirror request "{}" failed: {}'.format(self.path, exc))
+            self.send_error(502)
+            return
+        if not file_path:
+            self.send_error(404)
+            return
+
+        file_size = os.path.getsize(file_path)
+        start, end = 0, file_size - 1
+        range_match = MIRROR_RANGE_REGEX.match(self.headers.get('Range', '').strip())
+        if range_match and any(range_match.groups()):
+            range_start, range_end = range_match.groups()
+            if range_start:
+                start, end = int(range_start), min(int(range_end or end), end)
+            else:
+                start = max(0, file_size - int(range_end))
+            if start > end:
+                self.send_response(416)
+                self.send_header('Content-Range', 'bytes */{}'.format(file_size))
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(start, end, file_size))
+        else:
+            self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(end - start + 1))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+        if not send_body:
+            return
+
+        remaining = end - start + 1
+        with open(file_path, 'rb') as served_file:
+            served_file.seek(start)
+            while remaining > 0:
+                chunk = served_file.read(min(remaining, 1024 * 1024))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+
+class ArtellaMirrorServer(ThreadingMixIn, HTTPServer, object):
+    """
+    HTTP server that serves a mirror of deployment releases to the computers of a local network
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, mirror):
+        HTTPServer.__init__(self, address, ArtellaMirrorRequestHandler)
+        self.mirror = mirror
+
+
+class ProgressReader(object):
+    """
+    File-like wrapper that reports the number of bytes read from the wrapped stream
+    """
+
+    def __init__(self, stream, total_size=0, report_hook=None, report_interval=0.2):
+        self._stream = stream
+        self._total_size = total_size
+        self._report_hook = report_hook
+        self._report_interval = report_interval
+        self._last_report = 0.0
+        self._bytes_so_far = 0
+
+    @property
+    def bytes_so_far(self):
+        return self._bytes_so_far
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        self._bytes_so_far += len(data)
+        if self._report_hook:
+            now = time.time()
+            if not data or now - self._last_report >= self._report_interval:
+                self._last_report = now
+                self._report_hook(bytes_so_far=self._bytes_so_far, total_size=self._total_size)
+
+        return data
+
+
+class ArtellaConfigStore(object):
+    """
+    In-memory store of the updater configuration file.
+    File is read only once; writes update the in-memory data and are flushed to disk atomically.
+    Disk access is guarded by an inter-process lock, so concurrent launcher instances do not lose each other updates.
+    An invalid configuration file is never overridden: reads and writes fail until it is fixed or removed
+    """
+
+    def __init__(self, config_path):
+        self._config_path = config_path
+        self._data = None
+        self._pending = dict()
+        self._batch_level = 0
+
+    @property
+    def config_path(self):
+        return self._config_path
+
+    @property
+    def lock_path(self):
+        return '{}.lock'.format(self._config_path)
+
+    def load(self, force=False):
+        """
+        Loads configuration file data if it is not already loaded
+        :param force: bool, Whether to read file again even if data is already loaded
+        :return: dict
+        :raises ValueError: if configuration file is not valid
+        :raises RuntimeError: if the lock of the configuration file cannot be acquired
+        """
+
+        if self._data is not None and not force:
+            return self._data
+
+        with FileLock(self.lock_path):
+            data = self._read()
+        data.update(self._pending)
+        self._data = data
+
+        return self._data
+
+    def get_data(self):
+        """
+        Returns a copy of the configuration data
+        :return: dict
+        """
+
+        return dict(self.load())
+
+    def get(self, config_name, default=None):
+        """
+        Returns value of the given configuration
+        :param config_name: str
+        :param default: object
+        :return: object
+        """
+
+        return self.load().get(config_name, default)
+
+    def set(self, config_name, config_value):
+        """
+        Sets configuration value. File is updated unless a batch is opened; in that case it is updated when the
+        batch is closed
+        :param config_name: str
+        :param config_value: object
+        """
+
+        self.load()[config_name] = config_value
+        self._pending[config_name] = config_value
+        if not self._batch_level:
+            self.flush()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager that coalesces all configuration updates done inside it into a single file write
+        """
+
+        self._batch_level += 1
+        try:
+            yield self
+        finally:
+            self._batch_level -= 1
+
+        # Updates are not written if an exception was raised inside the batch, so flush errors never hide it. They
+        # are written with next update
+        if not self._batch_level and self._pending:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes configuration data into disk.
+        Pending updates are merged on top of the data currently stored in disk and written into a temporary file that
+        replaces the configuration file, so configuration file is never left half written
+        :raises ValueError: if configuration file is not valid
+        :raises RuntimeError: if the lock of the configuration file cannot be acquired
+        """
+
+        with FileLock(self.lock_path):
+            data = self._read()
+            data.update(self._pending)
+            self._write_file(self._config_path, data)
+
+        self._data = data
+        self._pending = dict()
+
+    def _read(self):
+        """
+        Internal function that reads configuration file. Lock must be acquired before calling this function
+        :return: dict
+        :raises ValueError: if configuration file is not valid
+        """
+
+        if not os.path.isfile(self._config_path):
+            return dict()
+
+        data = self._read_file(self._config_path)
+        if data is None:
+            raise ValueError('Configuration file is not valid: "{}"'.format(self._config_path))
+
+        return data
+
+    def _read_file(self, file_path):
+        """
+        Internal function that returns the data stored in the given JSON file or None if the file is not valid
+        :param file_path: str
+        :return: dict or None
+        """
+
+        with open(file_path, 'r') as config_file:
+            try:
+                data = json.load(config_file)
+            except Exception:
+                return None
+
+        return data if isinstance(data, dict) else None
+
+    def _write_file(self, file_path, data):
+        """
+        Internal function that atomically writes given data into the given file
+        :param file_path: str
+        :param data: dict
+        """
+
+        fd, temp_path = mkstemp(dir=os.path.dirname(file_path), prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as config_file:
+                json.dump(data, config_file)
+                config_file.flush()
+                os.fsync(config_file.fileno())
+            replace_file(temp_path, file_path)
+        except Exception:
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+class ArtellaInstanceGuard(QObject, object):
+    """
+    Makes sure that only one updater instance is running. New instances forward their arguments to the running one
+    through a local socket instead of starting again
+    """
+
+    messageReceived = Signal(dict)
+
+    def __init__(self, name, parent=None):
+        super(ArtellaInstanceGuard, self).__init__(parent)
+
+        self._name = name
+        self._server = None
+        self._buffers = dict()
+
+    @property
+    def name(self):
+        return self._name
+
+    def forward(self, message, timeout=500):
+        """
+        Sends given message to the running instance
+        :param message: dict
+        :param timeout: int, milliseconds to wait for the running instance
+        :return: bool, True if the message was received by a running instance; False otherwise
+        """
+
+        socket = QLocalSocket()
+        socket.connectToServer(self._name)
+        if not socket.waitForConnected(timeout):
+            return False
+
+        socket.write(QByteArray(json.dumps(message).encode('utf-8')))
+        valid_write = socket.waitForBytesWritten(timeout)
+        socket.disconnectFromServer()
+
+        return valid_write
+
+    def listen(self):
+        """
+        Starts listening for messages sent by new instances
+        :return: bool
+        """
+
+        self._server = QLocalServer(self)
+        if not self._server.listen(self._name):
+            # Only servers left behind by instances that did not exit properly are removed. Running instances can be
+            # too busy to answer in time, but they still accept connections
+            if not self._is_stale():
+                LOGGER.warning('Impossible to start instance server "{}": {}'.format(
+                    self._name, self._server.errorString()))
+                return False
+            QLocalServer.removeServer(self._name)
+            if not self._server.listen(self._name):
+                LOGGER.warning('Impossible to start instance server "{}": {}'.format(
+                    self._name, self._server.errorString()))
+                return False
+        self._server.newConnection.connect(self._on_new_connection)
+
+        return True
+
+    def _is_stale(self, timeout=500):
+        """
+        Internal function that returns whether the server with the guard name is not owned by any running instance
+        :param timeout: int, milliseconds to wait for the connection
+        :return: bool
+        """
+
+        socket = QLocalSocket()
+        socket.connectToServer(self._name)
+        if socket.waitForConnected(timeout):
+            socket.disconnectFromServer()
+            return False
+
+        return socket.error() in (QLocalSocket.ConnectionRefusedError, QLocalSocket.ServerNotFoundError)
+
+    def _on_new_connection(self):
+        socket = self._server.nextPendingConnection()
+        if not socket:
+            return
+        self._buffers[socket] = b''
+        socket.readyRead.connect(lambda: self._on_ready_read(socket))
+        socket.disconnected.connect(lambda: self._on_disconnected(socket))
+
+    def _on_ready_read(self, socket):
+        self._buffers[socket] = self._buffers.get(socket, b'') + socket.readAll().data()
+
+    def _on_disconnected(self, socket):
+        self._on_ready_read(socket)
+        data = self._buffers.pop(socket, b'')
+        socket.deleteLater()
+        try:
+            message = json.loads(data.decode('utf-8'))
+        except Exception:
+            LOGGER.warning('Invalid message received from other instance: {}'.format(data))
+            return
+        if isinstance(message, dict):
+            self.messageReceived.emit(message)
+
+
 class ArtellaUpdaterException(Exception, object):
-    def __init__(self, exc):
-        if type(exc) in [str, unicode]:
+    def __init__(self, exc, show_dialog=True):
+        """
+        :param exc: Exception or str
+        :param show_dialog: bool, Whether error dialog is shown. Disabled when updater runs without user interaction
+        """
+
+        if not isinstance(exc, Exception):
             exc = Exception(exc)
+        self.show_dialog = show_dialog
         msg = '{} | {}'.format(exc, traceback.format_exc())
         LOGGER.exception(msg)
         traceback.print_exc()
-        QMessageBox.critical(None, 'Error', msg)
+        if self.show_dialog:
+            QMessageBox.critical(None, 'Error', msg)
 
 
 class ArtellaUpdater(QWidget, object):
@@ -108,10 +1425,25 @@ class ArtellaUpdater(QWidget, object):
             self, app, project_name, project_type, app_version, deployment_repository, documentation_url=None,
             deploy_tag=None, install_env_var=None, requirements_file_name=None, force_venv=False,
             splash_path=None, script_path=None, requirements_path=None, artellapipe_configs_path=None,
-            dev=False, update_icon=False, parent=None):
+            dev=False, update_icon=False, download_connections=1, stream_extract=False, selective_extract=False,
+            telemetry=None, headless=False, policy=None, snapshots_path=None, export_snapshot=False, mirror_url=None,
+            prefetch=False, parent=None):
         super(ArtellaUpdater, self).__init__(parent=parent)
 
+        # In headless mode decisions are taken using policy options and progress is written to stdout
+        self._headless = headless
+        self._policy = dict(HEADLESS_POLICY, **(policy or dict()))
+        if headless:
+            # stdout only contains JSON events
+            for handler in LOGGER.handlers:
+                if not isinstance(handler, logging.FileHandler) and getattr(handler, 'stream', None) is sys.stdout:
+                    handler.stream = sys.stderr
+
         self._config_data = self._read_config()
+        self._config_store = None
+        self._http_session = None
+        self._tracer = ArtellaTracer(process_name='{} Updater'.format(project_name))
+        self._telemetry_index = 0
 
         if app and update_icon:
             app.setWindowIcon(QIcon(self._get_resource(self._get_app_config('icon'))))
@@ -128,21 +1460,51 @@ class ArtellaUpdater(QWidget, object):
         self._project_type = self._get_app_config('type') or project_type
         self._app_version = self._get_app_config('version') or app_version
         self._repository = self._get_app_config('repository') or deployment_repository
+        self._mirror_url = self._get_app_config('mirror_url') or mirror_url or DEFAULT_MIRROR_URL
         self._splash_path = self._get_resource(self._get_app_config('splash')) or splash_path
 
         self._force_venv = force_venv
+        self._python_info = None
+        self._bytecode_thread = None
+        self._loading = False
+        self._instance_messages = list()
+        self._download_connections = max(1, min(int(download_connections or 1), HTTP_POOL_SIZE))
+        self._stream_extract = stream_extract
+        self._selective_extract = selective_extract
         self._venv_info = dict()
-
-        if self._project_name and not self._dev:
-            for proc in psutil.process_iter():
-                if proc.name().startswith(self._project_name) and proc.pid != psutil.Process().pid:
-                    proc.kill()
+        self._snapshots_path = self._get_app_config('snapshots_path') or snapshots_path
+        self._export_snapshot = export_snapshot
+        self._venv_snapshot = None
+        # Hash of the requirements file of current deployment. It is computed while the file exists, because the
+        # downloaded one is removed once deployment is setup
+        self._requirements_hash = None
+        self._prefetch = prefetch
+        self._prefetch_path = None
+        self._latest_deploy_tag = None
+
+        # Headless instances do not forward arguments, so they can provision several installations at once
+        self._instance_guard = None
+        self._forwarded = False
+        if self._project_name and not self._dev and not self._headless:
+            self._instance_guard = ArtellaInstanceGuard(self._get_instance_name(), parent=self)
+            if self._instance_guard.forward({'tag': deploy_tag, 'dev': dev}):
+                LOGGER.info('{} Launcher is already running. Arguments forwarded to running instance.'.format(
+                    self._project_name))
+                self._forwarded = True
+                return
+            self._instance_guard.listen()
+            self._instance_guard.messageReceived.connect(self._on_instance_message)
 
         self._setup_logger()
-        self._setup_config()
+        if not self._setup_config():
+            self._exit(False)
+        if telemetry is not None:
+            self._set_config('telemetry', bool(telemetry))
+        self._clean_trash()
 
-        self._setup_ui()
-        QApplication.instance().processEvents()
+        with self._trace_span('setup_ui'):
+            self._setup_ui()
+            QApplication.instance().processEvents()
 
         self._install_path = None
         self._selected_tag_index = None
@@ -156,16 +1518,31 @@ class ArtellaUpdater(QWidget, object):
 
         # If not valid tag is found we close the application
         if not self._deploy_tag:
-            sys.exit()
+            self._exit(False)
 
-        valid_load = self._load()
+        if self._prefetch:
+            self._exit(self._prefetch_release())
+
+        valid_load = self._load(clean=self._headless and self._policy['clean'])
         if not valid_load:
-            sys.exit()
+            self._exit(False)
+
+        if self._headless:
+            self._exit(True)
 
     @property
     def project_name(self):
         return self._project_name
 
+    @property
+    def forwarded(self):
+        """
+        Returns whether the app was not loaded because its arguments were forwarded to an already running instance
+        :return: bool
+        """
+
+        return self._forwarded
+
     @property
     def repository(self):
         return self._repository
@@ -204,19 +1581,25 @@ class ArtellaUpdater(QWidget, object):
         :return: dict
         """
 
-        data = dict()
-
-        config_path = self._get_config_path()
-        if not os.path.isfile(config_path):
-            return data
+        return self._get_config_store().get_data()
 
-        with open(config_path, 'r') as config_file:
-            try:
-                data = json.load(config_file)
-            except Exception:
-                data = dict()
+    def _get_config_data(self, show_error=True):
+        """
+        Internal function that returns data in the configuration file, handling configuration file errors
+        :param show_error: bool, Whether to show an error to the user if configuration file cannot be read. If False,
+            error is only logged
+        :return: dict or None, None if configuration file cannot be read
+        """
 
-        return data
+        try:
+            return self.get_config_data()
+        except (ValueError, RuntimeError) as exc:
+            msg = 'Impossible to read configuration file: {}'.format(exc)
+            if show_error:
+                self._show_error(msg)
+            else:
+                LOGGER.error(msg)
+            return None
 
     def is_python_installed(self):
         """
@@ -224,10 +1607,7 @@ class ArtellaUpdater(QWidget, object):
         :return: bool
         """
 
-        process = self._run_subprocess(commands_list=['python', '-c', 'quit()'], shell=False)
-        process.wait()
-
-        return True if process.returncode == 0 else False
+        return self._wait_probe(self._start_probe('python'))
 
     def is_pip_installed(self):
         """
@@ -235,10 +1615,7 @@ class ArtellaUpdater(QWidget, object):
         :return: bool
         """
 
-        process = self._run_subprocess(commands_list=['pip', '-V'])
-        process.wait()
-
-        return True if process.returncode == 0 else False
+        return self._wait_probe(self._start_probe('pip'))
 
     def is_virtualenv_installed(self):
         """
@@ -246,13 +1623,25 @@ class ArtellaUpdater(QWidget, object):
         :return: bool
         """
 
-        try:
-            process = self._run_subprocess(commands_list=['virtualenv', '--version'], shell=False)
-            process.wait()
-        except Exception:
-            return False
+        return self._wait_probe(self._start_probe('virtualenv'))
+
+    def _start_probe(self, probe_name):
+        """
+        Internal function that launches the command used to check if given tool is available
+        :param probe_name: str, one of SETUP_PROBES
+        :return: ArtellaProcess or None
+        """
 
-        return True if process.returncode == 0 else False
+        return self._start_process(commands_list=SETUP_PROBES[probe_name], timeout=SETUP_PROBE_TIMEOUT)
+
+    def _wait_probe(self, probe):
+        """
+        Internal function that waits for given probe and returns whether it succeeded
+        :param probe: ArtellaProcess or None
+        :return: bool
+        """
+
+        return self._wait_process(probe) == 0
 
     def _read_config(self):
         """
@@ -260,25 +1649,123 @@ class ArtellaUpdater(QWidget, object):
         :return: dict
         """
 
-        data = {}
-        config_file_name = 'config.json'
-        config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), config_file_name)
-        if not os.path.isfile(config_path):
-            config_path = os.path.join(os.path.dirname(sys.executable), 'resources', config_file_name)
-            if not os.path.isfile(config_path):
-                if hasattr(sys, '_MEIPASS'):
-                    config_path = os.path.join(sys._MEIPASS, 'resources', config_file_name)
+        return read_app_config()
 
-        if not os.path.isfile(config_path):
-            return data
+    def _get_http_session(self):
+        """
+        Returns HTTP session shared by all the network calls done by the updater
+        :return: requests.Session
+        """
 
-        try:
-            with open(config_path) as config_file:
-                data = json.load(config_file)
-        except RuntimeError as exc:
-            raise Exception(exc)
+        if self._http_session is None:
+            self._http_session = create_http_session()
 
-        return data
+        return self._http_session
+
+    def _http_get(self, url, **kwargs):
+        """
+        Internal function that performs a GET request through the shared HTTP session
+        :param url: str
+        :return: requests.Response
+        """
+
+        kwargs.setdefault('timeout', HTTP_TIMEOUT)
+
+        with self._trace_span('http_get', 'network', url=url) as span_args:
+            response = self._get_http_session().get(url, **kwargs)
+            span_args['status_code'] = response.status_code
+            if not kwargs.get('stream', False):
+                span_args['bytes'] = len(response.content)
+
+        return response
+
+    def _trace_span(self, name, category='updater', **args):
+        """
+        Internal function that returns a context manager that records a span in the updater trace
+        :param name: str
+        :param category: str
+        :return: contextlib.GeneratorContextManager
+        """
+
+        return (getattr(self, '_tracer', None) or NULL_TRACER).span(name, category, **args)
+
+    def _get_trace_path(self):
+        """
+        Internal function that returns path where trace of the last execution is stored
+        :return: str
+        """
+
+        return os.path.join(self._get_app_folder(), '{}_trace.json'.format(self._get_app_name()))
+
+    def _save_trace(self):
+        """
+        Internal function that exports recorded trace and, if telemetry is enabled, adds its timings to telemetry
+        """
+
+        self._export_trace()
+        if self._is_telemetry_enabled():
+            self._record_telemetry()
+
+    def _is_telemetry_enabled(self):
+        """
+        Returns whether or not user enabled the storage of launch timings
+        :return: bool
+        """
+
+        config_data = self._get_config_data(show_error=False) or dict()
+
+        return bool(config_data.get('telemetry', False))
+
+    def _get_telemetry(self):
+        """
+        Internal function that returns the telemetry store of the app
+        :return: ArtellaTelemetry
+        """
+
+        return ArtellaTelemetry(
+            os.path.join(self._get_app_folder(), '{}_telemetry.db'.format(self._get_app_name())))
+
+    def _record_telemetry(self):
+        """
+        Internal function that stores in telemetry histograms the duration of the spans recorded since last call and
+        the throughput of downloads
+        :return: bool
+        """
+
+        tracer = getattr(self, '_tracer', None)
+        if not tracer:
+            return False
+
+        events = tracer.get_events(self._telemetry_index)
+        self._telemetry_index += len(events)
+
+        samples = list()
+        for event in events:
+            if event.get('ph') != 'X' or 'error' in event['args']:
+                continue
+            duration = event['dur'] / 1000000.0
+            samples.append(('{}.{}'.format(event['cat'], event['name']), duration, 'seconds'))
+            downloaded_bytes = event['args'].get('bytes', None)
+            if event['cat'] == 'network' and downloaded_bytes and duration > 0:
+                samples.append(
+                    ('{}.{}.throughput'.format(event['cat'], event['name']), downloaded_bytes / duration,
+                     'bytes_per_second'))
+
+        return self._get_telemetry().record(samples)
+
+    def _export_trace(self):
+        """
+        Internal function that stores recorded trace in app folder. It can be opened with chrome://tracing or Perfetto
+        :return: bool
+        """
+
+        tracer = getattr(self, '_tracer', None)
+        if not tracer:
+            return False
+
+        return tracer.export(
+            self._get_trace_path(), project=self._project_name, app_version=getattr(self, '_app_version', None),
+            tag=getattr(self, '_deploy_tag', None), platform=platform.platform(), python=sys.version)
 
     def _get_app_config(self, config_name):
         """
@@ -321,8 +1808,85 @@ class ArtellaUpdater(QWidget, object):
 
     def _set_splash_text(self, new_text):
         self._progress_text.setText(new_text)
+        if self._headless:
+            self._emit_event('progress', message=new_text)
         QApplication.instance().processEvents()
 
+    def _emit_event(self, event, **data):
+        """
+        Internal function that writes an event in stdout as a JSON line. Only used in headless mode
+        :param event: str
+        """
+
+        data.update({'event': event, 'time': time.time(), 'project': self._project_name})
+        sys.stdout.write('{}\n'.format(json.dumps(data, sort_keys=True, default=str)))
+        sys.stdout.flush()
+
+    def _ask_question(self, question_id, title, msg):
+        """
+        Internal function that asks the user given question. In headless mode the answer is the one defined in policy
+        :param question_id: str, key of the policy option that answers the question
+        :param title: str
+        :param msg: str
+        :return: bool
+        """
+
+        if self._headless:
+            answer = bool(self._policy.get(question_id, False))
+            self._emit_event('question', id=question_id, title=title, message=msg, answer=answer)
+            return answer
+
+        res = QMessageBox.question(
+            self._splash, title, msg, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+
+        return res == QMessageBox.Yes
+
+    def _show_message(self, title, msg, level='info'):
+        """
+        Internal function that shows a message to the user
+        :param title: str
+        :param msg: str
+        :param level: str, info, warning or error
+        """
+
+        if self._headless:
+            self._emit_event('message', level=level, title=title, message=msg)
+            return
+
+        show_fn = {'warning': QMessageBox.warning, 'error': QMessageBox.critical}.get(level, QMessageBox.information)
+        show_fn(self._splash, title, msg)
+
+    def _show_error_details(self, details):
+        """
+        Internal function that shows detailed error information (for example, an exception traceback)
+        :param details: str
+        """
+
+        if self._headless:
+            self._emit_event('message', level='error', title='Error', message=details)
+            return
+
+        error_dlg = AppErrorDialog(details)
+        error_dlg.exec_()
+
+    def _exit(self, valid):
+        """
+        Internal function that closes the updater. In headless mode, process exit code and last event tell if
+        installation is valid
+        :param valid: bool
+        """
+
+        if not self._headless:
+            sys.exit()
+
+        if valid:
+            self._wait_bytecode_warmup()
+        self._emit_event(
+            'finished', valid=bool(valid), tag=getattr(self, '_deploy_tag', None),
+            install_path=getattr(self, '_install_path', None),
+            venv_python=self._venv_info.get('venv_python', None))
+        sys.exit(0 if valid else 1)
+
     def _setup_ui(self):
         splash_pixmap = QPixmap(self._splash_path)
         self._splash = ArtellaSplash(splash_pixmap)
@@ -569,6 +2133,10 @@ class ArtellaUpdater(QWidget, object):
             LOGGER.warning('Impossible to remove "{}"'.format(folder))
             return
 
+        if self._remove_folder(folder, wait=False):
+            os.makedirs(folder)
+            return
+
         for the_file in os.listdir(folder):
             file_path = os.path.join(folder, the_file)
             try:
@@ -579,6 +2147,76 @@ class ArtellaUpdater(QWidget, object):
             except Exception as e:
                 print(e)
 
+    def _remove_folder(self, folder, wait=False):
+        """
+        Internal function that removes given folder.
+        Folder is renamed into a trash folder located next to it, so the operation returns instantly, and its contents
+        are removed in background. Trash contents that are not removed before the app is closed are removed during next
+        app launch
+        :param folder: str
+        :param wait: bool, Whether to wait until the folder is completely removed
+        :return: bool
+        """
+
+        folder = os.path.normpath(folder)
+        if not os.path.isdir(folder):
+            return False
+
+        trash_folder = os.path.join(os.path.dirname(folder), TRASH_FOLDER_NAME)
+        trash_path = os.path.join(trash_folder, '{}_{}_{}'.format(
+            os.path.basename(folder), int(time.time() * 1000), os.getpid()))
+        try:
+            if not os.path.isdir(trash_folder):
+                os.makedirs(trash_folder)
+            os.rename(folder, trash_path)
+        except OSError as exc:
+            LOGGER.warning('Impossible to move "{}" to trash folder: {}. Removing it ...'.format(folder, exc))
+            shutil.rmtree(folder, onerror=_on_remove_error)
+            return not os.path.isdir(folder)
+
+        trash_folders = (self._get_config_data(show_error=False) or dict()).get('trash_folders', list())
+        if trash_folder not in trash_folders:
+            self._set_config('trash_folders', trash_folders + [trash_folder])
+
+        LOGGER.info('Removing folder "{}" in background ...'.format(folder))
+        remove_thread = remove_folders_in_background([trash_path])
+        if wait:
+            remove_thread.join()
+            # Trash folder is only removed if no other folder is being removed
+            try:
+                os.rmdir(trash_folder)
+            except OSError:
+                pass
+
+        return not os.path.isdir(trash_path) if wait else True
+
+    @traced('clean_trash')
+    def _clean_trash(self):
+        """
+        Internal function that removes in background the contents of the trash folders that were not removed
+        during previous executions of the app
+        """
+
+        trash_folders = (self._get_config_data(show_error=False) or dict()).get('trash_folders', list())
+        if not trash_folders:
+            return
+
+        folders_to_remove = list()
+        valid_trash_folders = list()
+        for trash_folder in trash_folders:
+            if not os.path.isdir(trash_folder):
+                continue
+            valid_trash_folders.append(trash_folder)
+            folders_to_remove.extend([os.path.join(trash_folder, name) for name in os.listdir(trash_folder)])
+        if valid_trash_folders != trash_folders:
+            self._set_config('trash_folders', valid_trash_folders)
+        if not folders_to_remove:
+            return
+
+        LOGGER.info('Removing {} folders from trash in background ...'.format(len(folders_to_remove)))
+        remove_folders_in_background(folders_to_remove)
+
+    @traced('setup_environment')
     def _setup_environment(self, clean=False):
 
         if not self._install_path:
@@ -603,13 +2241,30 @@ class ArtellaUpdater(QWidget, object):
             self._create_venv(force=True)
         self._force_venv = orig_force_env
 
+        venv_info = self._get_venv_info(venv_path)
+
+        self._venv_info = venv_info
+
+        LOGGER.info("Virtual Environment Info: {}".format(venv_info))
+
+        # TODO: Check that all info contained in venv_info is valid
+
+        return True
+
+    def _get_venv_info(self, venv_path):
+        """
+        Internal function that returns the paths of the executables of given virtual environment
+        :param venv_path: str
+        :return: dict
+        """
+
         root_path = os.path.dirname(venv_path)
 
         if is_windows():
             venv_scripts = os.path.join(venv_path, 'Scripts')
             venv_python = os.path.join(venv_scripts, 'python.exe')
             pip_exe = os.path.join(venv_scripts, 'pip.exe')
-        elif is_mac():
+        else:
             venv_scripts = os.path.join(venv_path, 'bin')
             venv_python = os.path.join(venv_scripts, 'python')
             pip_exe = os.path.join(venv_scripts, 'pip')
@@ -621,13 +2276,7 @@ class ArtellaUpdater(QWidget, object):
         venv_info['venv_python'] = venv_python
         venv_info['pip_exe'] = pip_exe
 
-        self._venv_info = venv_info
-
-        LOGGER.info("Virtual Environment Info: {}".format(venv_info))
-
-        # TODO: Check that all info contained in venv_info is valid
-
-        return True
+        return venv_info
 
     def _close_processes(self):
         """
@@ -640,6 +2289,19 @@ class ArtellaUpdater(QWidget, object):
                 LOGGER.debug('Killing Python process: {}'.format(proc.name()))
                 proc.kill()
 
+    def _get_instance_name(self):
+        """
+        Returns name used to identify running instances of the app for current user
+        :return: str
+        """
+
+        try:
+            user_name = getpass.getuser()
+        except Exception:
+            user_name = os.path.basename(os.path.expanduser('~'))
+
+        return '{}-{}'.format(self._get_app_name(), user_name)
+
     def _get_app_name(self):
         """
         Returns name of the app
@@ -660,69 +2322,84 @@ class ArtellaUpdater(QWidget, object):
             os.makedirs(logger_path)
 
         if not os.path.isdir(logger_path):
-            QMessageBox.critical(
-                self,
+            self._show_message(
                 'Impossible to retrieve app data folder',
                 'Impossible to retrieve app data folder.\n\n'
-                'Please contact TD.'
-            )
+                'Please contact TD.', level='error')
             return
 
         return logger_path
 
+    @traced('check_setup')
     def _check_setup(self):
         """
         Internal function that checks if environment is properly configured
         """
 
+        # All the tools are checked at the same time
+        probes = dict((probe_name, self._start_probe(probe_name)) for probe_name in SETUP_PROBES)
+        try:
+            return self._check_probes(probes)
+        finally:
+            for probe in probes.values():
+                if probe and probe.is_running():
+                    probe.cancel()
+                    probe.wait()
+
+    def _check_probes(self, probes):
+        """
+        Internal function that checks the results of the setup probes
+        :param probes: dict(str, ArtellaProcess)
+        :return: bool
+        """
+
         self._set_splash_text('Checking if Python is installed ...')
 
-        if not self.is_python_installed():
+        if not self._wait_probe(probes['python']):
             LOGGER.warning('No Python Installation found!')
-            QMessageBox.warning(
-                self,
+            self._show_message(
                 'No Python Installation found in {}'.format(self.get_current_os()),
                 'No valid Python installation found in your computer.\n\n'
                 'Please follow instructions in {0} Documentation to install Python in your computer\n\n'
-                'Click "Ok" to open {0} Documentation in your web browser'.format(self._project_name)
-            )
-            webbrowser.open(self._get_default_documentation_url())
+                'Click "Ok" to open {0} Documentation in your web browser'.format(self._project_name),
+                level='warning')
+            if not self._headless:
+                webbrowser.open(self._get_default_documentation_url())
             return False
 
         self._set_splash_text('Checking if pip is installed ...')
 
-        if not self.is_pip_installed():
+        if not self._wait_probe(probes['pip']):
             LOGGER.warning('No pip Installation found!')
-            QMessageBox.warning(
-                self,
+            self._show_message(
                 'No pip Installation found in {}'.format(self.get_current_os()),
                 'No valid pip installation found in your computer.\n\n'
                 'Please follow instructions in {0} Documentation to install Python in your computer\n\n'
-                'Click "Ok" to open {0} Documentation in your web browser'.format(self._project_name)
-            )
-            webbrowser.open(self._get_default_documentation_url())
+                'Click "Ok" to open {0} Documentation in your web browser'.format(self._project_name),
+                level='warning')
+            if not self._headless:
+                webbrowser.open(self._get_default_documentation_url())
             return False
 
         self._set_splash_text('Checking if virtualenv is installed ...')
 
-        if not self.is_virtualenv_installed():
+        if not self._wait_probe(probes['virtualenv']):
             LOGGER.warning('No virtualenv Installation found!')
             LOGGER.info('Installing virtualenv ...')
-            process = self._run_subprocess(commands_list=['pip', 'install', 'virtualenv'])
-            process.wait()
+            self._wait_process(self._start_process(
+                commands_list=['pip', 'install', 'virtualenv'], timeout=PIP_INSTALL_TIMEOUT))
             if not self.is_virtualenv_installed():
                 LOGGER.warning('Impossible to install virtualenv using pip.')
-                QMessageBox.warning(
-                    self,
+                self._show_message(
                     'Impossible to install virtualenv in {}'.format(self.get_current_os()),
                     'Was not possible to install virtualenv in your computer.\n\n'
-                    'Please contact your project TD.'
-                )
+                    'Please contact your project TD.', level='warning')
                 return False
             LOGGER.info('virtualenv installed successfully!')
 
         return True
 
+    @traced('init_tags_combo')
     def _init_tags_combo(self):
         all_releases = self._get_all_releases()
         try:
@@ -746,6 +2423,21 @@ class ArtellaUpdater(QWidget, object):
         Internal function that initializes Artella App
         """
 
+        self._loading = True
+        try:
+            with self._trace_span('load', clean=clean):
+                return self._load_app(clean=clean)
+        finally:
+            self._loading = False
+            self._save_trace()
+            if self._instance_messages:
+                QTimer.singleShot(0, self._process_instance_messages)
+
+    def _load_app(self, clean=False):
+        """
+        Internal function that executes all the steps needed to initialize Artella App
+        """
+
         valid_check = self._check_setup()
         if not valid_check:
             return False
@@ -769,6 +2461,8 @@ class ArtellaUpdater(QWidget, object):
         valid_install = self._setup_deployment()
         if not valid_install:
             return False
+        if self._export_snapshot and not self._export_venv_snapshot():
+            return False
         valid_artella = self._setup_artella()
         if not valid_artella:
             self._artella_status_icon.setPixmap(QPixmap(self._get_resource('artella_error.png')).scaled(QSize(30, 30)))
@@ -799,15 +2493,16 @@ class ArtellaUpdater(QWidget, object):
             else:
                 self._refresh_tag_btn.setVisible(True)
         else:
-            QMessageBox.warning(
-                self,
+            self._show_message(
                 'Was not possible to install {} environment.'.format(self._project_name),
                 'Was not possible to install {} environment.\n\n'
                 'Relaunch the app. If the problem persists, please contact your project TD'.format(
-                    self._project_name))
+                    self._project_name), level='warning')
+            return not self._headless
 
         return True
 
+    @traced('launch')
     def launch(self):
 
         if not self._venv_info:
@@ -820,6 +2515,8 @@ class ArtellaUpdater(QWidget, object):
         if not self._script_path or not os.path.isfile(self._script_path):
             raise Exception('Impossible to find launcher script!')
 
+        self._wait_bytecode_warmup(timeout=BYTECODE_LAUNCH_TIMEOUT)
+
         LOGGER.info('Executing {} Launcher ...'.format(self._project_name))
 
         paths_to_register = self._get_paths_to_register()
@@ -832,7 +2529,13 @@ class ArtellaUpdater(QWidget, object):
 
         if self._dev:
             process_cmd += ' --dev'
-        process = self._run_subprocess(command=process_cmd, close_fds=True)
+        with self._trace_span('launch_launcher', 'subprocess', command=process_cmd):
+            process = self._run_subprocess(command=process_cmd, close_fds=True)
+
+        self._start_prefetch()
+
+        # Saved once launch span is closed
+        QTimer.singleShot(0, self._save_trace)
 
         self._splash.close()
 
@@ -853,6 +2556,7 @@ class ArtellaUpdater(QWidget, object):
 
         return True
 
+    @traced('set_installation_path')
     def _set_installation_path(self):
         """
         Returns installation path is if it already set by user; Otherwise a dialog to select it will appear
@@ -861,6 +2565,8 @@ class ArtellaUpdater(QWidget, object):
 
         path_updated = False
         install_path = self._get_installation_path()
+        if install_path is None:
+            return None
 
         # Remove older installations
         self._set_splash_text('Searching old installation ...')
@@ -883,33 +2589,32 @@ class ArtellaUpdater(QWidget, object):
             LOGGER.info("Old installation found. Removing ...")
             self._set_config(self.install_env_var, '')
             self._set_splash_text('Removing old installation ...')
-            res = QMessageBox.question(
-                self._splash, 'Old installation found',
-                'All the contents in the following folder wil be removed: \n\t{}\n\nDo you want to continue?'.format(
-                    install_path), QMessageBox.StandardButton.Yes, QMessageBox.StandardButton.No)
-            if res == QMessageBox.Yes:
+            if self._ask_question(
+                    'remove_installation', 'Old installation found',
+                    'All the contents in the following folder wil be removed: \n\t{}\n\n'
+                    'Do you want to continue?'.format(install_path)):
                 shutil.rmtree(install_path)
-            QMessageBox.information(
-                self._splash,
-                'Relaunch the tool',
-                'Next time you launch the tool you will need to select a new installation path')
+            self._show_message(
+                'Relaunch the tool', 'Next time you launch the tool you will need to select a new installation path')
             return False
 
-        if not install_path or not os.path.isdir(install_path):
+        policy_path = self._policy['install_path'] if self._headless else None
+        if policy_path and os.path.normpath(policy_path) != os.path.normpath(install_path or ''):
+            if not os.path.isdir(policy_path):
+                os.makedirs(policy_path)
+            install_path = policy_path
+            path_updated = True
+        elif not install_path or not os.path.isdir(install_path):
             self._set_splash_text('Select {} installation folder ...'.format(self._project_name))
-            install_path = QFileDialog.getExistingDirectory(
+            install_path = None if self._headless else QFileDialog.getExistingDirectory(
                 None, 'Select Installation Path for {}'.format(self._project_name))
             if not install_path:
                 LOGGER.info('Installation cancelled by user')
-                QMessageBox.information(
-                    self._splash,
-                    'Installation cancelled',
-                    'Installation cancelled by user')
+                self._show_message('Installation cancelled', 'Installation cancelled by user')
                 return False
             if not os.path.isdir(install_path):
                 LOGGER.info('Selected Path does not exist!')
-                QMessageBox.information(
-                    self,
+                self._show_message(
                     'Selected Path does not exist',
                     'Selected Path: "{}" does not exist. '
                     'Installation cancelled!'.format(install_path))
@@ -983,6 +2688,7 @@ class ArtellaUpdater(QWidget, object):
 
         return True
 
+    @traced('setup_config')
     def _setup_config(self):
         """
         Internal function that creates an empty configuration file if it is not already created
@@ -991,22 +2697,34 @@ class ArtellaUpdater(QWidget, object):
 
         self._clean_old_config()
 
-        config_file = self._get_config_path()
+        config_store = self._get_config_store()
+        config_file = config_store.config_path
         if not os.path.isfile(config_file):
             LOGGER.info('Creating {} App Configuration File: {}'.format(self._project_name, config_file))
-            with open(config_file, 'w') as cfg:
-                json.dump({}, cfg)
+            try:
+                config_store.load(force=True)
+                config_store.flush()
+            except RuntimeError as exc:
+                LOGGER.error(str(exc))
             if not os.path.isfile(config_file):
-                QMessageBox.critical(
-                    self,
+                self._show_message(
                     'Impossible to create configuration file',
                     'Impossible to create configuration file.\n\n'
-                    'Please contact TD.'
-                )
+                    'Please contact TD.', level='error')
                 return
 
         LOGGER.info('Configuration File found: "{}"'.format(config_file))
 
+        # Invalid configuration files are not replaced by an empty one, because that would force a reinstall
+        try:
+            config_store.load(force=True)
+        except (ValueError, RuntimeError) as exc:
+            self._show_message(
+                'Impossible to read configuration file',
+                '{}\n\nFix or remove the file and relaunch the app. '
+                'If the problem persists, please contact your project TD'.format(exc), level='error')
+            return
+
         return config_file
 
     def _get_installation_path(self):
@@ -1021,7 +2739,9 @@ class ArtellaUpdater(QWidget, object):
             else:
                 install_path = os.path.dirname(sys.executable)
         else:
-            config_data = self.get_config_data()
+            config_data = self._get_config_data()
+            if config_data is None:
+                return None
             install_path = config_data.get(self.install_env_var, '')
 
         return install_path
@@ -1041,10 +2761,11 @@ class ArtellaUpdater(QWidget, object):
         :return: str
         """
 
+        mirror_url = self._mirror_url.rstrip('/')
         if release:
-            return 'https://github.com/{}/releases'.format(self._repository)
+            return '{}/{}/releases'.format(mirror_url, self._repository)
         else:
-            return 'https://github.com/{}/archive/{}.tar.gz'.format(self._repository, self._deploy_tag)
+            return '{}/{}/archive/{}.tar.gz'.format(mirror_url, self._repository, self._deploy_tag)
 
     def _sanitize_github_version(self, version):
         """extract what appears to be the version information"""
@@ -1054,6 +2775,7 @@ class ArtellaUpdater(QWidget, object):
         else:
             return version.strip()
 
+    @traced('get_all_releases')
     def _get_all_releases(self):
         """
         Internal function that returns a list with all released versions of the deploy repository taking into account
@@ -1066,17 +2788,13 @@ class ArtellaUpdater(QWidget, object):
 
         all_versions = list()
 
-        repository = self._get_deploy_repository_url(release=True)
-        if not repository:
-            msg = '> Project {} GitHub repository is not valid! {}'.format(self._project_name.title(), repository)
+        release_url = self._get_deploy_repository_url(release=True)
+        if not release_url:
+            msg = '> Project {} GitHub repository is not valid! {}'.format(self._project_name.title(), release_url)
             self._show_error(msg)
             return None
 
-        if repository.startswith('https://github.com/'):
-            repository = "/".join(repository.split('/')[3:5])
-
-        release_url = "https://github.com/{}/releases".format(repository)
-        response = requests.get(release_url, headers={'Connection': 'close'})
+        response = self._http_get(release_url)
         html = response.text
         LOGGER.debug('Parsing HTML of {} GitHub release page ...'.format(self._project_name.title()))
 
@@ -1101,6 +2819,7 @@ class ArtellaUpdater(QWidget, object):
 
         return all_versions
 
+    @traced('get_deploy_tag')
     def _get_deploy_tag(self):
         """
         Internal function that returns the current tag that should be used for deployment
@@ -1110,11 +2829,14 @@ class ArtellaUpdater(QWidget, object):
         if self._dev:
             return 'DEV'
 
-        config_data = self.get_config_data()
+        config_data = self._get_config_data()
+        if config_data is None:
+            return None
         deploy_tag = config_data.get('tag', '')
         latest_deploy_tag = self._get_latest_deploy_tag()
         if not latest_deploy_tag:
             return None
+        self._latest_deploy_tag = latest_deploy_tag
 
         if not deploy_tag:
             deploy_tag = latest_deploy_tag
@@ -1122,11 +2844,10 @@ class ArtellaUpdater(QWidget, object):
         deploy_tag_v = Version(deploy_tag)
         latest_tag_v = Version(latest_deploy_tag)
         if latest_tag_v > deploy_tag_v:
-            res = QMessageBox.question(
-                self._splash, 'Newer version found: {}'.format(latest_deploy_tag),
-                'Current Version: {}\nNew Version: {}\n\nDo you want to install new version?'.format(
-                    deploy_tag, latest_deploy_tag), QMessageBox.StandardButton.Yes, QMessageBox.StandardButton.No)
-            if res == QMessageBox.Yes:
+            if self._ask_question(
+                    'accept_latest', 'Newer version found: {}'.format(latest_deploy_tag),
+                    'Current Version: {}\nNew Version: {}\n\nDo you want to install new version?'.format(
+                        deploy_tag, latest_deploy_tag)):
                 self._set_config('tag', latest_deploy_tag)
                 deploy_tag = latest_deploy_tag
 
@@ -1134,6 +2855,7 @@ class ArtellaUpdater(QWidget, object):
 
         return deploy_tag
 
+    @traced('get_latest_deploy_tag')
     def _get_latest_deploy_tag(self, sniff=True, validate=True, format='version', pre=False):
         """
         Returns last deployed version of the given repository in GitHub
@@ -1149,18 +2871,14 @@ class ArtellaUpdater(QWidget, object):
         description = None
         data = None
 
-        repository = self._get_deploy_repository_url(release=True)
-        if not repository:
-            msg = '> Project {} GitHub repository is not valid! {}'.format(self._project_name.title(), repository)
+        release_url = self._get_deploy_repository_url(release=True)
+        if not release_url:
+            msg = '> Project {} GitHub repository is not valid! {}'.format(self._project_name.title(), release_url)
             self._show_error(msg)
             return None
 
-        if repository.startswith('https://github.com/'):
-            repository = "/".join(repository.split('/')[3:5])
-
         if sniff:
-            release_url = "https://github.com/{}/releases".format(repository)
-            response = requests.get(release_url, headers={'Connection': 'close'})
+            response = self._http_get(release_url)
             html = response.text
             LOGGER.debug('Parsing HTML of {} GitHub release page ...'.format(self._project_name.title()))
 
@@ -1255,69 +2973,680 @@ class ArtellaUpdater(QWidget, object):
             data['description'] = description
             return json.dumps(data)
 
-    def _get_default_install_env_var(self):
+    def _get_default_install_env_var(self):
+        """
+        Internal function that returns a default env var
+        :return: str
+        """
+
+        return '{}_install'.format(self.get_clean_name())
+
+    def _get_config_path(self):
+        """
+        Internal function that returns path where configuration file is located
+        :return: str
+        """
+
+        config_name = self._get_app_name()
+        config_path = self._get_app_folder()
+        config_file = os.path.normpath(os.path.join(config_path, '{}.cfg'.format(config_name)))
+
+        return config_file
+
+    def _get_config_store(self):
+        """
+        Internal function that returns the store used to read and write configuration file
+        :return: ArtellaConfigStore
+        """
+
+        if self._config_store is None:
+            self._config_store = ArtellaConfigStore(self._get_config_path())
+
+        return self._config_store
+
+    def _set_config(self, config_name, config_value):
+        """
+        Sets configuration and updates the file
+        :param config_name: str
+        :param config_value: object
+        """
+
+        config_store = self._get_config_store()
+        if not os.path.isfile(config_store.config_path):
+            LOGGER.warning(
+                'Impossible to update configuration file because it does not exists: "{}"'.format(
+                    config_store.config_path))
+            return False
+
+        try:
+            config_store.set(config_name, config_value)
+        except (ValueError, RuntimeError) as exc:
+            LOGGER.error('Impossible to update configuration file: {}'.format(exc))
+            return False
+
+        return True
+
+    @traced('create_venv')
+    def _create_venv(self, force=False):
+        """
+        Internal function that creates virtual environment
+        :param force: bool
+        :return: bool
+        """
+
+        venv_path = self._get_venv_folder_path()
+
+        if self._check_venv_folder_exists() and not force:
+            LOGGER.info('Virtual Environment already exists: "{}"'.format(venv_path))
+            return True
+
+        if force and self._check_venv_folder_exists() and os.path.isdir(venv_path):
+            LOGGER.info('Forcing the removal of Virtual Environment folder: "{}"'.format(venv_path))
+            self._set_splash_text('Removing already existing virtual environment ...')
+            self._remove_folder(venv_path)
+
+        if self._import_venv_snapshot(venv_path):
+            return True
+
+        template_path = self._get_venv_template_path()
+        if self._is_valid_venv_template(template_path):
+            self._set_splash_text('Cloning Virtual Environment: "{}"'.format(venv_path))
+            try:
+                self._clone_venv(template_path, venv_path)
+                LOGGER.info('Virtual Environment cloned from template: "{}"'.format(template_path))
+                return True
+            except Exception as exc:
+                LOGGER.warning('Impossible to clone Virtual Environment template "{}": {}'.format(template_path, exc))
+                if os.path.isdir(venv_path):
+                    shutil.rmtree(venv_path, ignore_errors=True)
+
+        # Virtual environment is created with the interpreter used to identify templates and snapshots
+        venv_cmd = ['virtualenv', venv_path]
+        python_executable = self._get_python_info().get('executable', None)
+        if python_executable:
+            venv_cmd[1:1] = ['-p', python_executable]
+
+        self._set_splash_text('Creating Virtual Environment: "{}"'.format(venv_path))
+        with self._trace_span('virtualenv', 'subprocess', venv_path=venv_path) as span_args:
+            returncode = self._wait_process(self._start_process(commands_list=venv_cmd, timeout=VENV_CREATE_TIMEOUT))
+            span_args['returncode'] = returncode
+
+        return True if returncode == 0 else False
+
+    def _get_python_info(self):
+        """
+        Internal function that returns the executable and the full version of the Python used to create virtual
+        environments
+        :return: dict
+        """
+
+        if not self._python_info:
+            try:
+                with self._trace_span('python_version', 'subprocess'):
+                    process = self._start_process(
+                        commands_list=[
+                            'python', '-c',
+                            'import sys; print(sys.executable); print(".".join(map(str, sys.version_info[:3])))'],
+                        timeout=SETUP_PROBE_TIMEOUT, keep_output=True)
+                    returncode = self._wait_process(process)
+                output = (process.output or '').strip().splitlines()
+                if returncode == 0 and len(output) == 2:
+                    self._python_info = {
+                        'executable': os.path.normpath(output[0].strip()), 'version': output[1].strip()}
+            except Exception as exc:
+                LOGGER.warning('Impossible to retrieve Python version: {}'.format(exc))
+
+        return self._python_info or dict()
+
+    def _get_python_version(self):
+        """
+        Internal function that returns the major and minor version of the Python used to create virtual environments
+        :return: str
+        """
+
+        python_version = self._get_python_info().get('version', None)
+        if not python_version:
+            return None
+
+        return '.'.join(python_version.split('.')[:2])
+
+    def _get_venv_template_path(self):
+        """
+        Internal function that returns path where virtual environment template for current Python version is located
+        :return: str
+        """
+
+        python_version = self._get_python_version()
+        if not python_version:
+            return None
+
+        return os.path.join(
+            self._get_app_folder(), 'venv_templates', 'py{}-v{}'.format(python_version, VENV_TEMPLATE_VERSION))
+
+    def _is_valid_venv_template(self, template_path):
+        """
+        Internal function that returns whether given folder is a valid virtual environment template or not.
+        Templates are only valid if they were created with the same Python used to create virtual environments
+        :param template_path: str
+        :return: bool
+        """
+
+        template_file = os.path.join(template_path, VENV_TEMPLATE_FILE_NAME) if template_path else None
+        if not template_file or not os.path.isfile(template_file):
+            return False
+
+        try:
+            with open(template_file, 'r') as template_data_file:
+                template_data = json.load(template_data_file)
+        except Exception:
+            return False
+
+        python_info = self._get_python_info()
+
+        return bool(python_info) and template_data.get('python_executable') == python_info['executable'] and \
+            template_data.get('python_full_version') == python_info['version']
+
+    def _get_requirements_hash(self, requirements_path=None):
+        """
+        Internal function that returns hash of the contents of given requirements file
+        :param requirements_path: str, if not given, current requirements file is used
+        :return: str
+        """
+
+        requirements_path = requirements_path or self._requirements_path
+        if not requirements_path or not os.path.isfile(requirements_path):
+            return None
+
+        with open(requirements_path, 'rb') as requirements_file:
+            return hashlib.sha1(requirements_file.read()).hexdigest()
+
+    @traced('update_venv_template')
+    def _update_venv_template(self):
+        """
+        Internal function that stores current virtual environment as the template used to create new ones.
+        Template is only updated if it does not exist or if it was created with other requirements
+        :return: bool
+        """
+
+        venv_path = self._get_venv_folder_path()
+        template_path = self._get_venv_template_path()
+        requirements_hash = self._requirements_hash
+        if not template_path or not venv_path or not os.path.isdir(venv_path):
+            return False
+
+        template_file = os.path.join(template_path, VENV_TEMPLATE_FILE_NAME)
+        if self._is_valid_venv_template(template_path):
+            try:
+                with open(template_file, 'r') as template_data_file:
+                    template_data = json.load(template_data_file)
+                if template_data.get('requirements_hash') == requirements_hash:
+                    return True
+            except Exception:
+                pass
+
+        self._set_splash_text('Updating Virtual Environment template ...')
+        new_template_path = '{}.{}.tmp'.format(template_path, os.getpid())
+        try:
+            if os.path.isdir(new_template_path):
+                shutil.rmtree(new_template_path)
+            self._clone_venv(venv_path, new_template_path)
+            with open(os.path.join(new_template_path, VENV_TEMPLATE_FILE_NAME), 'w') as template_data_file:
+                json.dump({
+                    'python_version': self._get_python_version(),
+                    'python_executable': self._get_python_info().get('executable', None),
+                    'python_full_version': self._get_python_info().get('version', None),
+                    'template_version': VENV_TEMPLATE_VERSION,
+                    'requirements_hash': requirements_hash,
+                    'tag': self._deploy_tag
+                }, template_data_file)
+            if os.path.isdir(template_path):
+                self._remove_folder(template_path)
+            os.rename(new_template_path, template_path)
+        except Exception as exc:
+            LOGGER.warning('Impossible to update Virtual Environment template "{}": {}'.format(template_path, exc))
+            if os.path.isdir(new_template_path):
+                shutil.rmtree(new_template_path, ignore_errors=True)
+            return False
+
+        LOGGER.info('Virtual Environment template updated: "{}"'.format(template_path))
+
+        return True
+
+    def _clone_venv(self, source_path, target_path, source_prefix=None):
+        """
+        Internal function that clones given virtual environment into target path.
+        Files are copied (not linked), so changes done in the clone never reach the source virtual environment. Text
+        files that contain the absolute path of the source virtual environment (activation scripts, script shebangs,
+        .pth files) and the shebang of Windows console script launchers are relocated to the target path
+        :param source_path: str
+        :param target_path: str, it can be an already existing empty folder
+        :param source_prefix: str, path of the virtual environment when it was created, if it was moved after that
+        """
+
+        source_path = os.path.normpath(os.path.abspath(source_path))
+        target_path = os.path.normpath(os.path.abspath(target_path))
+        source_prefix = os.path.normpath(source_prefix) if source_prefix else source_path
+        source_path_bytes = source_prefix.encode('utf-8')
+        target_path_bytes = target_path.encode('utf-8')
+        scripts_folders = [os.path.join(source_path, 'Scripts'), os.path.join(source_path, 'bin')]
+        relocate_extensions = ('.pth', '.egg-link', '.cfg')
+        # Console script launchers are an executable stub followed by a shebang line and a zip with the script
+        launcher_shebang_regex = re.compile(b'#!"?' + re.escape(source_path_bytes) + b'[^\r\n]*')
+
+        def _relocate(src, dst):
+            with open(src, 'rb') as src_file:
+                data = src_file.read()
+            if source_path_bytes not in data:
+                return False
+            if b'\0' in data[:1024]:
+                shebang_match = None
+                if src.lower().endswith('.exe'):
+                    for shebang_match in launcher_shebang_regex.finditer(data):
+                        pass
+                if not shebang_match:
+                    return False
+                shebang = shebang_match.group(0).replace(source_path_bytes, target_path_bytes)
+                data = data[:shebang_match.start()] + shebang + data[shebang_match.end():]
+            else:
+                data = data.replace(source_path_bytes, target_path_bytes)
+            with open(dst, 'wb') as dst_file:
+                dst_file.write(data)
+            shutil.copymode(src, dst)
+            return True
+
+        def _copy(src, dst):
+            if os.path.islink(src):
+                link_target = os.readlink(src)
+                if link_target.startswith(source_prefix):
+                    link_target = target_path + link_target[len(source_prefix):]
+                os.symlink(link_target, dst)
+                return
+            shutil.copy2(src, dst)
+
+        if not os.path.isdir(target_path):
+            os.makedirs(target_path)
+        elif os.listdir(target_path):
+            raise OSError(errno.EEXIST, 'Target folder is not empty', target_path)
+        for root, dirs, files in os.walk(source_path):
+            target_root = os.path.join(target_path, os.path.relpath(root, source_path))
+            relocate_folder = root in scripts_folders
+            for dir_name in dirs:
+                src = os.path.join(root, dir_name)
+                dst = os.path.join(target_root, dir_name)
+                if os.path.islink(src):
+                    _copy(src, dst)
+                else:
+                    os.mkdir(dst)
+            for file_name in files:
+                if root == source_path and file_name == VENV_TEMPLATE_FILE_NAME:
+                    continue
+                src = os.path.join(root, file_name)
+                dst = os.path.join(target_root, file_name)
+                if not os.path.islink(src) and (relocate_folder or file_name.endswith(relocate_extensions)):
+                    if _relocate(src, dst):
+                        continue
+                _copy(src, dst)
+
+    def _get_prefetch_folder(self):
+        """
+        Internal function that returns folder where deployments of newer tags are staged
+        :return: str
+        """
+
+        return os.path.join(self._get_app_folder(), PREFETCH_FOLDER_NAME, self.get_clean_name())
+
+    def _get_prefetched_release_path(self, tag):
+        """
+        Internal function that returns the folder where given tag was staged in background, if it is valid
+        :param tag: str
+        :return: str or None
+        """
+
+        if self._dev or not tag:
+            return None
+
+        prefetch_path = os.path.join(self._get_prefetch_folder(), tag)
+        manifest_path = os.path.join(prefetch_path, PREFETCH_MANIFEST_FILE_NAME)
+        if not os.path.isfile(manifest_path):
+            return None
+        try:
+            with open(manifest_path, 'r') as manifest_file:
+                manifest = json.load(manifest_file)
+        except Exception as exc:
+            LOGGER.warning('Impossible to read staged deployment manifest "{}": {}'.format(manifest_path, exc))
+            return None
+        if manifest.get('tag') != tag or manifest.get('python_version') != self._get_python_version():
+            return None
+        requirements_hash = self._get_requirements_hash(os.path.join(prefetch_path, self._requirements_file_name))
+        if not requirements_hash or manifest.get('requirements_hash') != requirements_hash:
+            LOGGER.warning('Staged requirements file of {} does not match its manifest. Ignoring it'.format(tag))
+            return None
+
+        return prefetch_path
+
+    def _clean_prefetched_releases(self):
+        """
+        Internal function that removes staged deployments of tags older than current one. Current one is kept because
+        its requirements file is the one used by current installation. Temporary folders are only removed if the
+        prefetch process that created them is not running anymore
+        """
+
+        prefetch_folder = self._get_prefetch_folder()
+        if not os.path.isdir(prefetch_folder):
+            return
+
+        try:
+            current_version = Version(self._deploy_tag)
+        except (InvalidVersion, TypeError):
+            return
+        for folder_name in os.listdir(prefetch_folder):
+            folder_path = os.path.join(prefetch_folder, folder_name)
+            temp_match = PREFETCH_TEMP_FOLDER_REGEX.match(folder_name)
+            if temp_match:
+                outdated = self._is_prefetch_temp_folder_abandoned(folder_path, int(temp_match.group(1)))
+            else:
+                try:
+                    outdated = Version(folder_name) < current_version
+                except InvalidVersion:
+                    outdated = False
+            if outdated:
+                self._remove_folder(folder_path)
+
+    def _is_prefetch_temp_folder_abandoned(self, folder_path, pid):
+        """
+        Internal function that returns whether given temporary prefetch folder was left by an interrupted prefetch.
+        Age is also checked because pid may have been reused by another process
+        :param folder_path: str
+        :param pid: int
+        :return: bool
+        """
+
+        if pid != os.getpid() and psutil.pid_exists(pid):
+            return False
+        try:
+            return time.time() - os.path.getmtime(folder_path) > PREFETCH_TEMP_MAX_AGE
+        except OSError:
+            return False
+
+    def _start_prefetch(self):
+        """
+        Internal function that launches a background process that stages the deployment of the newest tag, if it is
+        newer than the one being used. Process keeps running once updater is closed
+        :return: bool
+        """
+
+        latest_tag = self._latest_deploy_tag
+        if self._dev or self._headless or not latest_tag or latest_tag == self._deploy_tag:
+            return False
+        try:
+            if Version(latest_tag) <= Version(self._deploy_tag):
+                return False
+        except InvalidVersion:
+            return False
+        if self._get_prefetched_release_path(latest_tag):
+            return False
+
+        commands_list = [sys.executable] if hasattr(sys, 'frozen') else [sys.executable, os.path.abspath(__file__)]
+        commands_list.extend([
+            '--headless', '--prefetch', '--tag', latest_tag, '--project-name', self._project_name,
+            '--project-type', self._project_type, '--version', self._app_version, '--repository', self._repository,
+            '--mirror-url', self._mirror_url])
+        if self._splash_path:
+            commands_list.extend(['--splash-path', self._splash_path])
+        LOGGER.info('Staging deployment of {} in background: {}'.format(latest_tag, commands_list))
+        try:
+            self._run_subprocess(commands_list=commands_list, close_fds=True)
+        except OSError as exc:
+            LOGGER.warning('Impossible to stage deployment of {} in background: {}'.format(latest_tag, exc))
+            return False
+
+        return True
+
+    @traced('prefetch_release')
+    def _prefetch_release(self):
+        """
+        Internal function that stages the deployment of current tag, so it can be installed without waiting for
+        downloads: requirements file is extracted and requirements wheels are downloaded using the Python of the
+        current virtual environment. Staged folder is moved into place once it is complete
+        :return: bool
+        """
+
+        if self._get_prefetched_release_path(self._deploy_tag):
+            LOGGER.info('Deployment of {} already staged'.format(self._deploy_tag))
+            return True
+
+        self._install_path = self._get_installation_path()
+        venv_path = self._get_venv_folder_path()
+        if not venv_path or not os.path.isdir(venv_path):
+            LOGGER.warning('Impossible to stage deployment because Virtual Environment does not exist: {}'.format(
+                venv_path))
+            return False
+        venv_python = self._get_venv_info(venv_path)['venv_python']
+
+        prefetch_path = os.path.join(self._get_prefetch_folder(), self._deploy_tag)
+        temp_path = '{}.{}.tmp'.format(prefetch_path, os.getpid())
+        try:
+            download_path = os.path.join(temp_path, 'download')
+            os.makedirs(download_path)
+            if not self._download_deployment_requirements(download_path):
+                return False
+            requirements_path = os.path.join(temp_path, self._requirements_file_name)
+            shutil.copy2(self._requirements_path, requirements_path)
+            shutil.rmtree(download_path, ignore_errors=True)
+
+            self._set_splash_text('Downloading requirements of {} ...'.format(self._deploy_tag))
+            with self._trace_span('pip_download', 'subprocess') as span_args:
+                process = self._start_process(commands_list=[
+                    venv_python, '-m', 'pip', 'download', '--no-cache', '-r', requirements_path,
+                    '-d', os.path.join(temp_path, PREFETCH_WHEELS_FOLDER_NAME)],
+                    timeout=PIP_INSTALL_TIMEOUT, keep_output=True)
+                span_args['returncode'] = self._wait_process(process)
+            if span_args['returncode'] != 0:
+                LOGGER.warning('Impossible to download requirements of {}:\n{}'.format(
+                    self._deploy_tag, process.error if process else ''))
+                return False
+
+            with open(os.path.join(temp_path, PREFETCH_MANIFEST_FILE_NAME), 'w') as manifest_file:
+                json.dump({
+                    'tag': self._deploy_tag,
+                    'python_version': self._get_python_version(),
+                    'requirements_hash': self._get_requirements_hash(requirements_path),
+                    'created': time.time()
+                }, manifest_file)
+            if os.path.isdir(prefetch_path):
+                self._remove_folder(prefetch_path)
+            os.rename(temp_path, prefetch_path)
+        except Exception as exc:
+            LOGGER.warning('Impossible to stage deployment of {}: {}'.format(self._deploy_tag, exc))
+            return False
+        finally:
+            if os.path.isdir(temp_path):
+                shutil.rmtree(temp_path, ignore_errors=True)
+
+        LOGGER.info('Deployment of {} staged: "{}"'.format(self._deploy_tag, prefetch_path))
+
+        return True
+
+    def _get_venv_snapshot_name(self):
+        """
+        Internal function that returns the name of the virtual environment snapshot of current tag, operating
+        system and Python version
+        :return: str or None
+        """
+
+        python_version = self._get_python_version()
+        if self._dev or not self._deploy_tag or not python_version:
+            return None
+
+        return '{}-{}-{}-py{}-v{}'.format(
+            self.get_clean_name(), self._deploy_tag, get_platform_name(), python_version, VENV_SNAPSHOT_VERSION)
+
+    @traced('export_venv_snapshot')
+    def _export_venv_snapshot(self):
         """
-        Internal function that returns a default env var
-        :return: str
+        Internal function that stores current virtual environment as a compressed snapshot in snapshots folder,
+        so other computers can import it instead of installing requirements. Snapshot manifest is written once the
+        archive is complete, so other computers never import partial snapshots
+        :return: bool
         """
 
-        return '{}_install'.format(self.get_clean_name())
+        venv_path = self._get_venv_folder_path()
+        snapshot_name = self._get_venv_snapshot_name()
+        if not self._snapshots_path or not snapshot_name or not venv_path or not os.path.isdir(venv_path):
+            LOGGER.warning('Impossible to export Virtual Environment snapshot: {} >>> {}'.format(
+                venv_path, self._snapshots_path))
+            return False
 
-    def _get_config_path(self):
+        # Snapshot includes bytecode caches
+        self._wait_bytecode_warmup()
+
+        self._set_splash_text('Exporting Virtual Environment snapshot ...')
+        archive_path = os.path.join(self._snapshots_path, snapshot_name + VENV_SNAPSHOT_EXTENSION)
+        temp_archive_path = '{}.{}.tmp'.format(archive_path, os.getpid())
+        try:
+            if not os.path.isdir(self._snapshots_path):
+                os.makedirs(self._snapshots_path)
+            with contextlib.closing(tarfile.open(
+                    temp_archive_path, 'w:gz', compresslevel=VENV_SNAPSHOT_COMPRESS_LEVEL)) as tar_ref:
+                tar_ref.add(venv_path, arcname='venv')
+            manifest = {
+                'name': snapshot_name,
+                'snapshot_version': VENV_SNAPSHOT_VERSION,
+                'tag': self._deploy_tag,
+                'platform': get_platform_name(),
+                'python_version': self._get_python_version(),
+                'python_executable': self._get_python_info().get('executable', None),
+                'python_full_version': self._get_python_info().get('version', None),
+                'requirements_hash': self._requirements_hash,
+                'venv_path': venv_path,
+                'size': os.path.getsize(temp_archive_path),
+                'sha256': get_file_hash(temp_archive_path),
+                'created': time.time()
+            }
+            replace_file(temp_archive_path, archive_path)
+            fd, temp_manifest_path = mkstemp(dir=self._snapshots_path, prefix='.', suffix='.tmp')
+            with os.fdopen(fd, 'w') as manifest_file:
+                json.dump(manifest, manifest_file, indent=4, sort_keys=True)
+            os.chmod(temp_manifest_path, 0o644)
+            replace_file(temp_manifest_path, os.path.join(self._snapshots_path, snapshot_name + '.json'))
+        except Exception as exc:
+            LOGGER.error('Impossible to export Virtual Environment snapshot "{}": {}'.format(archive_path, exc))
+            if os.path.isfile(temp_archive_path):
+                os.remove(temp_archive_path)
+            return False
+
+        LOGGER.info('Virtual Environment snapshot exported: "{}" ({} bytes)'.format(archive_path, manifest['size']))
+
+        return True
+
+    def _get_venv_snapshot_manifest(self):
         """
-        Internal function that returns path where configuration file is located
-        :return: str
+        Internal function that returns the manifest of the snapshot that can be imported in current computer
+        :return: dict or None
         """
 
-        config_name = self._get_app_name()
-        config_path = self._get_app_folder()
-        config_file = os.path.normpath(os.path.join(config_path, '{}.cfg'.format(config_name)))
+        snapshot_name = self._get_venv_snapshot_name()
+        if not self._snapshots_path or not snapshot_name:
+            return None
 
-        return config_file
+        manifest_path = os.path.join(self._snapshots_path, snapshot_name + '.json')
+        if not os.path.isfile(manifest_path):
+            LOGGER.info('No Virtual Environment snapshot found: "{}"'.format(manifest_path))
+            return None
+        try:
+            with open(manifest_path, 'r') as manifest_file:
+                manifest = json.load(manifest_file)
+        except Exception as exc:
+            LOGGER.warning('Impossible to read Virtual Environment snapshot manifest "{}": {}'.format(
+                manifest_path, exc))
+            return None
 
-    def _set_config(self, config_name, config_value):
+        # Virtual environments point to the Python they were created with (pyvenv.cfg, Windows launchers), so
+        # snapshots can only be imported if the same Python is installed in the same location
+        python_info = self._get_python_info()
+        expected = {
+            'snapshot_version': VENV_SNAPSHOT_VERSION, 'tag': self._deploy_tag, 'platform': get_platform_name(),
+            'python_version': self._get_python_version(), 'python_executable': python_info.get('executable', None),
+            'python_full_version': python_info.get('version', None)}
+        for key, value in expected.items():
+            if manifest.get(key) != value:
+                LOGGER.warning('Virtual Environment snapshot "{}" is not valid. {}: {} != {}'.format(
+                    manifest_path, key, manifest.get(key), value))
+                return None
+
+        return manifest
+
+    @traced('import_venv_snapshot')
+    def _import_venv_snapshot(self, venv_path):
         """
-        Sets configuration and updates the file
-        :param config_name: str
-        :param config_value: object
+        Internal function that creates given virtual environment from the snapshot of current tag, if available.
+        Snapshot archive is copied locally and its hash is verified before extracting it
+        :param venv_path: str
+        :return: bool
         """
 
-        config_path = self._get_config_path()
-        if not os.path.isfile(config_path):
-            LOGGER.warning(
-                'Impossible to update configuration file because it does not exists: "{}"'.format(config_path))
+        manifest = self._get_venv_snapshot_manifest()
+        if not manifest:
+            return False
+
+        self._set_splash_text('Importing Virtual Environment snapshot ...')
+        archive_path = os.path.join(self._snapshots_path, manifest['name'] + VENV_SNAPSHOT_EXTENSION)
+        local_folder = os.path.join(self._get_app_folder(), 'venv_snapshots')
+        local_archive_path = os.path.join(local_folder, manifest['name'] + VENV_SNAPSHOT_EXTENSION)
+        extract_path = '{}.{}.snapshot'.format(venv_path, os.getpid())
+        try:
+            with self._trace_span('copy_snapshot', 'network') as span_args:
+                if not os.path.isdir(local_folder):
+                    os.makedirs(local_folder)
+                with open(archive_path, 'rb') as archive_file:
+                    write_archive_member(archive_file, local_archive_path)
+                span_args['bytes'] = os.path.getsize(local_archive_path)
+            if get_file_hash(local_archive_path) != manifest['sha256']:
+                raise ValueError('Hash does not match snapshot manifest')
+            extract_archive(local_archive_path, extract_path, keep_metadata=True)
+            self._clone_venv(os.path.join(extract_path, 'venv'), venv_path, source_prefix=manifest['venv_path'])
+            if not self._check_venv_python(venv_path):
+                raise ValueError('Python of the imported Virtual Environment is not valid')
+        except Exception as exc:
+            LOGGER.warning('Impossible to import Virtual Environment snapshot "{}": {}'.format(archive_path, exc))
+            if os.path.isdir(venv_path):
+                shutil.rmtree(venv_path, ignore_errors=True)
             return False
+        finally:
+            shutil.rmtree(extract_path, ignore_errors=True)
+            if os.path.isfile(local_archive_path):
+                os.remove(local_archive_path)
 
-        config_data = self.get_config_data()
-        config_data[config_name] = config_value
-        with open(config_path, 'w') as config_file:
-            json.dump(config_data, config_file)
+        self._venv_snapshot = manifest
+        LOGGER.info('Virtual Environment imported from snapshot: "{}"'.format(archive_path))
 
         return True
 
-    def _create_venv(self, force=False):
+    def _check_venv_python(self, venv_path):
         """
-        Internal function that creates virtual environment
-        :param force: bool
+        Internal function that returns whether the Python of given virtual environment runs and uses that virtual
+        environment
+        :param venv_path: str
         :return: bool
         """
 
-        venv_path = self._get_venv_folder_path()
-
-        if self._check_venv_folder_exists() and not force:
-            LOGGER.info('Virtual Environment already exists: "{}"'.format(venv_path))
-            return True
+        venv_python = self._get_venv_info(venv_path)['venv_python']
+        if not os.path.isfile(venv_python):
+            return False
 
-        if force and self._check_venv_folder_exists() and os.path.isdir(venv_path):
-            LOGGER.info('Forcing the removal of Virtual Environment folder: "{}"'.format(venv_path))
-            self._set_splash_text('Removing already existing virtual environment ...')
-            shutil.rmtree(venv_path)
+        process = self._start_process(
+            commands_list=[venv_python, '-c', 'import sys; print(sys.prefix)'], timeout=SETUP_PROBE_TIMEOUT,
+            keep_output=True)
+        if self._wait_process(process) != 0 or not process.output:
+            LOGGER.warning('Virtual Environment Python "{}" cannot be executed: {}'.format(venv_python, process.error))
+            return False
 
-        self._set_splash_text('Creating Virtual Environment: "{}"'.format(venv_path))
-        process = self._run_subprocess(commands_list=['virtualenv', venv_path], shell=False)
-        process.wait()
+        venv_prefix = process.output.strip()
+        if os.path.normcase(os.path.realpath(venv_prefix)) != os.path.normcase(os.path.realpath(venv_path)):
+            LOGGER.warning('Virtual Environment Python "{}" uses other prefix: "{}"'.format(venv_python, venv_prefix))
+            return False
 
-        return True if process.returncode == 0 else False
+        return True
 
     def _get_venv_folder_path(self):
         """
@@ -1339,7 +3668,8 @@ class ArtellaUpdater(QWidget, object):
         :return: list(str)
         """
 
-        paths_to_register = [self._get_installation_path()]
+        install_path = self._get_installation_path()
+        paths_to_register = [install_path] if install_path else list()
 
         if self._dev:
             lib_site_folder = os.path.join(self._install_path, 'Lib', 'site-packages')
@@ -1349,7 +3679,13 @@ class ArtellaUpdater(QWidget, object):
         if os.path.isdir(lib_site_folder):
             paths_to_register.append(lib_site_folder)
 
-        return paths_to_register
+        clean_paths = list()
+        for path in paths_to_register:
+            path = os.path.normpath(path)
+            if os.path.isdir(path) and os.path.normcase(path) not in [os.path.normcase(p) for p in clean_paths]:
+                clean_paths.append(path)
+
+        return clean_paths
 
     def _check_venv_folder_exists(self):
         """
@@ -1357,14 +3693,21 @@ class ArtellaUpdater(QWidget, object):
         :return: bool
         """
 
-        venv_path = self._get_default_install_env_var()
+        venv_path = self._get_venv_folder_path()
         if not venv_path:
             return False
 
         return os.path.isdir(venv_path)
 
     def _try_download_unizip_deployment_requirements(self, deployment_url, download_path, dirname):
-        valid_download = self._download_file(deployment_url, download_path)
+        if self._stream_extract and deployment_url.endswith('.tar.gz'):
+            try:
+                return self._stream_unzip_file(deployment_url, destination=dirname)
+            except Exception as exc:
+                LOGGER.warning('Error while streaming deployment data: {}'.format(exc))
+                return False
+
+        valid_download = self._download_file(deployment_url, download_path, connections=self._download_connections)
         if not valid_download:
             return False
 
@@ -1377,6 +3720,33 @@ class ArtellaUpdater(QWidget, object):
 
         return True
 
+    def _try_download_extract_requirements_file(self, deployment_url, download_path, dirname):
+        """
+        Internal function that downloads deployment archive and only extracts the requirements file from it
+        :param deployment_url: str
+        :param download_path: str
+        :param dirname: str
+        :return: tuple(bool, str), whether the archive was processed and the path of the extracted requirements file
+        """
+
+        try:
+            if self._stream_extract and deployment_url.endswith('.tar.gz'):
+                requirement_path = self._stream_unzip_file(
+                    deployment_url, destination=dirname, member_name=self._requirements_file_name)
+            else:
+                valid_download = self._download_file(
+                    deployment_url, download_path, connections=self._download_connections)
+                if not valid_download:
+                    return False, None
+                requirement_path = self._unzip_file(
+                    filename=download_path, destination=dirname, member_name=self._requirements_file_name)
+        except Exception as exc:
+            LOGGER.warning('Error while extracting requirements file from deployment data: {}'.format(exc))
+            return False, None
+
+        return True, requirement_path
+
+    @traced('download_deployment')
     def _download_deployment_requirements(self, dirname):
         """
         Internal function that downloads the current deployment requirements
@@ -1389,8 +3759,10 @@ class ArtellaUpdater(QWidget, object):
             self._show_error(msg)
             return False
 
-        response = requests.get(deployment_url, headers={'Connection': 'close'})
-        if response.status_code != 200:
+        # We only need the status, so we stream the response and close it before the body is downloaded
+        with contextlib.closing(self._http_get(deployment_url, stream=True)) as response:
+            status_code = response.status_code
+        if status_code != 200:
             msg = 'Deployment URL is not valid: "{}"'.format(deployment_url)
             self._show_error(msg)
             return False
@@ -1400,11 +3772,17 @@ class ArtellaUpdater(QWidget, object):
 
         valid_status = False
         total_tries = 0
+        requirement_path = None
         self._set_splash_text('Downloading and Unzipping Deployment Data ...')
         while not valid_status:
             if total_tries > 10:
                 break
-            valid_status = self._try_download_unizip_deployment_requirements(deployment_url, download_path, dirname)
+            if self._selective_extract:
+                valid_status, requirement_path = self._try_download_extract_requirements_file(
+                    deployment_url, download_path, dirname)
+            else:
+                valid_status = self._try_download_unizip_deployment_requirements(
+                    deployment_url, download_path, dirname)
             total_tries += 1
             if not valid_status:
                 LOGGER.warning('Retrying downloading and unzip deployment data: {}'.format(total_tries))
@@ -1413,13 +3791,13 @@ class ArtellaUpdater(QWidget, object):
             self._show_error(msg)
             return False
 
-        self._set_splash_text('Searching Requirements File: {}'.format(self._requirements_file_name))
-        requirement_path = None
-        for root, dirs, files in os.walk(dirname):
-            for name in files:
-                if name == self._requirements_file_name:
-                    requirement_path = os.path.join(root, name)
-                    break
+        if not self._selective_extract:
+            self._set_splash_text('Searching Requirements File: {}'.format(self._requirements_file_name))
+            for root, dirs, files in os.walk(dirname):
+                for name in files:
+                    if name == self._requirements_file_name:
+                        requirement_path = os.path.join(root, name)
+                        break
         if not requirement_path:
             msg = 'No file named: {} found in deployment repository!'.format(self._requirements_file_name)
             self._show_error(msg)
@@ -1429,6 +3807,7 @@ class ArtellaUpdater(QWidget, object):
 
         return True
 
+    @traced('install_requirements')
     def _install_deployment_requirements(self):
         if not self._venv_info:
             self._show_error(
@@ -1450,91 +3829,211 @@ class ArtellaUpdater(QWidget, object):
             )
             return False
 
+        if self._venv_snapshot and self._venv_snapshot.get('requirements_hash') == self._requirements_hash:
+            LOGGER.info('Deployment Requirements already installed by Virtual Environment snapshot')
+            return True
+
         self._set_splash_text('Installing {} Requirements. Please wait ...'.format(self._project_name))
         LOGGER.info('Installing Deployment Requirements with PIP: {}'.format(pip_exe))
 
-        pip_cmd = '"{}" install --upgrade --no-cache -r "{}"'.format(pip_exe, self._requirements_path)
-        LOGGER.info('Launching pip command: {}'.format(pip_cmd))
+        # pip is executed through venv Python because pip launchers of cloned environments point to the template
+        pip_cmd = '"{}" -m pip install --upgrade --no-cache -r "{}"'.format(
+            self._venv_info['venv_python'], self._requirements_path)
 
         try:
-            if is_windows():
-                start_time = time.time()
-                LOGGER.info('\nPip install --> first try ...')
-                process = self._run_subprocess(command=pip_cmd)
-                output, error = process.communicate()
-                LOGGER.info('Pip install --> first try ---> executed in {} seconds\n!'.format(time.time() - start_time))
-                LOGGER.info(output)
-                LOGGER.error(error)
-
-                # We retry twice because sometimes pip fails when trying to install new packages
-                start_time = time.time()
-                LOGGER.info('\nPip install --> second try ...')
-                process = self._run_subprocess(command=pip_cmd)
-                output, error = process.communicate()
-                LOGGER.info(output)
-                LOGGER.error(error)
-                LOGGER.info('Pip install --> first try ---> executed in {} seconds\n!'.format(time.time() - start_time))
-                if error:
-                    show_error = False
-                    error_split = error.split('\n')
-                    for error_str in error_split:
-                        if not error_str or error_str.startswith(
-                                ('DEPRECATION:', 'WARNING:', 'You should consider upgrading via')):
-                            continue
-                        else:
-                            show_error = True
-                            break
-                    if show_error:
-                        error_dlg = AppErrorDialog(error)
-                        error_dlg.exec_()
-                        return False
+            if self._prefetch_path:
+                # Wheels downloaded in background are installed without accessing the index. It is only used if
+                # some of them are missing
+                offline_pip_cmd = '{} --no-index --find-links "{}"'.format(
+                    pip_cmd, os.path.join(self._prefetch_path, PREFETCH_WHEELS_FOLDER_NAME))
+                LOGGER.info('Launching pip command: {}'.format(offline_pip_cmd))
+                errors = self._run_pip(offline_pip_cmd, attempt=1)
+                if not errors:
+                    return True
+                LOGGER.warning('Impossible to install requirements from staged wheels. Using package index ...')
+
+            LOGGER.info('Launching pip command: {}'.format(pip_cmd))
+            self._run_pip(pip_cmd, attempt=1)
+
+            # We retry twice because sometimes pip fails when trying to install new packages
+            errors = self._run_pip(pip_cmd, attempt=2)
+            if errors:
+                self._show_error_details('\n'.join(errors))
+                return False
 
         except Exception as exc:
-            raise ArtellaUpdaterException(exc)
+            raise ArtellaUpdaterException(exc, show_dialog=not self._headless)
 
         return True
 
+    def _run_pip(self, pip_cmd, attempt=1):
+        """
+        Internal function that executes given pip command. Its output is processed while pip is running to show
+        installation progress
+        :param pip_cmd: str
+        :param attempt: int
+        :return: list(str), error lines written by pip
+        """
+
+        start_time = time.time()
+        LOGGER.info('\nPip install --> try {} ...'.format(attempt))
+        output_parser = PipOutputParser(
+            total_packages=get_requirements_count(self._requirements_path), progress_hook=self._set_splash_text)
+        with self._trace_span('pip_install', 'subprocess', command=pip_cmd, attempt=attempt) as span_args:
+            process = self._start_process(
+                command=pip_cmd, timeout=PIP_INSTALL_TIMEOUT, line_hook=output_parser.feed)
+            span_args['returncode'] = self._wait_process(process)
+            span_args['packages'] = output_parser.packages
+        output_parser.flush()
+        errors = output_parser.errors
+        if not process:
+            errors.append('Impossible to launch pip: {}'.format(pip_cmd))
+        elif process.timed_out:
+            errors.append('pip was cancelled because it did not finish after {} seconds'.format(PIP_INSTALL_TIMEOUT))
+        for error in errors:
+            LOGGER.error(error)
+        LOGGER.info('Pip install --> try {} ---> executed in {} seconds\n!'.format(attempt, time.time() - start_time))
+
+        return errors
+
+    @traced('setup_deployment')
     def _setup_deployment(self):
         if not self._venv_info:
             return False
 
         if self._dev:
             if self._install_path and self._requirements_path and os.path.isfile(self._requirements_path):
+                self._requirements_hash = self._get_requirements_hash()
                 valid_install = self._install_deployment_requirements()
                 if not valid_install:
                     LOGGER.info("Error while installing requirements. Trying to uninstall ...")
-                    res = QMessageBox.question(
-                        self._splash,
-                        'Impossible to install/update tools properly',
-                        'Current tools installation is not valid.\n\nDo you want to clean current installation?.\n\n'
-                        'If you press Yes, next time you launch the application, you will need to select a '
-                        'new installation path and tools will be fully reinstalled.',
-                        buttons=QMessageBox.Yes | QMessageBox.No)
-                    if res == QMessageBox.Yes:
+                    if self._ask_question(
+                            'remove_installation', 'Impossible to install/update tools properly',
+                            'Current tools installation is not valid.\n\n'
+                            'Do you want to clean current installation?.\n\n'
+                            'If you press Yes, next time you launch the application, you will need to select a '
+                            'new installation path and tools will be fully reinstalled.'):
                         self._on_uninstall(force=True)
                     return False
+                self._start_bytecode_warmup()
             return True
 
         with tempfile.TemporaryDirectory() as temp_dirname:
-            valid_download = self._download_deployment_requirements(temp_dirname)
-            if not valid_download or not self._requirements_path or not os.path.isfile(self._requirements_path):
-                return False
+            self._prefetch_path = self._get_prefetched_release_path(self._deploy_tag)
+            if self._prefetch_path:
+                LOGGER.info('Using deployment staged in background: "{}"'.format(self._prefetch_path))
+                self._requirements_path = os.path.join(self._prefetch_path, self._requirements_file_name)
+            else:
+                valid_download = self._download_deployment_requirements(temp_dirname)
+                if not valid_download or not self._requirements_path or not os.path.isfile(self._requirements_path):
+                    return False
+            self._requirements_hash = self._get_requirements_hash()
             valid_install = self._install_deployment_requirements()
             if not valid_install:
                 LOGGER.info("Error while installing requirements. Trying to uninstall ...")
-                res = QMessageBox.question(
-                    self._splash,
-                    'Impossible to install/update tools properly',
-                    'Current tools installation is not valid.\n\nDo you want to clean current installation?.\n\n'
-                    'If you press Yes, next time you launch the application, you will need to select a '
-                    'new installation path and tools will be fully reinstalled.',
-                    buttons=QMessageBox.Yes | QMessageBox.No)
-                if res == QMessageBox.Yes:
+                if self._ask_question(
+                        'remove_installation', 'Impossible to install/update tools properly',
+                        'Current tools installation is not valid.\n\nDo you want to clean current installation?.\n\n'
+                        'If you press Yes, next time you launch the application, you will need to select a '
+                        'new installation path and tools will be fully reinstalled.'):
                     self._on_uninstall(force=True)
                 return False
+            self._update_venv_template()
+            self._clean_prefetched_releases()
+
+        # Started once template is updated, so it does not clone partially written caches
+        self._start_bytecode_warmup()
+
+        return True
+
+    def _get_bytecode_paths(self):
+        """
+        Internal function that returns folders whose bytecode should be compiled after installing requirements
+        :return: list(str)
+        """
+
+        venv_path = self._venv_info.get('venv_folder', None)
+        if not venv_path or not os.path.isdir(venv_path):
+            return list()
+
+        if is_windows():
+            bytecode_paths = [os.path.join(venv_path, 'Lib', 'site-packages')]
+        else:
+            lib_path = os.path.join(venv_path, 'lib')
+            bytecode_paths = [
+                os.path.join(lib_path, name, 'site-packages') for name in sorted(os.listdir(lib_path))
+                if name.startswith('python')] if os.path.isdir(lib_path) else list()
+        bytecode_paths.extend(self._get_paths_to_register())
+
+        # Folders are compiled recursively, so folders located inside other ones are skipped
+        clean_paths = list()
+        for path in sorted(set(os.path.normpath(path) for path in bytecode_paths), key=len):
+            if os.path.isdir(path) and not any(path.startswith(os.path.join(p, '')) for p in clean_paths):
+                clean_paths.append(path)
+
+        return clean_paths
+
+    def _start_bytecode_warmup(self):
+        """
+        Internal function that compiles, in background, bytecode of virtual environment site-packages and of the
+        paths registered by the launcher, so first launch does not pay the compilation cost
+        :return: bool
+        """
+
+        if self._bytecode_thread and self._bytecode_thread.is_alive():
+            return True
+
+        venv_python = self._venv_info.get('venv_python', None)
+        bytecode_paths = self._get_bytecode_paths()
+        if not venv_python or not os.path.isfile(venv_python) or not bytecode_paths:
+            return False
+
+        self._bytecode_thread = threading.Thread(
+            target=self._compile_bytecode, args=(venv_python, bytecode_paths), name='ArtellaBytecodeWarmup')
+        self._bytecode_thread.daemon = True
+        self._bytecode_thread.start()
 
         return True
 
+    def _compile_bytecode(self, venv_python, bytecode_paths):
+        """
+        Internal function that compiles bytecode of given folders using given Python executable.
+        It is executed in a background thread
+        :param venv_python: str
+        :param bytecode_paths: list(str)
+        """
+
+        LOGGER.info('Compiling bytecode: {}'.format(bytecode_paths))
+        start_time = time.time()
+        try:
+            with self._trace_span('compile_bytecode', 'subprocess', paths=bytecode_paths):
+                process = self._start_process(
+                    commands_list=[venv_python, '-c', BYTECODE_WARMUP_SCRIPT] + bytecode_paths, keep_output=True)
+                returncode = self._wait_process(process)
+            if returncode:
+                # Some packages ship sources that are not valid for the running Python (tests, Python 2 modules...)
+                LOGGER.info('Some files could not be compiled:\n{}'.format(process.error or process.output))
+        except Exception as exc:
+            LOGGER.warning('Impossible to compile bytecode: {}'.format(exc))
+            return
+        LOGGER.info('Bytecode compiled in {} seconds'.format(time.time() - start_time))
+
+    def _wait_bytecode_warmup(self, timeout=BYTECODE_WARMUP_TIMEOUT):
+        """
+        Internal function that waits until bytecode warm-up finishes, keeping UI responsive
+        :param timeout: float, maximum time to wait in seconds
+        """
+
+        if not self._bytecode_thread or not self._bytecode_thread.is_alive():
+            return
+
+        self._set_splash_text('Optimizing {} tools for first launch ...'.format(self._project_name))
+        end_time = time.time() + timeout
+        while self._bytecode_thread.is_alive() and time.time() < end_time:
+            self._bytecode_thread.join(0.1)
+            QApplication.instance().processEvents()
+
+    @traced('setup_artella')
     def _setup_artella(self):
         """
         Internal function that initializes Artella
@@ -1550,13 +4049,14 @@ class ArtellaUpdater(QWidget, object):
 
         return True
 
-    def _download_file(self, filename, destination):
+    def _download_file(self, filename, destination, connections=1):
         """
         Downloads given file into given target path
+        If more than one connection is given and the server supports byte ranges, the file is downloaded in
+        segments that are fetched concurrently
         :param filename: str
         :param destination: str
-        :param console: ArtellaConsole
-        :param updater: ArtellaUpdater
+        :param connections: int, maximum number of concurrent connections used to download the file
         :return: bool
         """
 
@@ -1579,31 +4079,23 @@ class ArtellaUpdater(QWidget, object):
         def _chunk_read(response, destination, chunk_size=8192, report_hook=None):
             """
             Function that reads a chunk of a dowlnoad operation
-            :param response: str
+            :param response: requests.Response
             :param destination: str
-            :param console: ArtellaLauncher
             :param chunk_size: int
             :param report_hook: fn
-            :param updater: ArtellaUpdater
             :return: int
             """
 
-            with open(destination, 'ab') as dst_file:
-                rsp = response.info().getheader('Content-Length')
-                if not rsp:
-                    return
-                total_size = rsp.strip()
-                total_size = int(total_size)
-                bytes_so_far = 0
-                while 1:
-                    chunk = response.read(chunk_size)
+            total_size = int(response.headers.get('Content-Length', '0').strip() or 0)
+            bytes_so_far = 0
+            with open(destination, 'wb') as dst_file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if not chunk:
+                        continue
                     dst_file.write(chunk)
                     bytes_so_far += len(chunk)
-                    if not chunk:
-                        break
-                    if report_hook:
+                    if report_hook and total_size:
                         report_hook(bytes_so_far=bytes_so_far, total_size=total_size)
-            dst_file.close()
             return bytes_so_far
 
         LOGGER.info('Downloading file {} to temporary folder -> {}'.format(os.path.basename(filename), destination))
@@ -1614,16 +4106,21 @@ class ArtellaUpdater(QWidget, object):
                 os.makedirs(dst_folder)
 
             hdr = {
-                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.11 (KHTML, like Gecko) '
-                              'Chrome/23.0.1271.64 Safari/537.11',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                 'Accept-Charset': 'ISO-8859-1,utf-8;q=0.7,*;q=0.3',
-                'Accept-Encoding': 'none',
-                'Accept-Language': 'en-US,en;q=0.8',
-                'Connection': 'keep-alive'}
-            req = Request(filename, headers=hdr)
-            data = urlopen(req)
-            _chunk_read(response=data, destination=destination, report_hook=_chunk_report)
+                'Accept-Encoding': 'identity'}
+            with self._trace_span('download_file', 'network', url=filename) as span_args:
+                total_size = self._get_segmented_download_size(filename, hdr) if connections > 1 else 0
+                if total_size:
+                    span_args['connections'] = connections
+                    span_args['bytes'] = self._download_file_segmented(
+                        filename, destination, total_size=total_size, connections=connections, headers=hdr,
+                        report_hook=_chunk_report)
+                else:
+                    with contextlib.closing(self._http_get(filename, headers=hdr, stream=True)) as response:
+                        response.raise_for_status()
+                        span_args['bytes'] = _chunk_read(
+                            response=response, destination=destination, report_hook=_chunk_report)
         except Exception as exc:
             raise Exception(exc)
 
@@ -1635,16 +4132,114 @@ class ArtellaUpdater(QWidget, object):
             self._show_error(msg)
             return False
 
-    def _unzip_file(self, filename, destination, remove_first=True, remove_sub_folders=None):
+    def _get_segmented_download_size(self, url, headers):
+        """
+        Internal function that sends a HEAD request to check if given file can be downloaded in segments
+        :param url: str
+        :param headers: dict
+        :return: int, size of the file or 0 if the file should be downloaded using a single connection
+        """
+
+        try:
+            with self._trace_span('http_head', 'network', url=url) as span_args:
+                response = self._get_http_session().head(
+                    url, headers=headers, allow_redirects=True, timeout=HTTP_TIMEOUT)
+                span_args['status_code'] = response.status_code
+        except requests.RequestException as exc:
+            LOGGER.warning('Impossible to retrieve size of "{}": {}'.format(url, exc))
+            return 0
+        if response.status_code != 200:
+            return 0
+
+        total_size = int(response.headers.get('Content-Length', '0').strip() or 0)
+        accept_ranges = response.headers.get('Accept-Ranges', '').strip().lower()
+        if accept_ranges != 'bytes' or total_size < SEGMENTED_DOWNLOAD_MIN_SIZE:
+            return 0
+
+        return total_size
+
+    def _download_file_segmented(self, filename, destination, total_size, connections, headers=None,
+                                 report_hook=None):
+        """
+        Downloads given file splitting it in byte ranges that are fetched concurrently and written in place into a
+        preallocated file
+        :param filename: str
+        :param destination: str
+        :param total_size: int, size of the file in bytes
+        :param connections: int, number of concurrent connections
+        :param headers: dict
+        :param report_hook: fn
+        :return: int, number of downloaded bytes
+        """
+
+        segment_size = int(math.ceil(float(total_size) / connections))
+        byte_ranges = [
+            (start, min(start + segment_size, total_size) - 1) for start in range(0, total_size, segment_size)]
+        LOGGER.info('Downloading file {} using {} connections'.format(os.path.basename(filename), len(byte_ranges)))
+
+        with open(destination, 'wb') as dst_file:
+            dst_file.truncate(total_size)
+
+        progress = {'bytes': 0}
+        progress_lock = threading.Lock()
+
+        def _download_segment(byte_range):
+            start, end = byte_range
+            segment_headers = dict(headers or dict())
+            segment_headers['Range'] = 'bytes={}-{}'.format(start, end)
+            bytes_written = 0
+            with self._trace_span('download_segment', 'network', start=start, end=end) as span_args:
+                with contextlib.closing(self._http_get(filename, headers=segment_headers, stream=True)) as response:
+                    if response.status_code != 206:
+                        raise Exception('Server did not return requested byte range {}-{}: {}'.format(
+                            start, end, response.status_code))
+                    with open(destination, 'r+b') as dst_file:
+                        dst_file.seek(start)
+                        for chunk in response.iter_content(chunk_size=65536):
+                            if not chunk:
+                                continue
+                            dst_file.write(chunk)
+                            bytes_written += len(chunk)
+                            with progress_lock:
+                                progress['bytes'] += len(chunk)
+                span_args['bytes'] = bytes_written
+            if bytes_written != end - start + 1:
+                raise Exception('Incomplete byte range {}-{}: {} bytes received'.format(start, end, bytes_written))
+            return bytes_written
+
+        # Progress is reported from this thread because UI can only be updated from the main thread
+        pool = ThreadPool(len(byte_ranges))
+        try:
+            result = pool.map_async(_download_segment, byte_ranges)
+            while not result.ready():
+                result.wait(0.1)
+                if report_hook:
+                    report_hook(bytes_so_far=progress['bytes'], total_size=total_size)
+            bytes_so_far = sum(result.get())
+        finally:
+            pool.close()
+            pool.join()
+
+        return bytes_so_far
+
+    @traced('extract_archive')
+    def _unzip_file(self, filename, destination, remove_first=True, remove_sub_folders=None, member_name=None):
         """
         Unzips given file in given folder
         :param filename: str
         :param destination: str
-        :param console: ArtellaConsole
         :param remove_first: bool
         :param remove_sub_folders: bool
+        :param member_name: str, if given, only the file with the given name is extracted and its path is returned
+        :return: bool or str
         """
 
+        def _extract_report(member_name, members_done, total_members):
+            if total_members:
+                self._set_splash_text('Extracted {} of {} files ...'.format(members_done, total_members))
+            else:
+                self._set_splash_text('Extracted {} files ...'.format(members_done))
+
         LOGGER.info('Unzipping file {} to --> {}'.format(filename, destination))
         try:
             if remove_first and remove_sub_folders:
@@ -1659,18 +4254,105 @@ class ArtellaUpdater(QWidget, object):
                 QApplication.instance().processEvents()
                 os.makedirs(destination)
 
-            if filename.endswith('.tar.gz'):
-                zip_ref = tarfile.open(filename, 'r:gz')
-            elif filename.endswith('.tar'):
-                zip_ref = tarfile.open(filename, 'r:')
-            else:
-                zip_ref = zipfile.ZipFile(filename, 'r')
-            zip_ref.extractall(destination)
-            zip_ref.close()
+            if member_name:
+                if filename.endswith('.tar.gz'):
+                    zip_ref = tarfile.open(filename, 'r:gz')
+                elif filename.endswith('.tar'):
+                    zip_ref = tarfile.open(filename, 'r:')
+                else:
+                    zip_ref = zipfile.ZipFile(filename, 'r')
+                try:
+                    return self._extract_file_from_archive(zip_ref, member_name, destination)
+                finally:
+                    zip_ref.close()
+
+            extract_archive(filename, destination, progress_hook=_extract_report)
             return True
         except Exception as exc:
             raise Exception(exc)
 
+    def _stream_unzip_file(self, filename, destination, member_name=None):
+        """
+        Downloads given .tar.gz file and extracts it while it is being downloaded. The archive is never written to disk
+        :param filename: str
+        :param destination: str
+        :param member_name: str, if given, only the file with the given name is extracted and its path is returned
+        :return: bool or str
+        """
+
+        def _stream_report(bytes_so_far, total_size):
+            if total_size:
+                msg = 'Downloaded and extracted %d of %d bytes (%0.2f%%)' % (
+                    bytes_so_far, total_size, round(float(bytes_so_far) / total_size * 100, 2))
+            else:
+                msg = 'Downloaded and extracted %d bytes' % bytes_so_far
+            self._set_splash_text(msg)
+
+        LOGGER.info('Streaming file {} to --> {}'.format(filename, destination))
+        if not os.path.exists(destination):
+            os.makedirs(destination)
+
+        hdr = {'Accept-Encoding': 'identity'}
+        with self._trace_span('stream_extract', 'network', url=filename) as span_args:
+            with contextlib.closing(self._http_get(filename, headers=hdr, stream=True)) as response:
+                response.raise_for_status()
+                total_size = int(response.headers.get('Content-Length', '0').strip() or 0)
+                response.raw.decode_content = True
+                reader = ProgressReader(response.raw, total_size=total_size, report_hook=_stream_report)
+                with contextlib.closing(tarfile.open(fileobj=reader, mode='r|gz')) as tar_ref:
+                    if member_name:
+                        member_path = self._extract_file_from_archive(tar_ref, member_name, destination)
+                    else:
+                        for _ in extract_tar_members(tar_ref, destination):
+                            pass
+                _stream_report(reader.bytes_so_far, total_size)
+            span_args['bytes'] = reader.bytes_so_far
+
+        LOGGER.info('Files downloaded and extracted succesfully: {} bytes'.format(reader.bytes_so_far))
+
+        return member_path if member_name else True
+
+    def _extract_file_from_archive(self, archive, file_name, destination):
+        """
+        Extracts the file with the given name from the given archive, reading member headers in archive order.
+        Scanning stops as soon as the file is found in the root folder of the archive (or in the top folder most
+        repository archives are wrapped in); otherwise the shallowest match is returned
+        :param archive: tarfile.TarFile or zipfile.ZipFile
+        :param file_name: str
+        :param destination: str
+        :return: str, path of the extracted file or None if the archive does not contain the file
+        """
+
+        if isinstance(archive, zipfile.ZipFile):
+            members = (
+                (member.filename, member) for member in archive.infolist() if not member.filename.endswith('/'))
+        else:
+            # Iterating a TarFile reads headers lazily, so streamed archives are not read further than needed
+            members = ((member.name, member) for member in archive if member.isfile())
+
+        found_path = None
+        found_depth = None
+        for name, member in members:
+            if posixpath.basename(name) != file_name:
+                continue
+            depth = len([part for part in name.split('/') if part and part != '.'])
+            if found_depth is None or depth < found_depth:
+                target_path = get_safe_archive_path(name, destination)
+                if isinstance(archive, zipfile.ZipFile):
+                    member_file = archive.open(member, 'r')
+                else:
+                    member_file = archive.extractfile(member)
+                try:
+                    write_archive_member(member_file, target_path)
+                finally:
+                    member_file.close()
+                found_path = target_path
+                found_depth = depth
+            if depth <= 2:
+                break
+
+        return found_path
+
     def _get_artella_data_folder(self):
         """
         Returns last version Artella folder installation
@@ -1706,13 +4388,14 @@ class ArtellaUpdater(QWidget, object):
 
         LOGGER.debug('ARTELLA FOLDER: {}'.format(artella_folder))
         if not os.path.exists(artella_folder):
-            QMessageBox.information(
-                self._splash,
+            self._show_message(
                 'Artella Folder not found!',
-                'Artella App Folder {} does not exists! Make sure that Artella is installed in your computer!')
+                'Artella App Folder {} does not exists! Make sure that Artella is installed in your computer!'.format(
+                    artella_folder))
 
         return artella_folder
 
+    @traced('update_artella_paths')
     def _update_artella_paths(self):
         """
         Updates system path to add artella paths if they are not already added
@@ -1727,11 +4410,70 @@ class ArtellaUpdater(QWidget, object):
 
         LOGGER.debug('Updating Artella paths from: {0}'.format(artella_folder))
         if artella_folder is not None and os.path.exists(artella_folder):
-            for subdir, dirs, files in os.walk(artella_folder):
-                if subdir not in sys.path:
-                    LOGGER.debug('Adding Artella path: {0}'.format(subdir))
-                    sys.path.append(subdir)
+            registered_paths = set(sys.path)
+            for artella_path in self._get_artella_paths(artella_folder):
+                if artella_path not in registered_paths:
+                    LOGGER.debug('Adding Artella path: {0}'.format(artella_path))
+                    sys.path.append(artella_path)
+                    registered_paths.add(artella_path)
+
+    def _get_artella_paths(self, artella_folder):
+        """
+        Returns Artella folders that contain importable code (Python modules, extensions or packages).
+        Paths are cached in app data folder and they are only computed again when Artella version changes
+        :param artella_folder: str
+        :return: list(str)
+        """
 
+        cache_key = self._get_artella_paths_cache_key(artella_folder)
+        cache_path = os.path.join(self._get_app_folder(), '{}_artella_paths.json'.format(self._get_app_name()))
+        if os.path.isfile(cache_path):
+            try:
+                with open(cache_path, 'r') as cache_file:
+                    cache_data = json.load(cache_file)
+                if cache_data.get('key') == cache_key:
+                    return cache_data.get('paths', list())
+            except Exception as exc:
+                LOGGER.warning('Impossible to read Artella paths cache "{}": {}'.format(cache_path, exc))
+
+        code_extensions = ('.py', '.pyc', '.pyd', '.so', '.zip', '.egg')
+        artella_paths = list()
+        found_paths = set()
+        for subdir, dirs, files in os.walk(artella_folder):
+            paths_to_add = list()
+            if any(file_name.endswith(code_extensions) for file_name in files):
+                paths_to_add.append(subdir)
+            if '__init__.py' in files and subdir != artella_folder:
+                paths_to_add.append(os.path.dirname(subdir))
+            for path_to_add in paths_to_add:
+                if path_to_add not in found_paths:
+                    found_paths.add(path_to_add)
+                    artella_paths.append(path_to_add)
+
+        try:
+            with open(cache_path, 'w') as cache_file:
+                json.dump({'key': cache_key, 'paths': artella_paths}, cache_file)
+        except Exception as exc:
+            LOGGER.warning('Impossible to write Artella paths cache "{}": {}'.format(cache_path, exc))
+
+        return artella_paths
+
+    def _get_artella_paths_cache_key(self, artella_folder):
+        """
+        Returns key that identifies current Artella installation. Used to invalidate Artella paths cache
+        :param artella_folder: str
+        :return: str
+        """
+
+        artella_version = ''
+        version_file = os.path.join(os.path.dirname(artella_folder), ARTELLA_NEXT_VERSION_FILE_NAME)
+        if os.path.isfile(version_file):
+            with open(version_file) as f:
+                artella_version = f.readline().strip()
+
+        return '{}|{}|{}'.format(os.path.normpath(artella_folder), artella_version, os.path.getmtime(artella_folder))
+
+    @traced('close_artella_app')
     def _close_all_artella_app_processes(self):
         """
         Closes all Artella app (lifecycler.exe) processes
@@ -1815,7 +4557,46 @@ class ArtellaUpdater(QWidget, object):
             LOGGER.info('Launching Artella App ...')
             LOGGER.debug('Artella App File: {0}'.format(artella_app_file))
 
-            os.startfile('"{}"'.format(artella_app_file.replace('\\', '//')))
+            with self._trace_span('launch_artella_app', 'subprocess', app_file=artella_app_file):
+                os.startfile('"{}"'.format(artella_app_file.replace('\\', '//')))
+
+    def _on_instance_message(self, message):
+        """
+        Internal callback function that is called when other instance of the app is launched
+        :param message: dict, arguments of the new instance
+        """
+
+        LOGGER.info('New instance launched with arguments: {}'.format(message))
+        self._splash.show()
+        self._splash.raise_()
+        self._splash.activateWindow()
+
+        self._instance_messages.append(message)
+        if not self._loading:
+            self._process_instance_messages()
+
+    def _process_instance_messages(self):
+        """
+        Internal function that handles the arguments forwarded by other instances once app is not busy
+        """
+
+        messages = self._instance_messages
+        self._instance_messages = list()
+        for message in messages:
+            if bool(message.get('dev', False)) != bool(self._dev):
+                QMessageBox.information(
+                    self._splash, '{} Launcher is already running'.format(self._project_name),
+                    'Close the running {} Launcher before launching it in {} mode.'.format(
+                        self._project_name, 'development' if message.get('dev') else 'production'))
+                continue
+            new_tag = message.get('tag', None)
+            if not new_tag or self._dev or new_tag == self._deploy_tag:
+                continue
+            tag_index = self._deploy_tag_combo.findText(new_tag)
+            if tag_index < 0:
+                self._show_error('Tag "{}" is not available!'.format(new_tag))
+                continue
+            self._deploy_tag_combo.setCurrentIndex(tag_index)
 
     def _on_open_tag_info(self):
         """
@@ -1909,15 +4690,16 @@ class ArtellaUpdater(QWidget, object):
                         self._project_name, '\n\t'.join(dirs_to_remove)), question_flags)
             if res == QMessageBox.Yes or force:
                 try:
+                    # App is closed right after, so we wait until folders are removed
                     for d in dirs_to_remove:
                         if os.path.isdir(d):
-                            shutil.rmtree(d, ignore_errors=True)
+                            self._remove_folder(d, wait=True)
                         elif os.path.isfile(d):
                             os.remove(d)
                     after_files = os.listdir(self._install_path)
                     if not after_files:
                         try:
-                            os.remove(self._install_path)
+                            os.rmdir(self._install_path)
                         except Exception:
                             pass
                     self._set_config(self._install_env_var, '')
@@ -1928,71 +4710,87 @@ class ArtellaUpdater(QWidget, object):
                     QApplication.instance().quit()
                 except Exception as e:
                     self._set_config(self._install_env_var, '')
-                    QMessageBox.critical(
-                        self._splash, 'Error during {} Tools uninstall process'.format(self._project_name),
+                    self._show_message(
+                        'Error during {} Tools uninstall process'.format(self._project_name),
                         'Error during {} Tools uninstall: {} | {}\n\n'
                         'You will need to remove following folders manually:\n\n{}'.format(
-                            self._project_name, e, traceback.format_exc(), '\n\t'.join(dirs_to_remove)))
+                            self._project_name, e, traceback.format_exc(), '\n\t'.join(dirs_to_remove)),
+                        level='error')
         else:
             msg = '{} tools are not installed! Launch any DCC first!'.format(self._project_name)
-            QMessageBox.information(
-                self._splash, '{} Tools are not installed'.format(self._project_name),
-                msg
-            )
+            self._show_message('{} Tools are not installed'.format(self._project_name), msg)
             LOGGER.warning(msg)
 
     def _run_subprocess(self, command=None, commands_list=None, close_fds=False, hide_console=True,
-                        stdout=None, stderr=None, shell=True):
-
-        if not commands_list:
-            commands_list = list()
-
-        creation_flags = 0
-        if hide_console and not self._dev:
-            creation_flags = 0x08000000         # No window
-
-        stdout = stdout or subprocess.PIPE
-        stderr = stderr or subprocess.PIPE
-
-        if sys.version_info[0] == 2:
-            stdin = open(os.devnull, 'wb')
-        else:
-            stdin = subprocess.DEVNULL
-
-        if close_fds:
-            stdout = None
+                        stdout=None, stderr=None, shell=False):
+        """
+        Internal function that launches a subprocess. Processes are launched in the same way in all platforms (see
+        get_popen_kwargs). Commands are never executed through a shell; command strings are split into arguments
+        :param command: str
+        :param commands_list: list(str)
+        :param close_fds: bool, whether the process is detached from the updater
+        :param hide_console: bool
+        :param stdout: file or int
+        :param stderr: file or int
+        :param shell: bool, kept for compatibility
+        :return: subprocess.Popen
+        """
 
         if command:
-            if is_windows():
-                if close_fds:
-                    process = subprocess.Popen(
-                        command, close_fds=close_fds, creationflags=creation_flags, stdout=stdout)
-                else:
-                    process = subprocess.Popen(
-                        command, close_fds=close_fds, creationflags=creation_flags,
-                        stdout=stdout, stdin=stdin, stderr=stderr
-                    )
-            elif is_mac():
-                process = subprocess.Popen(command, close_fds=close_fds, stdout=stdout, shell=shell)
-            else:
-                process = subprocess.Popen(command, close_fds=close_fds, stdout=stdout)
+            # Windows processes receive a command line, so it is not split
+            args = command if is_windows() else shlex.split(command)
         elif commands_list:
-            if is_windows():
-                process = subprocess.Popen(
-                    commands_list, close_fds=close_fds, creationflags=creation_flags,
-                    stdout=stdout, stdin=stdin, stderr=stderr)
-            elif is_mac():
-                process = subprocess.Popen(commands_list, close_fds=close_fds, stdout=stdout, shell=shell)
-            else:
-                process = subprocess.Popen(commands_list, close_fds=close_fds, stdout=stdout)
+            args = commands_list
         else:
             msg = "Impossible to launch subprocess: command={}, commands_list={}, close_fds={}, hide_console={}".format(
                 command, commands_list, close_fds, hide_console)
             self._show_error(msg)
             return None
 
+        process = subprocess.Popen(args, **get_popen_kwargs(
+            detached=close_fds, hide_console=hide_console and not self._dev, stdout=stdout, stderr=stderr))
+
+        (getattr(self, '_tracer', None) or NULL_TRACER).instant(
+            'start_process', 'subprocess', command=command or commands_list, pid=process.pid)
+
         return process
 
+    def _start_process(self, command=None, commands_list=None, timeout=None, line_hook=None, keep_output=False):
+        """
+        Internal function that launches a subprocess without waiting for it
+        :param command: str
+        :param commands_list: list(str)
+        :param timeout: float, maximum time (in seconds) the process can run
+        :param line_hook: fn(stream_name, line)
+        :param keep_output: bool
+        :return: ArtellaProcess or None
+        """
+
+        try:
+            process = self._run_subprocess(command=command, commands_list=commands_list)
+        except OSError as exc:
+            LOGGER.warning('Impossible to launch process "{}": {}'.format(command or commands_list, exc))
+            return None
+        if not process:
+            return None
+
+        return ArtellaProcess(process, timeout=timeout, line_hook=line_hook, keep_output=keep_output)
+
+    def _wait_process(self, process):
+        """
+        Internal function that waits until given process finishes while keeping UI responsive
+        :param process: ArtellaProcess or None
+        :return: int or None, return code of the process
+        """
+
+        if not process:
+            return None
+
+        app = QApplication.instance()
+        in_main_thread = app and QThread.currentThread() == app.thread()
+
+        return process.wait(idle_hook=app.processEvents if in_main_thread else None)
+
     def _check_call(self, commands_list, shell=True):
         if not commands_list:
             msg = "Impossible to launch subprocess: commands_list={}".format(commands_list)
@@ -2005,7 +4803,7 @@ class ArtellaUpdater(QWidget, object):
 
     def _show_error(self, msg, title='Error'):
         LOGGER.error(msg)
-        QMessageBox.critical(self._splash, title, msg)
+        self._show_message(title, msg, level='error')
 
 
 @contextlib.contextmanager
@@ -2078,6 +4876,7 @@ if __name__ == '__main__':
     parser.add_argument('--project-name', required=False)
     parser.add_argument('--project-type', required=False)
     parser.add_argument('--version', required=False, default="0.0.0")
+    parser.add_argument('--tag', required=False, default=None)
     parser.add_argument('--repository', required=False)
     parser.add_argument('--icon-path', required=False, default=None)
     parser.add_argument('--splash-path', required=False, default=None)
@@ -2085,8 +4884,61 @@ if __name__ == '__main__':
     parser.add_argument('--requirements-path', required=False, default=None)
     parser.add_argument('--artellapipe-configs-path', required=False, default=None)
     parser.add_argument('--dev', required=False, default=False, action='store_true')
+    parser.add_argument('--download-connections', required=False, type=int, default=1)
+    parser.add_argument('--stream-extract', required=False, default=False, action='store_true')
+    parser.add_argument('--selective-extract', required=False, default=False, action='store_true')
+    parser.add_argument('--telemetry', required=False, default=None, choices=['on', 'off'])
+    parser.add_argument('--telemetry-report', required=False, default=False, action='store_true')
+    parser.add_argument('--telemetry-periods', required=False, type=int, default=None)
+    parser.add_argument('--headless', required=False, default=False, action='store_true')
+    parser.add_argument('--accept-latest', required=False, default=False, action='store_true')
+    parser.add_argument('--install-path', required=False, default=None)
+    parser.add_argument('--clean', required=False, default=False, action='store_true')
+    parser.add_argument('--remove-installation', required=False, default=False, action='store_true')
+    parser.add_argument('--snapshots-path', required=False, default=None)
+    parser.add_argument('--export-snapshot', required=False, default=False, action='store_true')
+    parser.add_argument('--mirror-url', required=False, default=None)
+    parser.add_argument('--prefetch', required=False, default=False, action='store_true')
+    parser.add_argument('--mirror-server', required=False, default=False, action='store_true')
+    parser.add_argument('--mirror-port', required=False, type=int, default=MIRROR_PORT)
+    parser.add_argument('--mirror-cache-path', required=False, default=None)
+    parser.add_argument('--mirror-upstream', required=False, default=DEFAULT_MIRROR_URL)
+    parser.add_argument('--mirror-repository', required=False, default=None, action='append')
     args = parser.parse_args()
 
+    if args.telemetry_report:
+        project_name = read_app_config().get('name', None) or args.project_name or ''
+        app_name = '{}_app'.format(project_name.replace(' ', '').lower())
+        print(ArtellaTelemetry(os.path.join(
+            os.path.dirname(appdirs.user_data_dir(app_name)), '{}_telemetry.db'.format(app_name))).format_report(
+            periods=args.telemetry_periods))
+        sys.exit()
+
+    if args.mirror_server:
+        # By default, only the deployment repository of the app is mirrored
+        mirror_repositories = args.mirror_repository or [
+            repository for repository in [read_app_config().get('repository', None) or args.repository] if repository]
+        if not mirror_repositories:
+            parser.error('--mirror-repository is required to start a mirror server')
+        mirror = ArtellaMirror(
+            args.mirror_cache_path or appdirs.user_cache_dir('artella_mirror'), mirror_repositories,
+            upstream_url=args.mirror_upstream)
+        mirror_server = ArtellaMirrorServer(('', args.mirror_port), mirror)
+        LOGGER.info('Serving mirror of "{}" ({}) in port {}. Cache: "{}"'.format(
+            args.mirror_upstream, ', '.join(mirror.repositories), mirror_server.server_address[1],
+            mirror.cache_folder))
+        try:
+            mirror_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            mirror_server.server_close()
+        sys.exit()
+
+    # Headless mode does not need a display
+    if args.headless and not os.environ.get('QT_QPA_PLATFORM'):
+        os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
     with application() as app:
 
         icon_path = args.icon_path
@@ -2104,13 +4956,34 @@ if __name__ == '__main__':
                 project_type=args.project_type,
                 app_version=args.version,
                 deployment_repository=args.repository,
+                deploy_tag=args.tag,
                 splash_path=args.splash_path,
                 script_path=args.script_path,
                 requirements_path=args.requirements_path,
                 artellapipe_configs_path=args.artellapipe_configs_path,
                 dev=args.dev,
-                update_icon=not bool(icon_path)
+                download_connections=args.download_connections,
+                stream_extract=args.stream_extract,
+                selective_extract=args.selective_extract,
+                telemetry={'on': True, 'off': False}.get(args.telemetry, None),
+                update_icon=not bool(icon_path),
+                headless=args.headless,
+                policy={
+                    'accept_latest': args.accept_latest, 'install_path': args.install_path, 'clean': args.clean,
+                    'remove_installation': args.remove_installation},
+                snapshots_path=args.snapshots_path,
+                export_snapshot=args.export_snapshot,
+                mirror_url=args.mirror_url,
+                prefetch=args.prefetch
             )
             valid_app = True
         except Exception as exc:
-            raise ArtellaUpdaterException(exc)
+            if args.headless:
+                sys.stdout.write('{}\n'.format(json.dumps(
+                    {'event': 'finished', 'valid': False, 'error': str(exc), 'time': time.time()}, sort_keys=True)))
+                sys.stdout.flush()
+            raise ArtellaUpdaterException(exc, show_dialog=not args.headless)
+
+        # Arguments were forwarded to the instance that is already running
+        if new_app.forwarded:
+            sys.exit()
@@ -351,6 +351,9 @@ class LauncherGenerator(object):
     def _get_default_app_path(self):
         return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
 
+    def _get_package_root_path(self):
+        return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
     def _get_updater_logging_path(self):
         logging_name = '__logging__.ini'
         logging_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), logging_name)
@@ -440,6 +443,9 @@ class LauncherGenerator(object):
 
         spec_cmd += ' --icon={}'.format(self._icon_path)
 
+        # Updater app imports the archive extraction engine from artellapipe-launcher package
+        spec_cmd += ' --paths="{}"'.format(self._get_package_root_path())
+
         hidden_imports_cmd = self._retrieve_hidden_imports()
         spec_cmd += ' {}'.format(hidden_imports_cmd)
 
@@ -473,7 +479,9 @@ class LauncherGenerator(object):
         """
 
         hidden_import_cmd = '--hidden-import'
-        hidden_imports = ['pythonjsonlogger', 'pythonjsonlogger.jsonlogger', 'Qt']
+        hidden_imports = [
+            'pythonjsonlogger', 'pythonjsonlogger.jsonlogger', 'Qt', 'artellapipe.launcher.utils.archive',
+            'artellapipe.launcher.utils.lock']
         cmd = ''
         for mod in hidden_imports:
             cmd += '{} {} '.format(hidden_import_cmd, mod)
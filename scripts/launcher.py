@@ -37,7 +37,7 @@ if __name__ == '__main__':
 
     loader_mod.init(dev=args.dev)
     from artellapipe.launcher import loader
-    loader.init()
+    loader.init(lazy=True)
     from artellapipe.launcher.core import launcher
     launcher.run(project=getattr(artellapipe, args.project_name),
                  install_path=args.install_path, paths_to_register=args.paths_to_register,
@@ -0,0 +1,216 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains fixtures used by artellapipe-launcher benchmarks.
+Benchmarks run offline: GitHub release pages and deployment archives are served by a local HTTP server and pip is
+replaced by a fake executable. Timings (and optionally peak memory) are stored in a JSON history file and a stage is
+reported if it is slower than the median of previous runs executed in the same environment.
+Benchmarks are opt-in, so wall-clock timings do not affect unit test runs: set ARTELLA_BENCHMARKS=1 to run them and
+ARTELLA_BENCHMARK_STRICT=1 to fail on regressions. CI runs them in strict mode in a separate job that keeps the
+history file in its build cache
+"""
+
+import os
+import sys
+import stat
+import shutil
+import tempfile
+import threading
+import timeit
+import warnings
+
+import pytest
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+try:
+    from http.server import SimpleHTTPRequestHandler
+except ImportError:
+    from SimpleHTTPServer import SimpleHTTPRequestHandler
+
+from tests.benchmarks.utils import (
+    BENCHMARK_ENABLE_ENV, BENCHMARK_STRICT_ENV, BENCHMARK_HISTORY_ENV, BENCHMARK_TOLERANCE_ENV, BENCHMARK_TOLERANCE,
+    BENCHMARK_ROUNDS, BENCHMARK_REPOSITORY, BENCHMARK_TAGS, BenchmarkHistory, BenchmarkRegressionWarning,
+    ThreadingHTTPServer, is_env_enabled, create_release_page, create_deployment_archive)
+
+
+def pytest_collection_modifyitems(config, items):
+    if is_env_enabled(BENCHMARK_ENABLE_ENV):
+        return
+
+    benchmarks_folder = os.path.dirname(os.path.abspath(__file__))
+    skip_benchmark = pytest.mark.skip(reason='benchmarks are disabled, set {}=1 to run them'.format(
+        BENCHMARK_ENABLE_ENV))
+    for item in items:
+        if os.path.abspath(str(item.fspath)).startswith(benchmarks_folder + os.sep):
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(scope='session')
+def benchmark_history(request):
+    history_path = os.environ.get(BENCHMARK_HISTORY_ENV) or os.path.join(
+        str(request.config.rootdir), '.benchmarks', 'history.json')
+    tolerance = float(os.environ.get(BENCHMARK_TOLERANCE_ENV, BENCHMARK_TOLERANCE))
+    history = BenchmarkHistory(history_path, tolerance=tolerance)
+    yield history
+    history.save()
+
+
+@pytest.fixture
+def benchmark(benchmark_history):
+    """
+    Returns a function that executes the given function multiple times, stores its timings with the given stage name
+    and reports a warning if the stage is slower than in previous runs (or fails, if strict mode is enabled).
+    If memory tracing is enabled, peak memory is measured in an extra round, so tracing does not affect timings
+    """
+
+    def _benchmark(stage, func, setup=None, rounds=BENCHMARK_ROUNDS, trace_memory=False):
+        timings = list()
+        result = None
+        for _ in range(rounds):
+            if setup:
+                setup()
+            start_time = timeit.default_timer()
+            result = func()
+            timings.append(timeit.default_timer() - start_time)
+
+        peak_memory = None
+        if trace_memory and tracemalloc:
+            if setup:
+                setup()
+            tracemalloc.start()
+            try:
+                func()
+                peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        regression = benchmark_history.add(stage, timings, peak_memory=peak_memory)
+        if regression:
+            if is_env_enabled(BENCHMARK_STRICT_ENV):
+                pytest.fail(regression)
+            warnings.warn(regression, BenchmarkRegressionWarning)
+        return result
+
+    return _benchmark
+
+
+@pytest.fixture(scope='session')
+def benchmark_folder():
+    folder = tempfile.mkdtemp(prefix='artella_benchmark_')
+    yield folder
+    shutil.rmtree(folder, ignore_errors=True)
+
+
+@pytest.fixture(scope='session')
+def release_server(benchmark_folder):
+    """
+    Local HTTP server that serves a fake GitHub releases page and deployment archives of all benchmark tags
+    :return: str, URL of the server
+    """
+
+    root = os.path.join(benchmark_folder, 'server')
+    releases_folder = os.path.join(root, BENCHMARK_REPOSITORY, 'releases')
+    archive_folder = os.path.join(root, BENCHMARK_REPOSITORY, 'archive')
+    os.makedirs(releases_folder)
+    os.makedirs(archive_folder)
+    with open(os.path.join(releases_folder, 'index.html'), 'w') as release_file:
+        release_file.write(create_release_page(BENCHMARK_REPOSITORY, BENCHMARK_TAGS))
+    create_deployment_archive(
+        os.path.join(archive_folder, '{}.tar.gz'.format(BENCHMARK_TAGS[0])),
+        '{}-{}'.format(BENCHMARK_REPOSITORY.split('/')[-1], BENCHMARK_TAGS[0]))
+
+    class _Handler(SimpleHTTPRequestHandler):
+        def translate_path(self, path):
+            path = path.split('?', 1)[0].split('#', 1)[0]
+            return os.path.join(root, *[part for part in path.split('/') if part and part != '..'])
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+    yield 'http://127.0.0.1:{}'.format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope='session')
+def mirror_server(updater_module, release_server, benchmark_folder):
+    """
+    Updater mirror server whose upstream server is the local release server
+    :return: tuple(str, ArtellaMirror), URL of the mirror server and the mirror it serves
+    """
+
+    app = updater_module
+    mirror = app.ArtellaMirror(
+        os.path.join(benchmark_folder, 'mirror'), [BENCHMARK_REPOSITORY], upstream_url=release_server)
+    server = app.ArtellaMirrorServer(('127.0.0.1', 0), mirror)
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.daemon = True
+    server_thread.start()
+    yield 'http://127.0.0.1:{}'.format(server.server_address[1]), mirror
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope='session')
+def fake_pip(benchmark_folder):
+    """
+    Executable that behaves like "python -m pip install -r <file>": it reads the requirements file and prints
+    pip like output for each one of the requirements, without installing anything
+    :return: str
+    """
+
+    fake_pip_path = os.path.join(benchmark_folder, 'fake_python')
+    with open(fake_pip_path, 'w') as fake_pip_file:
+        fake_pip_file.write(
+            '#!{}\n'
+            'import sys\n'
+            'args = sys.argv[1:]\n'
+            'with open(args[args.index("-r") + 1]) as requirements_file:\n'
+            '    requirements = [line.strip() for line in requirements_file if line.strip()]\n'
+            'for requirement in requirements:\n'
+            '    print("Collecting {{}}".format(requirement))\n'
+            'print("Successfully installed {{}}".format(" ".join(r.split("==")[0] for r in requirements)))\n'.format(
+                sys.executable))
+    os.chmod(fake_pip_path, os.stat(fake_pip_path).st_mode | stat.S_IEXEC)
+
+    return fake_pip_path
+
+
+@pytest.fixture(scope='session')
+def updater(updater_module, release_server):
+    """
+    Returns an ArtellaUpdater whose deployment repository is served by the local release server.
+    App loading is skipped, so each benchmark can execute the stage it measures
+    """
+
+    app = updater_module
+
+    class BenchmarkUpdater(app.ArtellaUpdater):
+        def _read_config(self):
+            # Same data generate_launcher stores in config.json of frozen apps
+            return {
+                'name': 'ArtellaBenchmark', 'version': '0.0.1', 'repository': BENCHMARK_REPOSITORY,
+                'splash': 'splash.png', 'icon': 'artella_icon.ico', 'type': 'enterprise'}
+
+        def _load(self, clean=False):
+            return True
+
+        def _show_error(self, msg, title='Error'):
+            raise RuntimeError(msg)
+
+    qt_app = app.QApplication.instance() or app.QApplication([])
+    updater = BenchmarkUpdater(
+        app=qt_app, project_name='ArtellaBenchmark', project_type='enterprise', app_version='0.0.1',
+        deployment_repository=BENCHMARK_REPOSITORY, deploy_tag=BENCHMARK_TAGS[0], mirror_url=release_server)
+    yield updater
+    updater.close()
+    updater.deleteLater()
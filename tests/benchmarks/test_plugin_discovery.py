@@ -0,0 +1,121 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains benchmarks of Artella Launcher plugins discovery using synthetic plugin trees
+"""
+
+import os
+import sys
+import random
+
+import pytest
+
+pytest.importorskip('Qt')
+pytest.importorskip('tpDcc')
+
+from artellapipe.launcher.core import plugin as core_plugin
+
+PLUGIN_COUNTS = [10, 100, 1000]
+
+# Module level code of plugins, from cheap to expensive
+PLUGIN_IMPORTS = ['', 'import json', 'import xml.dom.minidom', 'import email.mime.multipart']
+PLUGIN_IMPORT_COSTS = [0, 100, 1000, 10000]
+
+PLUGIN_TEMPLATE = '''from artellapipe.launcher.core import plugin
+{imports}
+
+_DATA = [str(i) for i in range({import_cost})]
+
+
+class {class_name}(plugin.ArtellaLauncherPlugin):
+
+    LABEL = '{class_name}'
+    ORDER = {order}
+
+    def initialize(self):
+        pass
+
+    def uninitialize(self):
+        pass
+'''
+
+BROKEN_PLUGINS = [
+    'def broken_plugin(:\n',
+    'raise RuntimeError("Broken Artella Launcher Plugin")\n',
+    'import artella_benchmark_missing_module\n'
+]
+
+
+def _create_plugin_tree(root, plugin_count):
+    """
+    Creates given number of plugin files in given folder. Every 10th file redefines the plugin of the previous one
+    (duplicated ID) and every 20th file is broken
+    :return: tuple(list(str), int), names of the created modules and number of valid unique plugins
+    """
+
+    rng = random.Random(plugin_count)
+    module_names = list()
+    valid_plugins = 0
+    for i in range(plugin_count):
+        module_name = 'artella_benchmark_plugin_{}_{:04d}'.format(plugin_count, i)
+        if i % 20 == 19:
+            source = BROKEN_PLUGINS[i % len(BROKEN_PLUGINS)]
+        else:
+            plugin_index = i - 1 if i % 10 == 9 else i
+            if plugin_index == i:
+                valid_plugins += 1
+            source = PLUGIN_TEMPLATE.format(
+                imports=rng.choice(PLUGIN_IMPORTS), import_cost=rng.choice(PLUGIN_IMPORT_COSTS),
+                class_name='BenchmarkPlugin{}_{:04d}'.format(plugin_count, plugin_index), order=rng.randint(0, 100))
+        with open(os.path.join(root, '{}.py'.format(module_name)), 'w') as plugin_file:
+            plugin_file.write(source)
+        module_names.append(module_name)
+
+    return module_names, valid_plugins
+
+
+@pytest.fixture(scope='module', params=PLUGIN_COUNTS)
+def plugin_tree(request, tmpdir_factory):
+    root = str(tmpdir_factory.mktemp('plugins_{}'.format(request.param)))
+    module_names, valid_plugins = _create_plugin_tree(root, request.param)
+    yield request.param, root, module_names, valid_plugins
+    for module_name in module_names:
+        sys.modules.pop(module_name, None)
+
+
+def test_get_plugins(plugin_tree, benchmark):
+    plugin_count, root, module_names, valid_plugins = plugin_tree
+    plugin_manager = core_plugin.PluginManager(plugin_paths=[root])
+
+    plugins = benchmark(
+        'plugin_manager_get_plugins_{}'.format(plugin_count), plugin_manager.get_plugins, rounds=3, trace_memory=True)
+
+    assert len(plugins) == valid_plugins
+
+
+def test_get_plugin_from_module(plugin_tree, benchmark):
+    plugin_count, root, module_names, valid_plugins = plugin_tree
+    plugin_manager = core_plugin.PluginManager(plugin_paths=[root])
+    plugin_manager.get_plugins()
+    modules = [sys.modules[module_name] for module_name in module_names if module_name in sys.modules]
+
+    def _get_plugins_from_modules():
+        return [plug for module in modules for plug in plugin_manager.get_plugin_from_module(module)]
+
+    plugins = benchmark(
+        'plugin_manager_get_plugin_from_module_{}'.format(plugin_count), _get_plugins_from_modules, trace_memory=True)
+
+    # Modules that define a duplicated plugin are also found, get_plugins is the one that skips them
+    assert len(plugins) >= valid_plugins
+
+
+def test_sort_plugins(plugin_tree, benchmark):
+    plugin_count, root, module_names, valid_plugins = plugin_tree
+    plugins = core_plugin.PluginManager(plugin_paths=[root]).get_plugins()
+
+    sorted_plugins = benchmark(
+        'plugin_manager_sort_plugins_{}'.format(plugin_count),
+        lambda: core_plugin.PluginManager.sort_plugins(list(plugins)), trace_memory=True)
+
+    assert [plug.ORDER for plug in sorted_plugins] == sorted(plug.ORDER for plug in plugins)
@@ -0,0 +1,126 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains benchmarks of the main stages executed by artellapipe-launcher updater during bootstrap
+"""
+
+import os
+import shutil
+import tempfile
+
+from tests.benchmarks.utils import BENCHMARK_TAGS, BENCHMARK_MODULES, BENCHMARK_REQUIREMENTS
+
+
+def test_release_discovery(updater, benchmark):
+
+    def _discover():
+        return updater._get_all_releases(), updater._get_latest_deploy_tag()
+
+    all_releases, latest_tag = benchmark('release_discovery', _discover)
+
+    assert all_releases == BENCHMARK_TAGS
+    assert latest_tag == BENCHMARK_TAGS[0]
+
+
+def test_download_extract(updater, benchmark, benchmark_folder):
+    download_folder = os.path.join(benchmark_folder, 'download')
+
+    def _setup():
+        shutil.rmtree(download_folder, ignore_errors=True)
+        os.makedirs(download_folder)
+
+    def _download_extract():
+        archive_path = os.path.join(download_folder, 'deployment.tar.gz')
+        assert updater._download_file(updater._get_deploy_repository_url(), archive_path)
+        return updater._unzip_file(archive_path, os.path.join(download_folder, 'extracted'))
+
+    assert benchmark('download_extract', _download_extract, setup=_setup)
+    modules = list()
+    for root, dirs, files in os.walk(os.path.join(download_folder, 'extracted')):
+        modules.extend(file_name for file_name in files if file_name.endswith('.py'))
+    assert len(modules) == BENCHMARK_MODULES
+
+
+def test_mirror_download(updater, benchmark, benchmark_folder, mirror_server):
+    mirror_url, mirror = mirror_server
+    download_folder = os.path.join(benchmark_folder, 'mirror_download')
+    updater_mirror_url = updater._mirror_url
+    updater._mirror_url = mirror_url
+
+    def _setup():
+        shutil.rmtree(download_folder, ignore_errors=True)
+        os.makedirs(download_folder)
+
+    def _discover_download():
+        archive_path = os.path.join(download_folder, 'deployment.tar.gz')
+        assert updater._download_file(updater._get_deploy_repository_url(), archive_path)
+        return updater._get_all_releases()
+
+    try:
+        all_releases = benchmark('mirror_download', _discover_download, setup=_setup)
+    finally:
+        updater._mirror_url = updater_mirror_url
+
+    assert all_releases == BENCHMARK_TAGS
+    # Release page is cached for some minutes and archives are downloaded once
+    assert mirror.upstream_requests == 2
+
+
+def test_config_read_write(updater, benchmark):
+
+    def _read_write():
+        config_store = updater._get_config_store()
+        with config_store.batch():
+            for i in range(100):
+                updater._set_config('benchmark_key_{}'.format(i), i)
+        config_store.load(force=True)
+        return updater.get_config_data()
+
+    config_data = benchmark('config_read_write', _read_write)
+
+    assert config_data['benchmark_key_99'] == 99
+
+
+def test_requirements_parsing(updater, benchmark, fake_pip):
+    updater._selective_extract = True
+    updater._venv_info = {'venv_python': fake_pip, 'pip_exe': fake_pip}
+    temp_folders = list()
+
+    def _parse_requirements():
+        temp_folder = tempfile.mkdtemp()
+        temp_folders.append(temp_folder)
+        assert updater._download_deployment_requirements(temp_folder)
+        assert updater._install_deployment_requirements()
+        return updater._get_requirements_hash()
+
+    try:
+        assert benchmark('requirements_parsing', _parse_requirements)
+        with open(updater._requirements_path) as requirements_file:
+            assert requirements_file.read().splitlines() == BENCHMARK_REQUIREMENTS
+    finally:
+        updater._selective_extract = False
+        updater._venv_info = dict()
+        for temp_folder in temp_folders:
+            shutil.rmtree(temp_folder, ignore_errors=True)
+
+
+def test_plugin_discovery(updater, benchmark, benchmark_folder):
+    artella_folder = os.path.join(benchmark_folder, 'Artella', '1.0.0')
+    for i in range(20):
+        plugin_folder = os.path.join(artella_folder, 'plugins', 'plugin_{}'.format(i), 'python', 'plugin_{}'.format(i))
+        os.makedirs(plugin_folder)
+        open(os.path.join(plugin_folder, '__init__.py'), 'w').close()
+        resources_folder = os.path.join(artella_folder, 'plugins', 'plugin_{}'.format(i), 'resources')
+        os.makedirs(resources_folder)
+        for j in range(20):
+            open(os.path.join(resources_folder, 'icon_{}.png'.format(j)), 'w').close()
+    cache_path = os.path.join(updater._get_app_folder(), '{}_artella_paths.json'.format(updater._get_app_name()))
+
+    def _setup():
+        if os.path.isfile(cache_path):
+            os.remove(cache_path)
+
+    artella_paths = benchmark('plugin_discovery', lambda: updater._get_artella_paths(artella_folder), setup=_setup)
+
+    assert len(artella_paths) == 40
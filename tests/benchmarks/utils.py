@@ -0,0 +1,188 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains constants and utils used by artellapipe-launcher benchmarks
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import tarfile
+import platform
+
+try:
+    from http.server import HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import HTTPServer
+    from SocketServer import ThreadingMixIn
+
+# Defines environment variable that must be set to run benchmarks
+BENCHMARK_ENABLE_ENV = 'ARTELLA_BENCHMARKS'
+
+# Defines environment variable that can be set to fail benchmarks that are slower than their baseline
+BENCHMARK_STRICT_ENV = 'ARTELLA_BENCHMARK_STRICT'
+
+# Defines environment variable that can be used to define the path of the timings history file
+BENCHMARK_HISTORY_ENV = 'ARTELLA_BENCHMARK_HISTORY'
+
+# Defines environment variable that can be used to define allowed slowdown (0.5 means 50% slower than baseline)
+BENCHMARK_TOLERANCE_ENV = 'ARTELLA_BENCHMARK_TOLERANCE'
+
+BENCHMARK_TOLERANCE = 0.5
+# Regressions smaller than this value (in seconds) are ignored, to avoid failures caused by timer noise
+BENCHMARK_MIN_DELTA = 0.02
+# Number of previous runs used to compute the baseline of a stage
+BENCHMARK_WINDOW = 5
+# Maximum number of runs stored in the history file
+BENCHMARK_HISTORY_SIZE = 100
+BENCHMARK_ROUNDS = 5
+
+BENCHMARK_REPOSITORY = 'artella/benchmark'
+BENCHMARK_TAGS = ['1.{}.0'.format(i) for i in range(30, 0, -1)]
+BENCHMARK_MODULES = 200
+BENCHMARK_REQUIREMENTS = ['package{}=={}.0.0'.format(i, i % 5 + 1) for i in range(50)]
+
+
+class BenchmarkRegressionWarning(UserWarning):
+    """
+    Warning raised when a benchmark stage is slower than its baseline
+    """
+
+    pass
+
+
+def is_env_enabled(env_name):
+    """
+    Returns whether given environment variable is set to a true value
+    :param env_name: str
+    :return: bool
+    """
+
+    return os.environ.get(env_name, '').lower() in ('1', 'true', 'yes', 'on')
+
+
+class BenchmarkHistory(object):
+    """
+    Stores stage timings of benchmark runs and detects regressions against previous runs
+    """
+
+    def __init__(self, history_path, tolerance=BENCHMARK_TOLERANCE, window=BENCHMARK_WINDOW):
+        self._history_path = history_path
+        self._tolerance = tolerance
+        self._window = window
+        self._environment = '{}-{}-{}'.format(
+            platform.system(), platform.python_implementation(), '.'.join(str(v) for v in sys.version_info[:2]))
+        self._runs = self._load()
+        self._stages = dict()
+        self._regressions = list()
+
+    def _load(self):
+        if not os.path.isfile(self._history_path):
+            return list()
+        try:
+            with open(self._history_path, 'r') as history_file:
+                runs = json.load(history_file)
+        except Exception:
+            return list()
+
+        return runs if isinstance(runs, list) else list()
+
+    def baseline(self, stage):
+        """
+        Returns the median time of the given stage in the last runs executed in current environment
+        :param stage: str
+        :return: float or None
+        """
+
+        timings = [
+            run['stages'][stage]['median'] for run in self._runs
+            if run.get('environment') == self._environment and stage in run.get('stages', dict())]
+        timings = sorted(timings[-self._window:])
+        if not timings:
+            return None
+
+        return timings[len(timings) // 2]
+
+    def add(self, stage, timings, peak_memory=None):
+        """
+        Adds timings of the given stage to current run
+        :param stage: str
+        :param timings: list(float)
+        :param peak_memory: int, peak memory (in bytes) allocated by the stage
+        :return: str, regression message or None if stage is not slower than its baseline
+        """
+
+        sorted_timings = sorted(timings)
+        median = sorted_timings[len(sorted_timings) // 2]
+        self._stages[stage] = {'median': median, 'min': sorted_timings[0], 'rounds': len(timings)}
+        if peak_memory is not None:
+            self._stages[stage]['peak_memory'] = peak_memory
+
+        baseline = self.baseline(stage)
+        if baseline is None:
+            return None
+        if median > baseline * (1.0 + self._tolerance) and median - baseline > BENCHMARK_MIN_DELTA:
+            msg = 'Stage "{}" regressed: {:.4f}s (baseline {:.4f}s, tolerance {:.0f}%)'.format(
+                stage, median, baseline, self._tolerance * 100)
+            self._regressions.append(msg)
+            return msg
+
+        return None
+
+    def save(self):
+        """
+        Stores current run in history file. Runs with regressions are not stored, so they do not change the baseline
+        """
+
+        if not self._stages or self._regressions:
+            return
+
+        self._runs.append({'timestamp': time.time(), 'environment': self._environment, 'stages': self._stages})
+        history_folder = os.path.dirname(self._history_path)
+        if history_folder and not os.path.isdir(history_folder):
+            os.makedirs(history_folder)
+        with open(self._history_path, 'w') as history_file:
+            json.dump(self._runs[-BENCHMARK_HISTORY_SIZE:], history_file, indent=2)
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def create_release_page(repository, tags):
+    """
+    Returns HTML with the structure of a GitHub releases page: a formal latest release followed by a timeline of tags
+    """
+
+    entries = [
+        '<div class="release-entry"><span class="label-latest">Latest release</span>'
+        '<div class="release-header"><a href="/{0}/releases/tag/{1}">'
+        '<span class="css-truncate-target">{1}</span></a></div>'
+        '<div class="markdown-body">Release {1}</div></div>'.format(repository, tags[0])]
+    timeline = ''.join(
+        '<div class="release-entry"><a href="/{0}/releases/tag/{1}">{1}</a></div>'.format(repository, tag)
+        for tag in tags[1:])
+    entries.append('<div class="release-entry release-timeline-tags">{}</div>'.format(timeline))
+
+    return '<html><body><div class="releases">{}</div></body></html>'.format(''.join(entries))
+
+
+def create_deployment_archive(archive_path, root_name):
+    """
+    Creates a tarball with the structure of a GitHub repository archive
+    """
+
+    def _add(tar_ref, name, data):
+        member = tarfile.TarInfo('{}/{}'.format(root_name, name))
+        member.size = len(data)
+        member.mtime = time.time()
+        tar_ref.addfile(member, io.BytesIO(data))
+
+    with tarfile.open(archive_path, 'w:gz') as tar_ref:
+        for i in range(BENCHMARK_MODULES):
+            _add(tar_ref, 'artellapipe/module_{}.py'.format(i), 'value = {}\n'.format(i).encode() * 100)
+        _add(tar_ref, 'requirements.txt', '\n'.join(BENCHMARK_REQUIREMENTS).encode())
@@ -0,0 +1,70 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains fixtures shared by artellapipe-launcher tests
+"""
+
+import os
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def updater_module(tmp_path_factory):
+    """
+    Imports updater script with an offscreen Qt platform and user folders redirected to a temporary folder
+    """
+
+    pytest.importorskip('PySide2')
+    pytest.importorskip('bs4')
+    pytest.importorskip('lxml')
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    home_folder = str(tmp_path_factory.mktemp('home'))
+    os.makedirs(os.path.join(home_folder, 'artellapipe', 'logs'))
+    old_environ = dict(os.environ)
+    os.environ['HOME'] = home_folder
+    os.environ['XDG_DATA_HOME'] = os.path.join(home_folder, '.local', 'share')
+    os.environ['XDG_CONFIG_HOME'] = os.path.join(home_folder, '.config')
+
+    scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts')
+    sys.path.insert(0, scripts_path)
+    try:
+        import app
+        yield app
+    finally:
+        sys.path.remove(scripts_path)
+        os.environ.clear()
+        os.environ.update(old_environ)
+
+
+@pytest.fixture(scope='session')
+def offline_updater(updater_module):
+    """
+    Returns an ArtellaUpdater that does not access the network. App loading is skipped, so each test can execute
+    the stage it checks
+    """
+
+    app = updater_module
+
+    class OfflineUpdater(app.ArtellaUpdater):
+        def _read_config(self):
+            return {
+                'name': 'ArtellaTest', 'version': '0.0.1', 'repository': 'artella/test', 'splash': 'splash.png',
+                'icon': 'artella_icon.ico', 'type': 'enterprise'}
+
+        def _load(self, clean=False):
+            return True
+
+        def _show_error(self, msg, title='Error'):
+            raise RuntimeError(msg)
+
+    qt_app = app.QApplication.instance() or app.QApplication([])
+    updater = OfflineUpdater(
+        app=qt_app, project_name='ArtellaTest', project_type='enterprise', app_version='0.0.1',
+        deployment_repository='artella/test', deploy_tag='1.0.0', mirror_url='http://127.0.0.1:9')
+    yield updater
+    updater.close()
+    updater.deleteLater()
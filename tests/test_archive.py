@@ -0,0 +1,97 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher archive extraction engine
+"""
+
+import os
+import io
+import stat
+import zipfile
+import tarfile
+
+import pytest
+
+from artellapipe.launcher.utils import archive
+
+
+def test_extract_zip_archive(tmpdir):
+    archive_path = str(tmpdir.join('archive.zip'))
+    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+        zip_ref.writestr('package/', '')
+        for i in range(20):
+            zip_ref.writestr('package/module_{}.py'.format(i), 'value = {}\n'.format(i))
+
+    progress = list()
+    destination = str(tmpdir.join('extracted'))
+    total = archive.extract_archive(
+        archive_path, destination, workers=4, progress_hook=lambda **kwargs: progress.append(kwargs))
+
+    assert total == 20
+    assert len(os.listdir(os.path.join(destination, 'package'))) == 20
+    assert progress[-1]['members_done'] == 20
+
+
+def test_extract_tar_archive_skips_links(tmpdir):
+    archive_path = str(tmpdir.join('archive.tar.gz'))
+    with tarfile.open(archive_path, 'w:gz') as tar_ref:
+        member = tarfile.TarInfo('package/requirements.txt')
+        member.size = 3
+        tar_ref.addfile(member, io.BytesIO(b'foo'))
+        link = tarfile.TarInfo('package/link')
+        link.type = tarfile.SYMTYPE
+        link.linkname = '/etc/passwd'
+        tar_ref.addfile(link)
+
+    destination = str(tmpdir.join('extracted'))
+    archive.extract_archive(archive_path, destination)
+
+    assert os.listdir(os.path.join(destination, 'package')) == ['requirements.txt']
+
+
+def test_extract_archive_rejects_unsafe_paths(tmpdir):
+    archive_path = str(tmpdir.join('archive.zip'))
+    with zipfile.ZipFile(archive_path, 'w') as zip_ref:
+        zip_ref.writestr('../outside.txt', 'foo')
+
+    with pytest.raises(ValueError):
+        archive.extract_archive(archive_path, str(tmpdir.join('extracted')))
+    assert not tmpdir.join('outside.txt').check()
+
+
+def test_extract_archive_validates_crc(tmpdir):
+    archive_path = str(tmpdir.join('archive.zip'))
+    with zipfile.ZipFile(archive_path, 'w') as zip_ref:
+        zip_ref.writestr('file.txt', b'artella' * 100)
+    with open(archive_path, 'rb') as archive_file:
+        data = bytearray(archive_file.read())
+    data[data.find(b'artella')] = ord('b')
+    with open(archive_path, 'wb') as archive_file:
+        archive_file.write(data)
+
+    destination = str(tmpdir.join('extracted'))
+    with pytest.raises(zipfile.BadZipfile):
+        archive.extract_archive(archive_path, destination)
+    assert not os.path.isfile(os.path.join(destination, 'file.txt'))
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink') or os.name == 'nt', reason='requires POSIX symbolic links')
+def test_extract_tar_archive_keeps_metadata(tmpdir):
+    archive_path = str(tmpdir.join('archive.tar'))
+    with tarfile.open(archive_path, 'w') as tar_ref:
+        member = tarfile.TarInfo('venv/bin/python3')
+        member.size = 3
+        member.mode = 0o4777
+        tar_ref.addfile(member, io.BytesIO(b'foo'))
+        link = tarfile.TarInfo('venv/bin/python')
+        link.type = tarfile.SYMTYPE
+        link.linkname = 'python3'
+        tar_ref.addfile(link)
+
+    destination = str(tmpdir.join('extracted'))
+    archive.extract_archive(archive_path, destination, keep_metadata=True)
+
+    bin_path = os.path.join(destination, 'venv', 'bin')
+    assert os.readlink(os.path.join(bin_path, 'python')) == 'python3'
+    assert stat.S_IMODE(os.stat(os.path.join(bin_path, 'python3')).st_mode) == 0o755
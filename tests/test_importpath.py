@@ -0,0 +1,112 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher import path utils
+"""
+
+import os
+import sys
+import types
+import threading
+import importlib.machinery
+
+from artellapipe.launcher.utils import importpath
+
+
+def test_compact_paths(tmpdir):
+    path_a = str(tmpdir.mkdir('a'))
+    path_b = str(tmpdir.mkdir('b'))
+    missing_path = str(tmpdir.join('missing'))
+
+    paths = [path_a, path_b, path_a + os.sep, missing_path, '']
+    assert importpath.compact_paths(paths) == [path_a, path_b]
+    assert importpath.compact_paths(paths, profile={path_b: 10, path_a: 1}) == [path_b, path_a]
+
+
+def test_record_import_profile(tmpdir):
+    path_a = str(tmpdir.mkdir('a'))
+    path_b = str(tmpdir.mkdir('b'))
+    modules = dict()
+    for i, path in enumerate([path_a, path_a, path_b]):
+        module = types.ModuleType('module_{}'.format(i))
+        module.__file__ = os.path.join(path, 'module_{}.py'.format(i))
+        modules[module.__name__] = module
+    modules['builtin'] = types.ModuleType('builtin')
+
+    profile_path = str(tmpdir.join('import_profile.json'))
+    importpath.record_import_profile([path_a, path_b], profile_path, modules=modules)
+    assert importpath.load_import_profile(profile_path) == {path_a: 2, path_b: 1}
+
+    # Counts of all sessions are accumulated
+    importpath.record_import_profile([path_a, path_b], profile_path, modules=modules)
+    assert importpath.load_import_profile(profile_path) == {path_a: 4, path_b: 2}
+
+
+def test_record_import_profile_concurrently(tmpdir):
+    path = str(tmpdir.mkdir('a'))
+    module = types.ModuleType('module')
+    module.__file__ = os.path.join(path, 'module.py')
+    profile_path = str(tmpdir.join('import_profile.json'))
+
+    threads = [threading.Thread(
+        target=importpath.record_import_profile, args=([path], profile_path), kwargs={'modules': {'module': module}})
+        for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert importpath.load_import_profile(profile_path) == {path: 8}
+
+
+def test_start_import_profile(tmpdir, monkeypatch):
+    path = str(tmpdir.mkdir('a'))
+    profile_path = str(tmpdir.join('import_profile.json'))
+    registered = list()
+    monkeypatch.setattr(importpath.atexit, 'register', lambda *args: registered.append(args))
+
+    environ = dict()
+    importpath.set_import_profile_environment([path], profile_path, environ=environ)
+    for env_name, env_value in environ.items():
+        monkeypatch.setenv(env_name, env_value)
+
+    assert importpath.start_import_profile()
+    assert registered == [(importpath.record_import_profile, [path], profile_path)]
+
+
+def test_build_module_map(tmpdir):
+    path_a = tmpdir.mkdir('a')
+    path_b = tmpdir.mkdir('b')
+    path_a.join('module_a.py').write('')
+    path_a.mkdir('package').join('__init__.py').write('')
+    path_a.mkdir('namespace')
+    path_b.join('module_a.py').write('')
+    path_b.join('module_b.cpython-37m-x86_64-linux-gnu.so').write('')
+    path_b.join('data.txt').write('')
+
+    module_map = importpath.build_module_map([str(path_a), str(path_b)])
+
+    assert module_map == {'module_a': str(path_a), 'package': str(path_a), 'module_b': str(path_b)}
+
+
+def test_install_module_map(tmpdir):
+    if sys.version_info[0] < 3:
+        return
+
+    path = tmpdir.mkdir('mapped')
+    path.join('artella_mapped_module.py').write('value = 10\n')
+
+    path.join('json.py').write('value = 10\n')
+
+    finder = importpath.install_module_map([str(path)])
+    try:
+        import artella_mapped_module
+        assert artella_mapped_module.value == 10
+        assert str(path) not in sys.path
+        # Standard library modules are never resolved from mapped paths
+        assert finder.find_spec('json') is None
+        assert sys.meta_path.index(finder) > sys.meta_path.index(importlib.machinery.BuiltinImporter)
+    finally:
+        sys.meta_path.remove(finder)
+        sys.modules.pop('artella_mapped_module', None)
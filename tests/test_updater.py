@@ -0,0 +1,379 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-launcher updater
+"""
+
+import os
+import json
+import stat
+import time
+import venv
+import functools
+import threading
+import subprocess
+
+import psutil
+import pytest
+import requests
+
+try:
+    from http.server import HTTPServer, SimpleHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import HTTPServer
+    from SimpleHTTPServer import SimpleHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+
+MIRROR_REPOSITORY = 'artella/test'
+MIRROR_ARCHIVE = bytes(bytearray(range(256))) * 40
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    return 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+
+@pytest.fixture
+def upstream_server(tmp_path):
+    """
+    Serves a releases page and an archive of the mirrored repository. Responses are delayed, so concurrent requests
+    overlap
+    """
+
+    archive_folder = tmp_path / 'upstream' / MIRROR_REPOSITORY / 'archive'
+    archive_folder.mkdir(parents=True)
+    (archive_folder / '1.0.0.tar.gz').write_bytes(MIRROR_ARCHIVE)
+    (tmp_path / 'upstream' / MIRROR_REPOSITORY / 'releases').write_bytes(b'<html>releases</html>')
+
+    class _Handler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(0.2)
+            SimpleHTTPRequestHandler.do_GET(self)
+
+        def log_message(self, *args):
+            pass
+
+    server = _ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(_Handler, directory=str(tmp_path / 'upstream')))
+    yield server, _serve(server)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def snapshot_updater(offline_updater, tmp_path, monkeypatch):
+    monkeypatch.setattr(offline_updater, '_install_path', str(tmp_path / 'install'))
+    monkeypatch.setattr(offline_updater, '_snapshots_path', str(tmp_path / 'snapshots'))
+    monkeypatch.setattr(offline_updater, '_venv_snapshot', None)
+    monkeypatch.setattr(offline_updater, '_requirements_hash', None)
+
+    venv_path = offline_updater._get_venv_folder_path()
+    venv.create(venv_path, with_pip=False, symlinks=os.name != 'nt')
+    tool_path = os.path.join(venv_path, 'tool.sh')
+    with open(tool_path, 'w') as tool_file:
+        tool_file.write('#!/bin/sh\n')
+    os.chmod(tool_path, 0o755)
+    if os.name != 'nt':
+        os.symlink('tool.sh', os.path.join(venv_path, 'tool'))
+
+    return offline_updater
+
+
+@pytest.fixture
+def prefetch_updater(snapshot_updater, tmp_path, monkeypatch):
+    """
+    Returns an updater that stages deployments in a temporary folder. Requirements are not downloaded: pip commands
+    are recorded and the download of requirements file is replaced by a local one
+    """
+
+    updater = snapshot_updater
+    commands = list()
+
+    def _download_deployment_requirements(dirname):
+        requirements_path = os.path.join(dirname, updater._requirements_file_name)
+        with open(requirements_path, 'w') as requirements_file:
+            requirements_file.write('artellapipe-test==1.0.0\n')
+        updater._requirements_path = requirements_path
+        return True
+
+    def _start_process(command=None, commands_list=None, **kwargs):
+        commands.append(commands_list or command)
+        os.makedirs(commands_list[commands_list.index('-d') + 1])
+        return object()
+
+    monkeypatch.setattr(updater, '_requirements_path', None)
+    monkeypatch.setattr(updater, '_prefetch_path', None)
+    monkeypatch.setattr(updater, '_get_prefetch_folder', lambda: str(tmp_path / 'prefetch'))
+    monkeypatch.setattr(updater, '_get_installation_path', lambda: updater._install_path)
+    monkeypatch.setattr(updater, '_download_deployment_requirements', _download_deployment_requirements)
+    monkeypatch.setattr(updater, '_start_process', _start_process)
+    monkeypatch.setattr(updater, '_wait_process', lambda process: 0)
+    updater.commands = commands
+
+    return updater
+
+
+def _get_manifest_path(updater):
+    return os.path.join(updater._snapshots_path, updater._get_venv_snapshot_name() + '.json')
+
+
+def test_venv_snapshot_round_trip(snapshot_updater, tmp_path):
+    updater = snapshot_updater
+    assert updater._export_venv_snapshot()
+    with open(_get_manifest_path(updater), 'r') as manifest_file:
+        manifest = json.load(manifest_file)
+    assert manifest['python_executable'] == updater._get_python_info()['executable']
+    assert manifest['python_full_version'] == updater._get_python_info()['version']
+
+    venv_path = str(tmp_path / 'other_install' / 'venv')
+    assert updater._import_venv_snapshot(venv_path)
+    assert updater._venv_snapshot['name'] == manifest['name']
+
+    venv_python = updater._get_venv_info(venv_path)['venv_python']
+    prefix = subprocess.check_output([venv_python, '-c', 'import sys; print(sys.prefix)']).decode().strip()
+    assert os.path.realpath(prefix) == os.path.realpath(venv_path)
+    assert stat.S_IMODE(os.stat(os.path.join(venv_path, 'tool.sh')).st_mode) & stat.S_IXUSR
+    if os.name != 'nt':
+        assert os.readlink(os.path.join(venv_path, 'tool')) == 'tool.sh'
+
+
+def test_venv_snapshot_requirements_hash(prefetch_updater, tmp_path, monkeypatch):
+    updater = prefetch_updater
+    monkeypatch.setattr(updater, '_venv_info', updater._get_venv_info(updater._get_venv_folder_path()))
+    monkeypatch.setattr(updater, '_get_venv_template_path', lambda: str(tmp_path / 'template'))
+    monkeypatch.setattr(updater, '_install_deployment_requirements', lambda: True)
+    monkeypatch.setattr(updater, '_start_bytecode_warmup', lambda: None)
+
+    assert updater._setup_deployment()
+    assert not os.path.isfile(updater._requirements_path)
+    assert updater._export_venv_snapshot()
+    with open(_get_manifest_path(updater), 'r') as manifest_file:
+        manifest = json.load(manifest_file)
+    assert manifest['requirements_hash'] is not None
+    assert manifest['requirements_hash'] == updater._requirements_hash
+
+
+def test_venv_snapshot_hash_mismatch(snapshot_updater, tmp_path):
+    updater = snapshot_updater
+    assert updater._export_venv_snapshot()
+    archive_path = os.path.join(updater._snapshots_path, updater._get_venv_snapshot_name() + '.tar.gz')
+    with open(archive_path, 'ab') as archive_file:
+        archive_file.write(b'corrupted')
+
+    venv_path = str(tmp_path / 'other_install' / 'venv')
+    assert not updater._import_venv_snapshot(venv_path)
+    assert not os.path.exists(venv_path)
+
+
+def test_venv_snapshot_python_mismatch(snapshot_updater, tmp_path):
+    updater = snapshot_updater
+    assert updater._export_venv_snapshot()
+    manifest_path = _get_manifest_path(updater)
+    with open(manifest_path, 'r') as manifest_file:
+        manifest = json.load(manifest_file)
+    manifest['python_executable'] = os.path.join(str(tmp_path), 'other', 'python')
+    with open(manifest_path, 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+
+    assert updater._get_venv_snapshot_manifest() is None
+    assert not updater._import_venv_snapshot(str(tmp_path / 'other_install' / 'venv'))
+
+
+def test_setup_environment_clean_clones_template(snapshot_updater, tmp_path, monkeypatch):
+    updater = snapshot_updater
+    monkeypatch.setattr(updater, '_get_venv_template_path', lambda: str(tmp_path / 'template'))
+    monkeypatch.setattr(updater, '_close_processes', lambda: None)
+    monkeypatch.setattr(updater, '_force_venv', False)
+    assert updater._update_venv_template()
+
+    commands = list()
+    updater._get_python_info()
+    monkeypatch.setattr(updater, '_start_process', lambda command=None, commands_list=None, **kwargs: commands.append(
+        commands_list or command))
+
+    assert updater._setup_environment(clean=True)
+    assert not commands
+    venv_path = updater._get_venv_folder_path()
+    venv_python = updater._get_venv_info(venv_path)['venv_python']
+    prefix = subprocess.check_output([venv_python, '-c', 'import sys; print(sys.prefix)']).decode().strip()
+    assert os.path.realpath(prefix) == os.path.realpath(venv_path)
+    assert os.path.isfile(os.path.join(venv_path, 'tool.sh'))
+
+
+def test_mirror_cache_hit(updater_module, upstream_server, tmp_path):
+    server, upstream_url = upstream_server
+    mirror = updater_module.ArtellaMirror(str(tmp_path / 'mirror'), [MIRROR_REPOSITORY], upstream_url=upstream_url)
+
+    for _ in range(3):
+        file_path, content_type = mirror.get_file('/{}/archive/1.0.0.tar.gz'.format(MIRROR_REPOSITORY))
+        with open(file_path, 'rb') as archive_file:
+            assert archive_file.read() == MIRROR_ARCHIVE
+    assert content_type == 'application/x-gzip'
+    assert mirror.upstream_requests == 1
+
+
+def test_mirror_single_flight(updater_module, upstream_server, tmp_path):
+    server, upstream_url = upstream_server
+    mirror = updater_module.ArtellaMirror(str(tmp_path / 'mirror'), [MIRROR_REPOSITORY], upstream_url=upstream_url)
+
+    results = list()
+    threads = [threading.Thread(target=lambda: results.append(
+        mirror.get_file('/{}/archive/1.0.0.tar.gz'.format(MIRROR_REPOSITORY))[0])) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 5 and len(set(results)) == 1
+    assert mirror.upstream_requests == 1
+
+
+def test_mirror_stale_fallback(updater_module, upstream_server, tmp_path):
+    server, upstream_url = upstream_server
+    mirror = updater_module.ArtellaMirror(
+        str(tmp_path / 'mirror'), [MIRROR_REPOSITORY], upstream_url=upstream_url, releases_ttl=0)
+    releases_path = '/{}/releases'.format(MIRROR_REPOSITORY)
+    cached_path = mirror.get_file(releases_path)[0]
+
+    server.shutdown()
+    server.server_close()
+
+    assert mirror.get_file(releases_path)[0] == cached_path
+    assert mirror.upstream_requests == 2
+    with pytest.raises(requests.RequestException):
+        mirror.get_file('/{}/archive/2.0.0.tar.gz'.format(MIRROR_REPOSITORY))
+
+
+def test_mirror_only_serves_allowed_repositories(updater_module, upstream_server, tmp_path):
+    server, upstream_url = upstream_server
+    mirror = updater_module.ArtellaMirror(str(tmp_path / 'mirror'), [MIRROR_REPOSITORY], upstream_url=upstream_url)
+
+    assert mirror.get_file('/other/repository/archive/1.0.0.tar.gz') == (None, None)
+    assert mirror.get_file('/{}/archive/1.0.0.tar.gz'.format(MIRROR_REPOSITORY.upper()))[0]
+    assert mirror.upstream_requests == 1
+
+
+def test_mirror_server_ranges(updater_module, upstream_server, tmp_path):
+    server, upstream_url = upstream_server
+    mirror = updater_module.ArtellaMirror(str(tmp_path / 'mirror'), [MIRROR_REPOSITORY], upstream_url=upstream_url)
+    mirror_server = updater_module.ArtellaMirrorServer(('127.0.0.1', 0), mirror)
+    archive_url = '{}/{}/archive/1.0.0.tar.gz'.format(_serve(mirror_server), MIRROR_REPOSITORY)
+    try:
+        response = requests.get(archive_url)
+        assert response.status_code == 200 and response.content == MIRROR_ARCHIVE
+
+        response = requests.get(archive_url, headers={'Range': 'bytes=10-19'})
+        assert response.status_code == 206 and response.content == MIRROR_ARCHIVE[10:20]
+        assert response.headers['Content-Range'] == 'bytes 10-19/{}'.format(len(MIRROR_ARCHIVE))
+
+        response = requests.get(archive_url, headers={'Range': 'bytes=-5'})
+        assert response.status_code == 206 and response.content == MIRROR_ARCHIVE[-5:]
+
+        response = requests.get(archive_url, headers={'Range': 'bytes={}-'.format(len(MIRROR_ARCHIVE))})
+        assert response.status_code == 416
+        assert response.headers['Content-Range'] == 'bytes */{}'.format(len(MIRROR_ARCHIVE))
+
+        assert requests.get(archive_url.replace(MIRROR_REPOSITORY, 'other/repository')).status_code == 404
+    finally:
+        mirror_server.shutdown()
+        mirror_server.server_close()
+
+
+def test_prefetch_release(prefetch_updater, updater_module):
+    updater = prefetch_updater
+    assert updater._prefetch_release()
+    pip_command = updater.commands[-1]
+    assert pip_command[1:4] == ['-m', 'pip', 'download']
+
+    prefetch_path = updater._get_prefetched_release_path('1.0.0')
+    assert prefetch_path == os.path.join(updater._get_prefetch_folder(), '1.0.0')
+    assert os.listdir(updater._get_prefetch_folder()) == ['1.0.0']
+    assert os.path.isdir(os.path.join(prefetch_path, updater_module.PREFETCH_WHEELS_FOLDER_NAME))
+
+    assert updater._prefetch_release()
+    assert len(updater.commands) == 1
+
+    with open(os.path.join(prefetch_path, updater._requirements_file_name), 'a') as requirements_file:
+        requirements_file.write('artellapipe-other==1.0.0\n')
+    assert updater._get_prefetched_release_path('1.0.0') is None
+
+
+@pytest.mark.parametrize('offline_errors', [[], ['ERROR: No matching distribution found for artellapipe-test']])
+def test_install_prefetched_requirements(prefetch_updater, monkeypatch, offline_errors):
+    updater = prefetch_updater
+    assert updater._prefetch_release()
+    prefetch_path = updater._get_prefetched_release_path('1.0.0')
+
+    pip_commands = list()
+
+    def _run_pip(pip_cmd, attempt=1):
+        pip_commands.append(pip_cmd)
+        return offline_errors if '--no-index' in pip_cmd else []
+
+    pip_exe = updater.commands[-1][0]
+    monkeypatch.setattr(updater, '_venv_info', {'pip_exe': pip_exe, 'venv_python': pip_exe})
+    monkeypatch.setattr(updater, '_run_pip', _run_pip)
+    monkeypatch.setattr(updater, '_prefetch_path', prefetch_path)
+    monkeypatch.setattr(updater, '_requirements_path', os.path.join(prefetch_path, updater._requirements_file_name))
+
+    assert updater._install_deployment_requirements()
+    assert '--no-index --find-links "{}"'.format(os.path.join(prefetch_path, 'wheels')) in pip_commands[0]
+    if offline_errors:
+        assert len(pip_commands) == 3
+        assert not any('--no-index' in pip_cmd for pip_cmd in pip_commands[1:])
+    else:
+        assert len(pip_commands) == 1
+
+
+def test_clean_prefetched_releases(prefetch_updater, updater_module):
+    updater = prefetch_updater
+    prefetch_folder = updater._get_prefetch_folder()
+
+    dead_process = subprocess.Popen(['python', '-c', 'pass'])
+    dead_process.wait()
+    live_pid = psutil.Process().ppid()
+    old_time = time.time() - updater_module.PREFETCH_TEMP_MAX_AGE - 60
+    folders = {
+        '0.9.0': False,
+        '1.0.0': True,
+        '2.0.0': True,
+        '2.0.0.{}.tmp'.format(live_pid): True,
+        '2.1.0.{}.tmp'.format(live_pid): True,
+        '2.0.0.{}.tmp'.format(dead_process.pid): True,
+        '2.1.0.{}.tmp'.format(dead_process.pid): False
+    }
+    for folder_name in folders:
+        os.makedirs(os.path.join(prefetch_folder, folder_name))
+    for folder_name in ('2.1.0.{}.tmp'.format(live_pid), '2.1.0.{}.tmp'.format(dead_process.pid)):
+        os.utime(os.path.join(prefetch_folder, folder_name), (old_time, old_time))
+
+    updater._clean_prefetched_releases()
+
+    for folder_name, kept in folders.items():
+        assert os.path.isdir(os.path.join(prefetch_folder, folder_name)) == kept, folder_name
+
+
+def test_config_store_errors(offline_updater, updater_module, tmp_path, monkeypatch):
+    config_path = str(tmp_path / 'config.json')
+    config_store = updater_module.ArtellaConfigStore(config_path)
+    with pytest.raises(KeyError):
+        with config_store.batch():
+            config_store.set('tag', '1.0.0')
+            with open(config_path, 'w') as config_file:
+                config_file.write('{invalid')
+            raise KeyError('tag')
+
+    updater = offline_updater
+    monkeypatch.setattr(updater, '_config_store', updater_module.ArtellaConfigStore(config_path))
+    assert updater._get_config_data(show_error=False) is None
+    assert not updater._is_telemetry_enabled()
+    with pytest.raises(RuntimeError, match='Impossible to read configuration file'):
+        updater._get_installation_path()